@@ -0,0 +1,80 @@
+"""
+Micro-benchmark of the cached users codecs.
+
+Compares encode/decode cost of every codec and, if a Redis URL is given,
+memory used by one cached entry.
+
+Usage:
+    python benchmarks/cache_codecs.py [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import timeit
+from typing import Optional
+
+import redis.asyncio as redis
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.cache_layouts.impls.string import (
+    StringCacheLayoutImpl,
+)
+from users_management.gateways.codecs import CacheCodecProtocol
+from users_management.gateways.codecs.impls.json import JSONUsersCodecImpl
+from users_management.gateways.codecs.impls.struct import (
+    StructUsersCodecImpl,
+)
+from users_management.gateways.repositories.impls.users_cache import (
+    UsersCacheRepositoryImpl,
+)
+
+
+USER = SInfoUser(user_id=1234567, nickname="john_doe_the_second", avatar=True)
+NUMBER = 100_000
+KEYS = 1_000
+
+
+async def memory_per_key(
+    url: str,
+    codec: CacheCodecProtocol[SInfoUser],
+) -> float:
+    client = redis.Redis.from_url(url)
+    repository = UsersCacheRepositoryImpl(
+        client,
+        RedisConfig(),
+        codec,
+        StringCacheLayoutImpl(),
+        CacheTTLPolicy(lifetime=300, soft_lifetime=300),
+    )
+    keys = [f"bench:{codec.tag.decode()}:{i}" for i in range(KEYS)]
+    try:
+        await repository.add_list(dict.fromkeys(keys, USER))
+        usage = [await client.memory_usage(key) for key in keys]
+        return sum(usage) / len(usage)
+    finally:
+        await client.delete(*keys)
+        await client.aclose()
+
+
+def main(redis_url: Optional[str]) -> None:
+    for codec in (JSONUsersCodecImpl(), StructUsersCodecImpl()):
+        payload = codec.encode(USER)
+        encode = timeit.timeit(lambda: codec.encode(USER), number=NUMBER)
+        decode = timeit.timeit(lambda: codec.decode(payload), number=NUMBER)
+        line = (
+            f"{type(codec).__name__:<22} size={len(payload):>3} B "
+            f"encode={encode / NUMBER * 1e9:>6.0f} ns "
+            f"decode={decode / NUMBER * 1e9:>6.0f} ns"
+        )
+        if redis_url:
+            memory = asyncio.run(memory_per_key(redis_url, codec))
+            line += f" redis={memory:.0f} B/key"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", default=None)
+    main(parser.parse_args().redis_url)
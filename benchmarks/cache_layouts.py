@@ -0,0 +1,124 @@
+"""
+Memory footprint of the cached users for every storage layout.
+
+Fills an empty Redis database with users in each layout and codec,
+reports bytes per user and the encoding Redis has chosen.
+
+Usage:
+    python benchmarks/cache_layouts.py --redis-url redis://localhost:6379/15
+        [--users 100000] [--bucket-size 100]
+"""
+
+import argparse
+import asyncio
+from functools import partial
+from typing import Callable, Dict, List
+
+import redis.asyncio as redis
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.cache_layouts import CacheLayoutProtocol
+from users_management.gateways.cache_layouts.impls.hash import (
+    HashCacheLayoutImpl,
+)
+from users_management.gateways.cache_layouts.impls.string import (
+    StringCacheLayoutImpl,
+)
+from users_management.gateways.codecs import CacheCodecProtocol
+from users_management.gateways.codecs.impls.json import JSONUsersCodecImpl
+from users_management.gateways.codecs.impls.struct import (
+    StructUsersCodecImpl,
+)
+from users_management.gateways.key_builders import (
+    get_bucketed_key_by_user_id,
+    get_key_by_user_id,
+    split_bucketed_key,
+)
+from users_management.gateways.repositories.impls.users_cache import (
+    UsersCacheRepositoryImpl,
+)
+
+
+BATCH = 1_000
+NAMESPACE = "benchmark"
+
+
+async def bytes_per_user(
+    client: redis.Redis,
+    layout: CacheLayoutProtocol,
+    key_builder: Callable[[int], str],
+    codec: CacheCodecProtocol[SInfoUser],
+    users: int,
+) -> Dict[str, object]:
+    repository = UsersCacheRepositoryImpl(
+        client,
+        RedisConfig(),
+        codec,
+        layout,
+        CacheTTLPolicy(lifetime=300, soft_lifetime=300),
+    )
+    keys: List[str] = []
+    for start in range(1, users + 1, BATCH):
+        batch = {
+            key_builder(user_id): SInfoUser(
+                user_id=user_id, nickname=f"user_{user_id}", avatar=False
+            )
+            for user_id in range(start, min(start + BATCH, users + 1))
+        }
+        await repository.add_list(batch)
+        keys.extend(batch)
+    redis_keys = list(dict.fromkeys(split_bucketed_key(key)[0] for key in keys))
+    try:
+        usage = 0
+        for start in range(0, len(redis_keys), BATCH):
+            pipeline = client.pipeline(transaction=False)
+            for key in redis_keys[start : start + BATCH]:
+                pipeline.memory_usage(key, samples=0)
+            usage += sum(await pipeline.execute())
+        encoding = await client.object("encoding", redis_keys[0])
+        return {"bytes": usage / users, "encoding": encoding.decode()}
+    finally:
+        for start in range(0, len(redis_keys), BATCH):
+            await client.delete(*redis_keys[start : start + BATCH])
+
+
+async def main(redis_url: str, users: int, bucket_size: int) -> None:
+    client = redis.Redis.from_url(redis_url)
+    layouts = {
+        "string": (
+            StringCacheLayoutImpl(),
+            partial(get_key_by_user_id, namespace=NAMESPACE),
+        ),
+        f"hash/{bucket_size}": (
+            HashCacheLayoutImpl(lifetime=300),
+            partial(
+                get_bucketed_key_by_user_id,
+                namespace=NAMESPACE,
+                bucket_size=bucket_size,
+            ),
+        ),
+    }
+    try:
+        for name, (layout, key_builder) in layouts.items():
+            for codec in (JSONUsersCodecImpl(), StructUsersCodecImpl()):
+                result = await bytes_per_user(
+                    client, layout, key_builder, codec, users
+                )
+                print(
+                    f"{name:<10} {type(codec).__name__:<22} "
+                    f"{result['bytes']:>6.1f} B/user "
+                    f"encoding={result['encoding']}"
+                )
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", required=True)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--bucket-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.users, args.bucket_size))
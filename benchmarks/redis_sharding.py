@@ -0,0 +1,104 @@
+"""
+Keys distribution and list reads of the users cache sharded between nodes.
+
+Fills the nodes with users through the sharded client, reports the share
+of the keys every node owns and the throughput of list reads, which are
+split between the nodes and merged back in order. Every node must be an
+empty Redis database, e.g. several local redis-server processes:
+
+    redis-server --port 6380 & redis-server --port 6381 & ...
+
+Usage:
+    python benchmarks/redis_sharding.py \
+        --redis-url redis://localhost:6380/15 \
+        --redis-url redis://localhost:6381/15 \
+        [--users 100000] [--list-size 100] [--reads 1000]
+"""
+
+import argparse
+import asyncio
+from functools import partial
+import random
+import time
+from typing import List
+
+import redis.asyncio as redis
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.hash_ring import HashRing
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.cache_layouts.impls.string import (
+    StringCacheLayoutImpl,
+)
+from users_management.gateways.codecs.impls.struct import (
+    StructUsersCodecImpl,
+)
+from users_management.gateways.connections.impls.redis_sharded import (
+    ShardedRedis,
+)
+from users_management.gateways.key_builders import get_key_by_user_id
+from users_management.gateways.repositories.impls.users_cache import (
+    UsersCacheRepositoryImpl,
+)
+
+
+BATCH = 1_000
+NAMESPACE = "benchmark"
+
+
+async def main(
+    redis_urls: List[str],
+    users: int,
+    list_size: int,
+    reads: int,
+) -> None:
+    shards = [redis.Redis.from_url(url) for url in redis_urls]
+    client = ShardedRedis(shards=shards, ring=HashRing(redis_urls))
+    cache = UsersCacheRepositoryImpl(
+        redis=client,
+        config=RedisConfig(),
+        codec=StructUsersCodecImpl(),
+        layout=StringCacheLayoutImpl(),
+        ttl_policy=CacheTTLPolicy(lifetime=300, soft_lifetime=300),
+    )
+    key_builder = partial(get_key_by_user_id, namespace=NAMESPACE)
+    keys = [key_builder(user_id) for user_id in range(users)]
+    try:
+        for start in range(0, users, BATCH):
+            await cache.add_list(
+                {
+                    key_builder(user_id): SInfoUser(
+                        user_id=user_id,
+                        nickname=f"user_{user_id}",
+                        avatar=user_id % 2 == 0,
+                    )
+                    for user_id in range(start, min(start + BATCH, users))
+                }
+            )
+        for url, shard in zip(redis_urls, shards):
+            share = await shard.dbsize() / users
+            print(f"{url:<32} {share:>6.1%} of the keys")
+        started_at = time.perf_counter()
+        for _ in range(reads):
+            found = await cache.get_list(random.sample(keys, list_size))
+            assert all(found)
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"get_list of {list_size}: {reads / elapsed:>8.0f} reads/s "
+            f"{elapsed / reads * 1e3:>6.2f} ms/read"
+        )
+    finally:
+        for start in range(0, users, BATCH):
+            await client.delete(*keys[start : start + BATCH])
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", action="append", required=True)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--list-size", type=int, default=100)
+    parser.add_argument("--reads", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.users, args.list_size, args.reads))
@@ -0,0 +1,85 @@
+"""
+Invalidation delay of the local cache tracked by Redis (RESP3 client
+tracking in broadcast mode).
+
+Keeps users in a local store fed by the tracking listener, overwrites
+them through a separate client, as another worker would, and measures
+the time until the local copies are dropped. Needs a Redis 6+ server,
+e.g. a local one:
+
+    redis-server --port 6380
+
+Usage:
+    python benchmarks/redis_tracking.py \
+        --redis-url redis://localhost:6380/15 [--writes 1000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import redis.asyncio as redis
+
+from users_management.core.settings import RedisConfig
+from users_management.gateways.connections.impls.redis import (
+    RedisConnectionManagerImpl,
+)
+from users_management.gateways.connections.impls.redis_tracking import (
+    RedisTrackingListenerImpl,
+)
+from users_management.gateways.key_builders import get_key_by_user_id
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+NAMESPACE = "benchmark"
+TIMEOUT = 1.0  # seconds
+
+
+async def main(redis_url: str, writes: int) -> None:
+    manager = RedisConnectionManagerImpl(RedisConfig(SHARD_URLS=[redis_url]))
+    manager.startup()
+    store: LocalCacheStore[bytes] = LocalCacheStore(
+        max_size=writes, lifetime=3600
+    )
+    listener = RedisTrackingListenerImpl(
+        redis_manager=manager, store=store, prefixes=["user:"]
+    )
+    writer = redis.Redis.from_url(redis_url)
+    keys = [get_key_by_user_id(user_id, NAMESPACE) for user_id in range(writes)]
+    delays: List[float] = []
+    listener.startup()
+    try:
+        # the listener clears the store once the tracking is on
+        await asyncio.sleep(0.5)
+        for key in keys:
+            store.set(key, b"cached")
+            written_at = time.perf_counter()
+            await writer.set(key, b"changed")
+            while store.get(key) is not None:
+                if time.perf_counter() - written_at > TIMEOUT:
+                    raise TimeoutError(f"{key} was not invalidated.")
+                await asyncio.sleep(0)
+            delays.append(time.perf_counter() - written_at)
+        delays.sort()
+        print(
+            f"invalidation delay over {writes} writes: "
+            f"p50 {statistics.median(delays) * 1e3:.3f} ms, "
+            f"p99 {delays[int(len(delays) * 0.99)] * 1e3:.3f} ms"
+        )
+    finally:
+        await listener.shutdown()
+        await writer.delete(*keys)
+        await writer.aclose()
+        await manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", required=True)
+    parser.add_argument("--writes", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.redis_url, args.writes))
@@ -1,9 +1,12 @@
 from ..health_check.liveness import (
     router as liveness_router,
 )
+from ..health_check.metrics import (
+    router as metrics_router,
+)
 from ..health_check.readiness import (
     router as readiness_router,
 )
 
 
-__all__ = ["liveness_router", "readiness_router"]
+__all__ = ["liveness_router", "metrics_router", "readiness_router"]
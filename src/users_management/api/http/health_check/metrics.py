@@ -0,0 +1,47 @@
+from fastapi import APIRouter, status
+
+from users_management.app.schemas.responses import MetricsResponse
+from users_management.core.metrics import metrics
+from users_management.core.settings import settings
+
+
+router = APIRouter()
+
+
+@router.get(
+    settings.api.metrics,
+    response_model=MetricsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_metrics() -> MetricsResponse:
+    """Get metrics of the worker process.
+
+    Returns counters and gauges collected by the worker that served the
+    request, values are not aggregated between workers.
+
+    Returns
+    -------
+    MetricsResponse
+        Snapshot of the process metrics
+        * metrics: mapping of the metric name to its value
+
+    Example
+    -------
+    Request:
+    ```http
+        GET /api/users-management/healthcheck/metrics
+    ```
+
+    Response:
+    ```json
+        {
+            "metrics": {
+                "users_local_cache_hits": 120,
+                "users_local_cache_misses": 30,
+                "users_local_cache_hit_ratio": 0.8,
+                "users_local_cache_size": 25
+            }
+        }
+    ```
+    """
+    return MetricsResponse(metrics=metrics.snapshot())
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, status
 from sqlalchemy.future import select
 
+from users_management.app.depends.config_factory import RedisConfigService
 from users_management.app.depends.connections import (
     AsyncSessionFactory,
-    RedisPool,
+    RedisBreaker,
+    RedisConnections,
 )
 from users_management.app.exceptions import (
     RedisHealthException,
@@ -12,9 +14,10 @@ from users_management.app.exceptions import (
 from users_management.app.schemas.responses import (
     INTERNAL_SERVER_ERROR,
     SERVICE_UNAVAILABLE,
-    SuccessResponse,
+    ReadinessResponse,
 )
 from users_management.core.settings import settings
+from users_management.core.utils.circuit_breaker import CircuitState
 
 
 router = APIRouter()
@@ -22,7 +25,7 @@ router = APIRouter()
 
 @router.get(
     settings.api.readiness,
-    response_model=SuccessResponse,
+    response_model=ReadinessResponse,
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_503_SERVICE_UNAVAILABLE: SERVICE_UNAVAILABLE,
@@ -30,23 +33,27 @@ router = APIRouter()
     },
 )
 async def get_readiness(
-    Redis: RedisPool,
+    Redis: RedisConnections,
     SQLDatabase: AsyncSessionFactory,
-) -> SuccessResponse:
+    config: RedisConfigService,
+    breaker: RedisBreaker,
+) -> ReadinessResponse:
     """Check if service and dependencies are ready.
 
     Performs deep health check of all critical dependencies.
 
     Returns
     -------
-    SuccessResponse
+    ReadinessResponse
         Success response with message
-        * message: "success"
+        * message: "success", or "degraded" if the circuit breaker
+          is enabled and the requests are served without the cache
+        * redis_circuit: state of the cache circuit breaker
 
     Raises
     ------
     RedisHealthException
-        If Redis connection fails
+        If Redis connection fails and the circuit breaker is disabled
     SQLRepositoryException
         If SQL database connection fails
 
@@ -60,21 +67,24 @@ async def get_readiness(
     Response:
     ```json
         {
-            "message": "success"
+            "message": "success",
+            "redis_circuit": "CLOSED"
         }
     ```
     Notes
     -----
     Checks:
-    * Redis cache database connection
+    * Redis cache database connection, of every primary node
     * SQL database connection
     """
+    degraded = False
     try:
-        pong = await Redis.ping()
-        if pong is not True:
+        if not await Redis.ping_all():
             raise RedisHealthException("Redis ping failed.")
     except Exception:
-        raise RedisHealthException("Redis connection error.")
+        if not config.BREAKER_ENABLED:
+            raise RedisHealthException("Redis connection error.")
+        degraded = True
 
     try:
         async with SQLDatabase() as session:
@@ -82,4 +92,10 @@ async def get_readiness(
     except Exception:
         raise SQLRepositoryException("SQL connectivity error.")
 
-    return SuccessResponse()
+    state = breaker.state
+    if state is not CircuitState.CLOSED:
+        degraded = True
+    return ReadinessResponse(
+        message="degraded" if degraded else "success",
+        redis_circuit=state.name,
+    )
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from users_management.api.http.health_check import (
     liveness_router,
+    metrics_router,
     readiness_router,
 )
 from users_management.core.settings import settings
@@ -15,6 +16,7 @@ healthcheck_router = APIRouter(
 healthcheck_router_sub_routers = (
     liveness_router,
     readiness_router,
+    metrics_router,
 )
 
 for router in healthcheck_router_sub_routers:
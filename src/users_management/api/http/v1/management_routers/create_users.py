@@ -0,0 +1,97 @@
+from fastapi import APIRouter, Header, status
+
+from users_management.app.depends import APIAccessProvider, UsersUseCase
+from users_management.app.schemas.requests import CreateUsersRequest
+from users_management.app.schemas.responses import (
+    API_KEY_ERROR,
+    INTERNAL_SERVER_ERROR,
+    CreateUsersResponse,
+)
+from users_management.core.settings import settings
+
+
+router = APIRouter()
+
+
+@router.post(
+    settings.api.users_bulk,
+    response_model=CreateUsersResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: API_KEY_ERROR,
+        status.HTTP_500_INTERNAL_SERVER_ERROR: INTERNAL_SERVER_ERROR,
+    },
+)
+async def create_users(
+    api_access_provider: APIAccessProvider,
+    users_use_case: UsersUseCase,
+    users_info: CreateUsersRequest,
+    api_key: str = Header(..., alias="X-API-Key"),
+) -> CreateUsersResponse:
+    """Create a batch of new users in the system.
+
+    The users are inserted in one statement, conflicts are reported per user
+    instead of failing the whole batch. The API key is required
+    for authentication.
+
+    Parameters
+    ----------
+    users_info : CreateUsersRequest
+        The users to create, up to 10000:
+        * users: list of objects with user_id and nickname
+    api_key : str
+        API key for authentication (provide in X-API-Key header)
+
+    Returns
+    -------
+    CreateUsersResponse
+        The outcome of every user, in the order of the request:
+        * user_id: The user's unique identifier
+        * nickname: The user's nickname
+        * status: created, user_exists, nickname_exists, duplicate
+          (repeated in the request) or conflict (taken concurrently)
+
+    Raises
+    ------
+    HTTPException
+        * 403: If API key validation fails
+        * 422: If the batch is empty or too large
+        * 500: If database error occurs or other internal error
+
+    Example
+    -------
+    Request:
+    ```http
+        POST /api/users-management/v1/users/bulk
+        Headers:
+            X-API-Key: your-api-key
+        Body:
+            {
+                "users": [
+                    {"user_id": 123, "nickname": "john_doe"},
+                    {"user_id": 124, "nickname": "jane_doe"}
+                ]
+            }
+    ```
+
+    Response:
+    ```json
+    {
+        "results": [
+            {
+                "user_id": 123,
+                "nickname": "john_doe",
+                "status": "created"
+            },
+            {
+                "user_id": 124,
+                "nickname": "jane_doe",
+                "status": "nickname_exists"
+            }
+        ]
+    }
+    ```
+    """
+    api_access_provider.check_api_key(api_key)
+    results = await users_use_case.create_users(users_info.users)
+    return CreateUsersResponse(results=results)
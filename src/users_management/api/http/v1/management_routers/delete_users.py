@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Header, status
+
+from users_management.app.depends import APIAccessProvider, UsersUseCase
+from users_management.app.schemas.requests import DeleteUsersRequest
+from users_management.app.schemas.responses import (
+    API_KEY_ERROR,
+    INTERNAL_SERVER_ERROR,
+    DeleteUsersResponse,
+)
+from users_management.core.settings import settings
+
+
+router = APIRouter()
+
+
+@router.delete(
+    settings.api.users_bulk,
+    response_model=DeleteUsersResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: API_KEY_ERROR,
+        status.HTTP_500_INTERNAL_SERVER_ERROR: INTERNAL_SERVER_ERROR,
+    },
+)
+async def delete_users(
+    api_access_provider: APIAccessProvider,
+    users_use_case: UsersUseCase,
+    users_info: DeleteUsersRequest,
+    api_key: str = Header(..., alias="X-API-Key"),
+) -> DeleteUsersResponse:
+    """Delete a batch of users from the system.
+
+    The users are deleted in one statement and dropped from the cache.
+    The API key is required for authentication.
+
+    Parameters
+    ----------
+    users_info : DeleteUsersRequest
+        * users_id: IDs of the users to delete, up to 10000
+    api_key : str
+        API key for authentication (provide in X-API-Key header)
+
+    Returns
+    -------
+    DeleteUsersResponse
+        * users_id: IDs of the deleted users, the users not found
+          are left out
+
+    Raises
+    ------
+    HTTPException
+        * 403: If API key validation fails
+        * 422: If the batch is empty or too large
+        * 500: If database or cache error occurs
+
+    Example
+    -------
+    Request:
+    ```http
+        DELETE /api/users-management/v1/users/bulk
+        Headers:
+            X-API-Key: your-api-key
+        Body:
+            {
+                "users_id": [123, 124]
+            }
+    ```
+
+    Response:
+    ```json
+    {
+        "users_id": [123]
+    }
+    ```
+    """
+    api_access_provider.check_api_key(api_key)
+    users_id = await users_use_case.delete_users(users_info.users_id)
+    return DeleteUsersResponse(users_id=users_id)
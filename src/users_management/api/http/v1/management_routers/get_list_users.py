@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Header, Query, status
+from fastapi import APIRouter, Header, Query, Response, status
 
 from users_management.app.depends import APIAccessProvider, UsersUseCase
 from users_management.app.schemas.responses import (
@@ -30,7 +30,7 @@ async def get_list_user(
     users_use_case: UsersUseCase,
     users_id: List[int] = Query(...),
     api_key: str = Header(..., alias="X-API-Key"),
-) -> List[SInfoUser]:
+) -> Response:
     """Get information about multiple users.
 
     Parameters
@@ -81,6 +81,14 @@ async def get_list_user(
             }
         ]
     ```
+
+    Notes
+    -----
+    Cached users are sent as stored JSON, models are built only for users
+    read from the database.
     """
     api_access_provider.check_api_key(api_key)
-    return await users_use_case.get_list_users_by_id(users_id)
+    return Response(
+        content=await users_use_case.get_list_users_json_by_id(users_id),
+        media_type="application/json",
+    )
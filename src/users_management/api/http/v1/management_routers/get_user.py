@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Header, Path, status
+from fastapi import APIRouter, Header, Path, Response, status
 
 from users_management.app.depends import APIAccessProvider, UsersUseCase
 from users_management.app.schemas.responses import (
@@ -28,7 +28,7 @@ async def get_user(
     users_use_case: UsersUseCase,
     user_id: int = Path(...),
     api_key: str = Header(..., alias="X-API-Key"),
-) -> SInfoUser:
+) -> Response:
     """Get information about a specific user.
 
     Parameters
@@ -72,7 +72,15 @@ async def get_user(
         "avatar": false
     }
     ```
+
+    Notes
+    -----
+    Cached users are sent as stored JSON, models are built only for users
+    read from the database.
     """
 
     api_access_provider.check_api_key(api_key)
-    return await users_use_case.get_user_by_id(user_id)
+    return Response(
+        content=await users_use_case.get_user_json_by_id(user_id),
+        media_type="application/json",
+    )
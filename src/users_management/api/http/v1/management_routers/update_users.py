@@ -0,0 +1,88 @@
+from fastapi import APIRouter, Header, status
+
+from users_management.app.depends import APIAccessProvider, UsersUseCase
+from users_management.app.schemas.requests import UpdateUsersRequest
+from users_management.app.schemas.responses import (
+    API_KEY_ERROR,
+    INTERNAL_SERVER_ERROR,
+    UpdateUsersResponse,
+)
+from users_management.core.settings import settings
+
+
+router = APIRouter()
+
+
+@router.patch(
+    settings.api.users_bulk,
+    response_model=UpdateUsersResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: API_KEY_ERROR,
+        status.HTTP_500_INTERNAL_SERVER_ERROR: INTERNAL_SERVER_ERROR,
+    },
+)
+async def update_users(
+    api_access_provider: APIAccessProvider,
+    users_use_case: UsersUseCase,
+    users_info: UpdateUsersRequest,
+    api_key: str = Header(..., alias="X-API-Key"),
+) -> UpdateUsersResponse:
+    """Update a batch of users in the system.
+
+    The users are updated in one statement and dropped from the cache.
+    The API key is required for authentication.
+
+    Parameters
+    ----------
+    users_info : UpdateUsersRequest
+        The changes, up to 10000:
+        * users: list of objects with user_id and avatar, the last change
+          of a repeated user wins
+    api_key : str
+        API key for authentication (provide in X-API-Key header)
+
+    Returns
+    -------
+    UpdateUsersResponse
+        * users: The updated users, the users not found are left out
+
+    Raises
+    ------
+    HTTPException
+        * 403: If API key validation fails
+        * 422: If the batch is empty or too large
+        * 500: If database or cache error occurs
+
+    Example
+    -------
+    Request:
+    ```http
+        PATCH /api/users-management/v1/users/bulk
+        Headers:
+            X-API-Key: your-api-key
+        Body:
+            {
+                "users": [
+                    {"user_id": 123, "avatar": true},
+                    {"user_id": 124, "avatar": false}
+                ]
+            }
+    ```
+
+    Response:
+    ```json
+    {
+        "users": [
+            {
+                "user_id": 123,
+                "nickname": "john_doe",
+                "avatar": true
+            }
+        ]
+    }
+    ```
+    """
+    api_access_provider.check_api_key(api_key)
+    users = await users_use_case.update_users(users_info.users)
+    return UpdateUsersResponse(users=users)
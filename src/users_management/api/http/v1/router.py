@@ -2,11 +2,14 @@ from fastapi import APIRouter
 
 from users_management.api.http.v1 import (
     create_user_router,
+    create_users_router,
     delete_user_router,
+    delete_users_router,
     exist_nickname_router,
     get_list_users_router,
     get_user_router,
     update_user_router,
+    update_users_router,
 )
 from users_management.core.settings import settings
 
@@ -21,7 +24,11 @@ v1_sub_routers = (
     get_list_users_router,
     exist_nickname_router,
     create_user_router,
+    create_users_router,
+    # before the routes of a single user, "bulk" is not a user ID
+    update_users_router,
     update_user_router,
+    delete_users_router,
     delete_user_router,
 )
 
@@ -1,4 +1,11 @@
-from .connections import RedisManager, RedisPool, SQLDBHelper
+from .connections import (
+    CacheInvalidationListener,
+    HotUsersFlusher,
+    RedisManager,
+    RedisPool,
+    SQLDBHelper,
+    UsersCacheNamespace,
+)
 from .providers import APIAccessProvider
 from .repositories import RepositoryManager
 from .services import UsersService
@@ -7,10 +14,13 @@ from .use_cases import UsersUseCase
 
 __all__ = (
     "APIAccessProvider",
+    "CacheInvalidationListener",
+    "HotUsersFlusher",
     "RedisManager",
     "RedisPool",
     "RepositoryManager",
     "SQLDBHelper",
+    "UsersCacheNamespace",
     "UsersService",
     "UsersUseCase",
 )
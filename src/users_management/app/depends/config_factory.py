@@ -2,7 +2,13 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from users_management.core.settings import RedisConfig, Settings, get_settings
+from users_management.core.settings import (
+    CacheWarmUpConfig,
+    LocalCacheConfig,
+    RedisConfig,
+    Settings,
+    get_settings,
+)
 
 
 SettingsService = Annotated[Settings, Depends(get_settings)]
@@ -13,3 +19,19 @@ def get_redis_config(settings: SettingsService) -> RedisConfig:
 
 
 RedisConfigService = Annotated[RedisConfig, Depends(get_redis_config)]
+
+
+def get_local_cache_config(settings: SettingsService) -> LocalCacheConfig:
+    return settings.local_cache
+
+
+LocalCacheConfigService = Annotated[
+    LocalCacheConfig, Depends(get_local_cache_config)
+]
+
+
+def get_warm_up_config(settings: SettingsService) -> CacheWarmUpConfig:
+    return settings.warm_up
+
+
+WarmUpConfigService = Annotated[CacheWarmUpConfig, Depends(get_warm_up_config)]
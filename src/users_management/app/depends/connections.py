@@ -1,23 +1,56 @@
-from typing import Annotated, Callable, Final
+import logging
+from typing import Annotated, Callable, Final, Union
 
 from fastapi import Depends
 import redis.asyncio as redis
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from users_management.app.exceptions import RedisCacheDBException
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.metrics import metrics
 from users_management.core.settings import (
+    CacheWarmUpConfig,
+    LocalCacheConfig,
     RedisConfig,
     SQLDatabaseConfig,
     settings,
 )
+from users_management.core.utils.circuit_breaker import (
+    BreakerPolicy,
+    CircuitBreaker,
+)
+from users_management.core.utils.hot_keys import HotKeysCounter
 from users_management.gateways.connections import (
     GatewayConnectionProtocol,
 )
 from users_management.gateways.connections.impls.redis import (
     RedisConnectionManagerImpl,
 )
+from users_management.gateways.connections.impls.redis_cache_namespace import (
+    RedisCacheNamespaceImpl,
+)
+from users_management.gateways.connections.impls.redis_hot_users import (
+    RedisHotUsersFlusherImpl,
+)
+from users_management.gateways.connections.impls.redis_invalidation import (
+    RedisInvalidationListenerImpl,
+)
+from users_management.gateways.connections.impls.redis_tracking import (
+    RedisTrackingListenerImpl,
+)
 from users_management.gateways.connections.impls.sql import (
     SQLDatabaseManagerImpl,
 )
+from users_management.gateways.repositories.impls.nicknames_bloom import (
+    NicknamesBloomFilterRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+log = logging.getLogger(__name__)
 
 
 # ================== Global Instances (for lifespan) ==================
@@ -32,17 +65,135 @@ SQLDBHelper: Final[
 ] = get_sql_db_helper(config=settings.sql_db)
 
 
-def get_redis_manager(
-    config: RedisConfig,
-) -> GatewayConnectionProtocol[redis.Redis]:
+def get_redis_manager(config: RedisConfig) -> RedisConnectionManagerImpl:
     return RedisConnectionManagerImpl(config=config)
 
 
-RedisManager: Final[GatewayConnectionProtocol[redis.Redis]] = get_redis_manager(
+RedisManager: Final[RedisConnectionManagerImpl] = get_redis_manager(
+    config=settings.redis
+)
+
+
+def get_users_local_cache_store(
+    config: LocalCacheConfig,
+) -> LocalCacheStore[SInfoUser]:
+    store: LocalCacheStore[SInfoUser] = LocalCacheStore(
+        max_size=config.MAX_SIZE,
+        lifetime=config.LIFETIME,
+    )
+    metrics.register_gauge("users_local_cache_hits", lambda: store.hits)
+    metrics.register_gauge("users_local_cache_misses", lambda: store.misses)
+    metrics.register_gauge("users_local_cache_hit_ratio", store.hit_ratio)
+    metrics.register_gauge("users_local_cache_size", store.size)
+    return store
+
+
+UsersLocalCacheStore: Final[LocalCacheStore[SInfoUser]] = (
+    get_users_local_cache_store(config=settings.local_cache)
+)
+
+
+def get_local_cache_invalidation(
+    config: LocalCacheConfig,
+    redis_config: RedisConfig,
+) -> str:
+    """Redis tracks the hash buckets, not the users the local cache holds,
+    the hash layout is invalidated over the channel."""
+    if config.INVALIDATION != "tracking":
+        return "pubsub"
+    if redis_config.CACHE_LAYOUT == "hash":
+        log.warning("Hash layout is not tracked, using the channel.")
+        return "pubsub"
+    return "tracking"
+
+
+LocalCacheInvalidation: Final[str] = get_local_cache_invalidation(
+    config=settings.local_cache, redis_config=settings.redis
+)
+
+
+def get_cache_invalidation_listener(
+    config: LocalCacheConfig,
+) -> Union[RedisInvalidationListenerImpl, RedisTrackingListenerImpl]:
+    if LocalCacheInvalidation == "tracking":
+        return RedisTrackingListenerImpl(
+            redis_manager=RedisManager,
+            store=UsersLocalCacheStore,
+            prefixes=config.TRACKING_PREFIXES,
+        )
+    return RedisInvalidationListenerImpl(
+        redis_manager=RedisManager,
+        store=UsersLocalCacheStore,
+        channel=config.INVALIDATION_CHANNEL,
+    )
+
+
+CacheInvalidationListener: Final[
+    Union[RedisInvalidationListenerImpl, RedisTrackingListenerImpl]
+] = get_cache_invalidation_listener(config=settings.local_cache)
+
+
+def get_users_cache_namespace(config: RedisConfig) -> RedisCacheNamespaceImpl:
+    return RedisCacheNamespaceImpl(
+        redis_manager=RedisManager, config=config, schema=SInfoUser
+    )
+
+
+UsersCacheNamespace: Final[RedisCacheNamespaceImpl] = get_users_cache_namespace(
     config=settings.redis
 )
 
 
+async def drop_users_cache() -> None:
+    """Drop the whole cache and the nicknames filter, which is answered
+    from the database until it is rebuilt."""
+    await UsersCacheNamespace.bump()
+    await RedisManager.get_connection().delete(
+        NicknamesBloomFilterRepositoryImpl.KEY
+    )
+
+
+def get_redis_circuit_breaker(config: RedisConfig) -> CircuitBreaker:
+    breaker = CircuitBreaker(
+        name="redis_circuit",
+        errors=(RedisCacheDBException, RedisError),
+        policy=BreakerPolicy(
+            failure_threshold=config.BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=config.BREAKER_RESET_TIMEOUT,
+            max_deferred=config.BREAKER_MAX_DEFERRED,
+        ),
+        on_overflow=drop_users_cache,
+    )
+    metrics.register_gauge("redis_circuit_state", lambda: float(breaker.state))
+    return breaker
+
+
+RedisCircuitBreaker: Final[CircuitBreaker] = get_redis_circuit_breaker(
+    config=settings.redis
+)
+
+
+# Reads are counted per worker process and flushed to Redis periodically.
+UsersHotKeysCounter: Final[HotKeysCounter[int]] = HotKeysCounter(
+    max_keys=settings.warm_up.TRACKED_USERS
+)
+
+
+def get_hot_users_flusher(
+    config: CacheWarmUpConfig,
+) -> RedisHotUsersFlusherImpl:
+    return RedisHotUsersFlusherImpl(
+        redis_manager=RedisManager,
+        counter=UsersHotKeysCounter,
+        config=config,
+    )
+
+
+HotUsersFlusher: Final[RedisHotUsersFlusherImpl] = get_hot_users_flusher(
+    config=settings.warm_up
+)
+
+
 # ================== SQL Database Dependencies ==================
 def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
     """Getting async session factory for Depends object."""
@@ -61,3 +212,38 @@ def get_redis_pool() -> redis.Redis:
 
 
 RedisPool = Annotated[redis.Redis, Depends(get_redis_pool)]
+
+
+def get_redis_connection_manager() -> RedisConnectionManagerImpl:
+    """Create a Depends instance of the Redis connections manager."""
+    return RedisManager
+
+
+RedisConnections = Annotated[
+    RedisConnectionManagerImpl, Depends(get_redis_connection_manager)
+]
+
+
+def get_cache_namespace_version() -> str:
+    """Version of the cache keys, fixed for the whole request."""
+    return UsersCacheNamespace.version
+
+
+CacheNamespaceVersion = Annotated[str, Depends(get_cache_namespace_version)]
+
+
+# ================== Process-wide Utils ==================
+def get_users_hot_keys_counter() -> HotKeysCounter[int]:
+    return UsersHotKeysCounter
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    return RedisCircuitBreaker
+
+
+RedisBreaker = Annotated[CircuitBreaker, Depends(get_circuit_breaker)]
+
+
+UsersHotKeys = Annotated[
+    HotKeysCounter[int], Depends(get_users_hot_keys_counter)
+]
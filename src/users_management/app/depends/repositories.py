@@ -2,27 +2,60 @@
 ioc container for creating repositories.
 """
 
-from typing import Annotated, Callable
+from typing import Annotated, Callable, Optional
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from users_management.app.depends.config_factory import RedisConfigService
+from users_management.app.depends.config_factory import (
+    LocalCacheConfigService,
+    RedisConfigService,
+    WarmUpConfigService,
+)
 from users_management.app.depends.connections import (
     AsyncSessionFactory,
+    LocalCacheInvalidation,
+    RedisBreaker,
     RedisPool,
+    UsersLocalCacheStore,
+)
+from users_management.app.depends.utils_factory import (
+    UsersCacheLayout,
+    UsersCodec,
+    UsersTTLPolicy,
 )
 from users_management.app.schemas.users import SInfoUser
 from users_management.gateways.repositories import (
+    BloomFilterRepositoryProtocol,
     CacheRepositoryProtocol,
+    HotKeysRepositoryProtocol,
     UsersRepositoryProtocol,
 )
+from users_management.gateways.repositories.impls.hot_users import (
+    HotUsersRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.nicknames_bloom import (
+    NicknamesBloomFilterRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.nicknames_bloom_breaker import (
+    BreakerBloomFilterRepositoryImpl,
+)
 from users_management.gateways.repositories.impls.users import (
     UsersRepositoryImpl,
 )
 from users_management.gateways.repositories.impls.users_cache import (
     UsersCacheRepositoryImpl,
 )
+from users_management.gateways.repositories.impls.users_cache_breaker import (
+    BreakerCacheRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.users_fields_cache import (
+    UsersFieldsCacheRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.users_local_cache import (
+    InvalidationChannel,
+    UsersLocalCacheRepositoryImpl,
+)
 from users_management.gateways.transactions import RepositoryManagerProtocol
 from users_management.gateways.transactions.impls.sql_repository_manager import (
     SQLTransactionsManagerImpl,
@@ -65,13 +98,117 @@ RepositoryManager = Annotated[RepositoryManagerProtocol, Depends(get_uow)]
 # Cache repositories --------------------------
 
 
-def get_users_cache_repository(
+def get_users_cache_storage(
+    redis_pool: RedisPool,
+    config: RedisConfigService,
+    codec: UsersCodec,
+    layout: UsersCacheLayout,
+    ttl_policy: UsersTTLPolicy,
+) -> CacheRepositoryProtocol[SInfoUser]:
+    users_cache_cls = (
+        UsersFieldsCacheRepositoryImpl
+        if config.CACHE_LAYOUT == "fields"
+        else UsersCacheRepositoryImpl
+    )
+    return users_cache_cls(
+        redis=redis_pool,
+        config=config,
+        codec=codec,
+        layout=layout,
+        ttl_policy=ttl_policy,
+    )
+
+
+UsersCacheStorage = Annotated[
+    CacheRepositoryProtocol[SInfoUser], Depends(get_users_cache_storage)
+]
+
+
+def get_guarded_users_cache(
+    users_cache: UsersCacheStorage,
+    config: RedisConfigService,
+    breaker: RedisBreaker,
+) -> CacheRepositoryProtocol[SInfoUser]:
+    if not config.BREAKER_ENABLED:
+        return users_cache
+    return BreakerCacheRepositoryImpl(
+        cache=users_cache, breaker=breaker, config=config
+    )
+
+
+GuardedUsersCache = Annotated[
+    CacheRepositoryProtocol[SInfoUser], Depends(get_guarded_users_cache)
+]
+
+
+def get_local_cache_channel(
     redis_pool: RedisPool,
     config: RedisConfigService,
+    local_cache_config: LocalCacheConfigService,
+    breaker: RedisBreaker,
+) -> Optional[InvalidationChannel]:
+    if LocalCacheInvalidation != "pubsub":
+        return None
+    return InvalidationChannel(
+        redis=redis_pool,
+        name=local_cache_config.INVALIDATION_CHANNEL,
+        breaker=breaker if config.BREAKER_ENABLED else None,
+    )
+
+
+LocalCacheChannel = Annotated[
+    Optional[InvalidationChannel], Depends(get_local_cache_channel)
+]
+
+
+def get_users_cache_repository(
+    users_cache: GuardedUsersCache,
+    local_cache_config: LocalCacheConfigService,
+    ttl_policy: UsersTTLPolicy,
+    channel: LocalCacheChannel,
 ) -> CacheRepositoryProtocol[SInfoUser]:
-    return UsersCacheRepositoryImpl(redis=redis_pool, config=config)
+    if not local_cache_config.ENABLED:
+        return users_cache
+    return UsersLocalCacheRepositoryImpl(
+        cache=users_cache,
+        store=UsersLocalCacheStore,
+        ttl_policy=ttl_policy,
+        channel=channel,
+    )
 
 
 RedisUsersCacheRepository = Annotated[
     CacheRepositoryProtocol[SInfoUser], Depends(get_users_cache_repository)
 ]
+
+
+def get_nicknames_filter_repository(
+    redis_pool: RedisPool,
+    config: RedisConfigService,
+    breaker: RedisBreaker,
+) -> BloomFilterRepositoryProtocol:
+    nicknames_filter = NicknamesBloomFilterRepositoryImpl(
+        redis=redis_pool, config=config
+    )
+    if not (config.BREAKER_ENABLED and config.NICKNAMES_BLOOM_ENABLED):
+        return nicknames_filter
+    return BreakerBloomFilterRepositoryImpl(
+        bloom_filter=nicknames_filter, breaker=breaker
+    )
+
+
+RedisNicknamesFilterRepository = Annotated[
+    BloomFilterRepositoryProtocol, Depends(get_nicknames_filter_repository)
+]
+
+
+def get_hot_users_repository(
+    redis_pool: RedisPool,
+    config: WarmUpConfigService,
+) -> HotKeysRepositoryProtocol:
+    return HotUsersRepositoryImpl(redis=redis_pool, config=config)
+
+
+RedisHotUsersRepository = Annotated[
+    HotKeysRepositoryProtocol, Depends(get_hot_users_repository)
+]
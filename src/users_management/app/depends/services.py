@@ -3,25 +3,113 @@ from typing import Annotated
 from fastapi import Depends
 
 from users_management.app.depends import RepositoryManager
-from users_management.app.depends.repositories import RedisUsersCacheRepository
-from users_management.app.depends.utils_factory import KeyByUserIdBuilder
-from users_management.app.services import UsersServiceProtocol
+from users_management.app.depends.connections import (
+    UsersHotKeys,
+    get_async_session_factory,
+    get_cache_namespace_version,
+    get_circuit_breaker,
+    get_redis_pool,
+)
+from users_management.app.depends.repositories import (
+    RedisNicknamesFilterRepository,
+    RedisUsersCacheRepository,
+    get_guarded_users_cache,
+    get_hot_users_repository,
+    get_local_cache_channel,
+    get_uow,
+    get_users_cache_repository,
+    get_users_cache_storage,
+    users_repo_factory,
+)
+from users_management.app.depends.utils_factory import (
+    UsersCacheKeysBuilders,
+    UsersCacheTTLPolicy,
+    UsersLoadSingleFlight,
+    get_key_by_user_id_builder,
+    get_users_cache_layout,
+    get_users_codec,
+)
+from users_management.app.services import (
+    CacheWarmerProtocol,
+    UsersServiceProtocol,
+)
+from users_management.core.settings import settings
 
-from ..services.impls.users import UsersServiceImpl
+from ..services.impls.users import UsersCacheDependencies, UsersServiceImpl
+from ..services.impls.users_cache_warmer import UsersCacheWarmerImpl
 
 
-def get_users_management_service(
-    repository_manager: RepositoryManager,
+def get_users_cache_dependencies(
     users_cache: RedisUsersCacheRepository,
-    key_builder: KeyByUserIdBuilder,
-) -> UsersServiceProtocol:
-    return UsersServiceImpl(
-        repository_manager=repository_manager,
+    keys: UsersCacheKeysBuilders,
+    single_flight: UsersLoadSingleFlight,
+    nicknames_filter: RedisNicknamesFilterRepository,
+    hot_users: UsersHotKeys,
+) -> UsersCacheDependencies:
+    return UsersCacheDependencies(
         users_cache=users_cache,
-        key_builder=key_builder,
+        keys=keys,
+        single_flight=single_flight,
+        nicknames_filter=nicknames_filter,
+        hot_users=hot_users,
     )
 
 
+UsersCache = Annotated[
+    UsersCacheDependencies, Depends(get_users_cache_dependencies)
+]
+
+
+def get_users_management_service(
+    repository_manager: RepositoryManager,
+    cache: UsersCache,
+) -> UsersServiceProtocol:
+    return UsersServiceImpl(repository_manager=repository_manager, cache=cache)
+
+
 UsersService = Annotated[
     UsersServiceProtocol, Depends(get_users_management_service)
 ]
+
+
+def get_users_cache_warmer() -> CacheWarmerProtocol:
+    """Create the warm-up service outside of a request, for the lifespan."""
+    redis_pool = get_redis_pool()
+    breaker = get_circuit_breaker()
+    users_cache = get_guarded_users_cache(
+        users_cache=get_users_cache_storage(
+            redis_pool=redis_pool,
+            config=settings.redis,
+            codec=get_users_codec(config=settings.redis),
+            layout=get_users_cache_layout(
+                config=settings.redis, ttl_policy=UsersCacheTTLPolicy
+            ),
+            ttl_policy=UsersCacheTTLPolicy,
+        ),
+        config=settings.redis,
+        breaker=breaker,
+    )
+    return UsersCacheWarmerImpl(
+        repository_manager=get_uow(
+            async_session_factory=get_async_session_factory(),
+            users_repo_factory=users_repo_factory,
+        ),
+        users_cache=get_users_cache_repository(
+            users_cache=users_cache,
+            local_cache_config=settings.local_cache,
+            ttl_policy=UsersCacheTTLPolicy,
+            channel=get_local_cache_channel(
+                redis_pool=redis_pool,
+                config=settings.redis,
+                local_cache_config=settings.local_cache,
+                breaker=breaker,
+            ),
+        ),
+        key_builder=get_key_by_user_id_builder(
+            config=settings.redis, namespace=get_cache_namespace_version()
+        ),
+        hot_users=get_hot_users_repository(
+            redis_pool=redis_pool, config=settings.warm_up
+        ),
+        config=settings.warm_up,
+    )
@@ -1,14 +1,164 @@
-from typing import Annotated, Callable
+from datetime import timedelta
+from functools import partial
+from typing import Annotated, Callable, Final
 
 from fastapi import Depends
 
-from users_management.gateways.key_builders import get_key_by_user_id
+from users_management.app.depends.config_factory import RedisConfigService
+from users_management.app.depends.connections import CacheNamespaceVersion
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.settings import RedisConfig, settings
+from users_management.core.utils.single_flight import SingleFlight
+from users_management.core.utils.ttl_policy import (
+    AdaptiveTTL,
+    CacheTTLPolicy,
+)
+from users_management.gateways.cache_layouts import CacheLayoutProtocol
+from users_management.gateways.cache_layouts.impls.hash import (
+    HashCacheLayoutImpl,
+)
+from users_management.gateways.cache_layouts.impls.string import (
+    StringCacheLayoutImpl,
+)
+from users_management.gateways.codecs import CacheCodecProtocol
+from users_management.gateways.codecs.impls.json import JSONUsersCodecImpl
+from users_management.gateways.codecs.impls.struct import (
+    StructUsersCodecImpl,
+)
+from users_management.gateways.key_builders import (
+    UsersCacheKeys,
+    get_bucketed_key_by_user_id,
+    get_fields_key_by_user_id,
+    get_key_by_free_nickname,
+    get_key_by_nickname,
+    get_key_by_user_id,
+)
 
 
-def get_key_by_user_id_builder() -> Callable[[int], str]:
-    return get_key_by_user_id
+def get_key_by_user_id_builder(
+    config: RedisConfigService,
+    namespace: CacheNamespaceVersion,
+) -> Callable[[int], str]:
+    if config.CACHE_LAYOUT == "hash":
+        return partial(
+            get_bucketed_key_by_user_id,
+            namespace=namespace,
+            bucket_size=config.CACHE_BUCKET_SIZE,
+        )
+    if config.CACHE_LAYOUT == "fields":
+        return partial(get_fields_key_by_user_id, namespace=namespace)
+    return partial(get_key_by_user_id, namespace=namespace)
 
 
 KeyByUserIdBuilder = Annotated[
     Callable[[int], str], Depends(get_key_by_user_id_builder)
 ]
+
+
+def get_key_by_nickname_builder(
+    namespace: CacheNamespaceVersion,
+) -> Callable[[str], str]:
+    return partial(get_key_by_nickname, namespace=namespace)
+
+
+KeyByNicknameBuilder = Annotated[
+    Callable[[str], str], Depends(get_key_by_nickname_builder)
+]
+
+
+def get_key_by_free_nickname_builder(
+    namespace: CacheNamespaceVersion,
+) -> Callable[[str], str]:
+    return partial(get_key_by_free_nickname, namespace=namespace)
+
+
+KeyByFreeNicknameBuilder = Annotated[
+    Callable[[str], str], Depends(get_key_by_free_nickname_builder)
+]
+
+
+def get_users_cache_keys(
+    key_builder: KeyByUserIdBuilder,
+    nickname_key_builder: KeyByNicknameBuilder,
+    free_nickname_key_builder: KeyByFreeNicknameBuilder,
+) -> UsersCacheKeys:
+    return UsersCacheKeys(
+        by_user_id=key_builder,
+        by_nickname=nickname_key_builder,
+        by_free_nickname=free_nickname_key_builder,
+    )
+
+
+UsersCacheKeysBuilders = Annotated[
+    UsersCacheKeys, Depends(get_users_cache_keys)
+]
+
+
+UsersSingleFlight: Final[SingleFlight[SInfoUser]] = SingleFlight(
+    name="users_single_flight"
+)
+
+
+def get_users_single_flight() -> SingleFlight[SInfoUser]:
+    return UsersSingleFlight
+
+
+UsersLoadSingleFlight = Annotated[
+    SingleFlight[SInfoUser], Depends(get_users_single_flight)
+]
+
+
+def get_users_codec(
+    config: RedisConfigService,
+) -> CacheCodecProtocol[SInfoUser]:
+    if config.CACHE_CODEC == "struct":
+        return StructUsersCodecImpl()
+    return JSONUsersCodecImpl()
+
+
+UsersCodec = Annotated[CacheCodecProtocol[SInfoUser], Depends(get_users_codec)]
+
+
+def get_users_cache_ttl_policy(config: RedisConfig) -> CacheTTLPolicy:
+    lifetime = int(timedelta(minutes=config.CACHE_LIFETIME).total_seconds())
+    return CacheTTLPolicy(
+        lifetime=lifetime,
+        soft_lifetime=config.CACHE_SOFT_LIFETIME or lifetime,
+        jitter=config.CACHE_LIFETIME_JITTER,
+        adaptive=(
+            AdaptiveTTL(
+                min_factor=config.ADAPTIVE_TTL_MIN_FACTOR,
+                max_factor=config.ADAPTIVE_TTL_MAX_FACTOR,
+                hot_reads=config.ADAPTIVE_TTL_HOT_READS,
+            )
+            if config.ADAPTIVE_TTL_ENABLED
+            else None
+        ),
+    )
+
+
+# Read counters are shared by all requests of the worker process.
+UsersCacheTTLPolicy: Final[CacheTTLPolicy] = get_users_cache_ttl_policy(
+    config=settings.redis
+)
+
+
+def get_users_ttl_policy() -> CacheTTLPolicy:
+    return UsersCacheTTLPolicy
+
+
+UsersTTLPolicy = Annotated[CacheTTLPolicy, Depends(get_users_ttl_policy)]
+
+
+def get_users_cache_layout(
+    config: RedisConfigService,
+    ttl_policy: UsersTTLPolicy,
+) -> CacheLayoutProtocol:
+    if config.CACHE_LAYOUT == "hash":
+        return HashCacheLayoutImpl(lifetime=ttl_policy.max_lifetime)
+    return StringCacheLayoutImpl()
+
+
+UsersCacheLayout = Annotated[
+    CacheLayoutProtocol, Depends(get_users_cache_layout)
+]
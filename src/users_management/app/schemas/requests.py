@@ -1,4 +1,6 @@
-from pydantic import PositiveInt
+from typing import List
+
+from pydantic import Field, PositiveInt
 
 from users_management.core.schemas.base import BaseSchema
 
@@ -8,3 +10,28 @@ class CreateUserRequest(BaseSchema):
 
     user_id: PositiveInt
     nickname: str
+
+
+class CreateUsersRequest(BaseSchema):
+    """The schema of the bulk users creation request."""
+
+    users: List[CreateUserRequest] = Field(min_length=1, max_length=10_000)
+
+
+class UpdateUserRequest(BaseSchema):
+    """The schema of one user of the bulk update request."""
+
+    user_id: PositiveInt
+    avatar: bool
+
+
+class UpdateUsersRequest(BaseSchema):
+    """The schema of the bulk users update request."""
+
+    users: List[UpdateUserRequest] = Field(min_length=1, max_length=10_000)
+
+
+class DeleteUsersRequest(BaseSchema):
+    """The schema of the bulk users deletion request."""
+
+    users_id: List[PositiveInt] = Field(min_length=1, max_length=10_000)
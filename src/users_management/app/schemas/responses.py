@@ -1,3 +1,6 @@
+from typing import Dict, List, Literal
+
+from users_management.app.schemas.users import SInfoUser
 from users_management.core.schemas.base import BaseSchema
 
 
@@ -7,6 +10,54 @@ class SuccessResponse(BaseSchema):
     message: str = "success"
 
 
+class ReadinessResponse(SuccessResponse):
+    """Scheme of the readiness, the service is degraded while it serves
+    the requests without the cache."""
+
+    redis_circuit: str
+
+
+class CreateUserResult(BaseSchema):
+    """Scheme of the outcome of one user of a bulk creation.
+
+    * created: the user is added
+    * user_exists: a user with the ID already exists
+    * nickname_exists: a user with the nickname already exists
+    * duplicate: the ID or the nickname is repeated in the request
+    * conflict: a concurrent request took the ID or the nickname
+    """
+
+    user_id: int
+    nickname: str
+    status: Literal[
+        "created", "user_exists", "nickname_exists", "duplicate", "conflict"
+    ]
+
+
+class CreateUsersResponse(BaseSchema):
+    """Scheme of the bulk creation, results in the order of the request."""
+
+    results: List[CreateUserResult]
+
+
+class UpdateUsersResponse(BaseSchema):
+    """Scheme of the bulk update, the users not found are left out."""
+
+    users: List[SInfoUser]
+
+
+class DeleteUsersResponse(BaseSchema):
+    """Scheme of the bulk deletion, the users not found are left out."""
+
+    users_id: List[int]
+
+
+class MetricsResponse(BaseSchema):
+    """Scheme of the process metrics snapshot."""
+
+    metrics: Dict[str, float]
+
+
 class ErrorResponse(BaseSchema):
     """Error response scheme."""
 
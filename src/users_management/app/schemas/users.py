@@ -1,3 +1,8 @@
+import datetime
+from typing import Optional
+
+from pydantic import Field
+
 from users_management.core.schemas import BaseSchema
 
 
@@ -6,3 +11,5 @@ class SInfoUser(BaseSchema):
     user_id: int
     nickname: str
     avatar: bool
+    # version of the row, used by the cache and never serialized
+    updated_at: Optional[datetime.datetime] = Field(default=None, exclude=True)
@@ -1,4 +1,5 @@
+from .protocols.cache_warmer_protocol import CacheWarmerProtocol
 from .protocols.users_protocol import UsersServiceProtocol
 
 
-__all__ = ["UsersServiceProtocol"]
+__all__ = ["CacheWarmerProtocol", "UsersServiceProtocol"]
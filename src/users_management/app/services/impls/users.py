@@ -2,87 +2,364 @@
 Service implementation responsible for user management.
 """
 
+from dataclasses import dataclass
 import logging
-from typing import Any, Callable, Dict, Self
+import time
+from typing import Any, Dict, List, Optional, Self, Set
 
 from users_management.app.exceptions import (
     DataNotTransmitted,
+    RedisCacheDBException,
     UserAlreadyExist_Nickname,
     UserAlreadyExistException,
     UserNotFoundException,
 )
-from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
+from users_management.app.schemas.responses import CreateUserResult
 from users_management.app.schemas.users import SInfoUser
 from users_management.app.services import UsersServiceProtocol
-from users_management.gateways.repositories import CacheRepositoryProtocol
+from users_management.core.metrics import metrics
+from users_management.core.utils.hot_keys import HotKeysCounter
+from users_management.core.utils.single_flight import SingleFlight
+from users_management.gateways.key_builders import UsersCacheKeys
+from users_management.gateways.repositories import (
+    BloomFilterRepositoryProtocol,
+    CacheRepositoryProtocol,
+    UserConflict,
+)
 from users_management.gateways.transactions import RepositoryManagerProtocol
 
 
 log = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class UsersCacheDependencies:
+    """Collaborators of the users service serving the reads from the cache.
+
+    Attributes:
+        users_cache (CacheRepositoryProtocol[SInfoUser]): users cache.
+        keys (UsersCacheKeys): key builders of the cache entries.
+        single_flight (SingleFlight[SInfoUser]): coalesces the loads
+            of the missing entries.
+        nicknames_filter (BloomFilterRepositoryProtocol): filter of the
+            taken nicknames.
+        hot_users (HotKeysCounter[int]): read counts of the users.
+    """
+
+    users_cache: CacheRepositoryProtocol[SInfoUser]
+    keys: UsersCacheKeys
+    single_flight: SingleFlight[SInfoUser]
+    nicknames_filter: BloomFilterRepositoryProtocol
+    hot_users: HotKeysCounter[int]
+
+
 class UsersServiceImpl(UsersServiceProtocol):
     def __init__(
         self,
         repository_manager: RepositoryManagerProtocol,
-        users_cache: CacheRepositoryProtocol[SInfoUser],
-        key_builder: Callable[[int], str],
+        cache: UsersCacheDependencies,
     ) -> None:
         self._repository_manager = repository_manager
-        self._users_cache = users_cache
-        self._key_builder = key_builder
+        self._users_cache = cache.users_cache
+        self._key_builder = cache.keys.by_user_id
+        self._nickname_key_builder = cache.keys.by_nickname
+        self._free_nickname_key_builder = cache.keys.by_free_nickname
+        self._single_flight = cache.single_flight
+        self._nicknames_filter = cache.nicknames_filter
+        self._hot_users = cache.hot_users
 
     async def get_user_by_id(
         self: Self,
         user_id: int,
     ) -> SInfoUser:
+        self._hot_users.record(user_id)
+        key = self._key_builder(user_id)
+        if entry := await self._users_cache.get_entry(key):
+            if entry.is_negative:
+                log.info("User is known to be missing: %s.", user_id)
+                metrics.inc("users_negative_cache_hits")
+                raise UserNotFoundException()
+            log.info("User found in cache: %s.", user_id)
+            if entry.needs_refresh:
+                self._schedule_refresh(user_id, key)
+            return entry.value  # type: ignore[return-value]
+        return await self._single_flight.do(
+            key, lambda: self._load_user(user_id, key)
+        )
+
+    async def get_user_json_by_id(
+        self: Self,
+        user_id: int,
+    ) -> bytes:
+        self._hot_users.record(user_id)
         key = self._key_builder(user_id)
-        if user := await self._users_cache.get(key):
+        if entry := await self._users_cache.get_json(key):
+            if entry.is_negative:
+                log.info("User is known to be missing: %s.", user_id)
+                metrics.inc("users_negative_cache_hits")
+                raise UserNotFoundException()
             log.info("User found in cache: %s.", user_id)
+            if entry.needs_refresh:
+                self._schedule_refresh(user_id, key)
+            return entry.value  # type: ignore[return-value]
+        user = await self._single_flight.do(
+            key, lambda: self._load_user(user_id, key)
+        )
+        return user.model_dump_json().encode()
+
+    def _schedule_refresh(
+        self: Self,
+        user_id: int,
+        key: str,
+    ) -> None:
+        """Reload the cached user in the background."""
+        log.info("Scheduling cache refresh of user: %s.", user_id)
+        self._single_flight.start(key, lambda: self._load_user(user_id, key))
+
+    async def _load_user(
+        self: Self,
+        user_id: int,
+        key: str,
+    ) -> SInfoUser:
+        """Load the user from the database and put it in the cache.
+
+        Only the holder of the cache-fill lease goes to the database,
+        other instances wait for the filled value for a bounded time.
+        """
+        if not await self._users_cache.acquire_lease(key):
+            if entry := await self._users_cache.wait_for(key):
+                if entry.is_negative:
+                    raise UserNotFoundException()
+                return entry.value  # type: ignore[return-value]
+        try:
+            started_at = time.monotonic()
+            async with self._repository_manager as uow:
+                user = await uow.users_repository.get_user(user_id=user_id)
+            if not user:
+                await self._users_cache.add_negative(key)
+                raise UserNotFoundException()
+            delta = time.monotonic() - started_at
+            await self._users_cache.add(
+                key,
+                user,
+                delta,
+                index_keys=[self._nickname_key_builder(user.nickname)],
+            )
             return user
-        async with self._repository_manager as uow:
-            user = await uow.users_repository.get_user(user_id=user_id)
-        if not user:
-            raise UserNotFoundException()
-        await self._users_cache.add(key, user)
-        return user
+        finally:
+            await self._users_cache.release_lease(key)
 
     async def get_users_list(
         self: Self,
         users_id: list[int],
     ) -> list[SInfoUser]:
+        for user_id in users_id:
+            self._hot_users.record(user_id)
         keys = [self._key_builder(user_id) for user_id in users_id]
-        if users := await self._users_cache.get_list(keys):
+        cached_users = await self._users_cache.get_list(keys)
+        missing_ids = [
+            user_id
+            for user_id, user in zip(users_id, cached_users)
+            if user is None
+        ]
+        if not missing_ids:
             log.info("Users found in cache: %s.", users_id)
-            return users
+            return cached_users  # type: ignore[return-value]
+        found_by_id = await self._load_users(missing_ids)
+        return [
+            user or found_by_id[user_id]
+            for user_id, user in zip(users_id, cached_users)
+        ]
+
+    async def get_users_list_json(
+        self: Self,
+        users_id: list[int],
+    ) -> bytes:
+        for user_id in users_id:
+            self._hot_users.record(user_id)
+        keys = [self._key_builder(user_id) for user_id in users_id]
+        cached_users = await self._users_cache.get_list_json(keys)
+        missing_ids = [
+            user_id
+            for user_id, user in zip(users_id, cached_users)
+            if user is None
+        ]
+        if missing_ids:
+            found_by_id = await self._load_users(missing_ids)
+        else:
+            log.info("Users found in cache: %s.", users_id)
+            found_by_id = {}
+        return b"[%b]" % b",".join(
+            user or found_by_id[user_id].model_dump_json().encode()
+            for user_id, user in zip(users_id, cached_users)
+        )
+
+    async def _load_users(
+        self: Self,
+        users_id: list[int],
+    ) -> Dict[int, SInfoUser]:
+        """Load the users missing from the cache and backfill their keys."""
+        missing_ids = list(dict.fromkeys(users_id))
+        log.info("Users not found in cache: %s.", missing_ids)
         async with self._repository_manager as uow:
-            users = await uow.users_repository.get_users_list(users_id=users_id)
-        if not users:
+            found_users = await uow.users_repository.get_users_list(
+                users_id=missing_ids
+            )
+        if not found_users:
             raise UserNotFoundException()
-        await self._users_cache.add_list(users)
-        return users
+        await self._users_cache.add_list(
+            {self._key_builder(user.user_id): user for user in found_users}
+        )
+        return {user.user_id: user for user in found_users}
 
     async def find_user_by_nickname(
         self: Self,
         nickname: str,
     ) -> None:
+        if await self._nicknames_filter.might_contain(nickname) is False:
+            log.info("Nickname is definitely free: %s.", nickname)
+            return
+        key = self._free_nickname_key_builder(nickname)
+        entry = await self._users_cache.get_entry(key)
+        if entry and entry.is_negative:
+            log.info("Nickname is known to be free: %s.", nickname)
+            metrics.inc("nicknames_negative_cache_hits")
+            return
+        if await self._get_cached_user_by_nickname(nickname):
+            raise UserAlreadyExistException()
         async with self._repository_manager as uow:
-            user = await uow.users_repository.get_user(nickname=nickname)
-        if user:
+            taken = await uow.users_repository.exists_nickname(nickname)
+        if taken:
+            # answered by the index, the row is cached in the background
+            index_key = self._nickname_key_builder(nickname)
+            self._single_flight.start(
+                index_key, lambda: self._load_user_by_nickname(nickname)
+            )
             raise UserAlreadyExistException()
+        await self._users_cache.add_negative(key)
+
+    async def _load_user_by_nickname(
+        self: Self,
+        nickname: str,
+    ) -> SInfoUser:
+        """Put the user with the nickname in the cache, with its index."""
+        async with self._repository_manager as uow:
+            user = await uow.users_repository.get_user(nickname=nickname)
+        if not user:
+            raise UserNotFoundException()
+        await self._users_cache.add(
+            self._key_builder(user.user_id),
+            user,
+            index_keys=[self._nickname_key_builder(nickname)],
+        )
+        return user
+
+    async def _get_cached_user_by_nickname(
+        self: Self,
+        nickname: str,
+    ) -> Optional[SInfoUser]:
+        """Find the user through the nickname index of the cache.
+
+        The index is only a hint, the entry it points to must still
+        carry the same nickname.
+        """
+        key = await self._users_cache.resolve_index(
+            self._nickname_key_builder(nickname)
+        )
+        if not key:
+            return None
+        entry = await self._users_cache.get_entry(key)
+        if not entry or not entry.value or entry.value.nickname != nickname:
+            return None
+        log.info("User found in cache by nickname: %s.", nickname)
+        metrics.inc("nicknames_index_hits")
+        if entry.needs_refresh:
+            self._schedule_refresh(entry.value.user_id, key)
+        return entry.value
 
     async def create_user(
         self: Self,
         data: CreateUserRequest,
     ) -> SInfoUser:
+        if await self._get_cached_user_by_nickname(data.nickname):
+            raise UserAlreadyExist_Nickname()
         async with self._repository_manager as uow:
-            if await uow.users_repository.get_user(nickname=data.nickname):
-                raise UserAlreadyExist_Nickname()
             user = await uow.users_repository.create_user(data)
+        if user is UserConflict.NICKNAME:
+            raise UserAlreadyExist_Nickname()
+        if user is UserConflict.USER_ID:
+            raise UserAlreadyExistException()
+        await self._add_nicknames([user.nickname])
         key = self._key_builder(user.user_id)
-        await self._users_cache.add(key, user)
+        await self._users_cache.add(
+            key, user, index_keys=[self._nickname_key_builder(user.nickname)]
+        )
+        await self._users_cache.delete(
+            self._free_nickname_key_builder(user.nickname)
+        )
         return user
 
+    async def create_users(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> List[CreateUserResult]:
+        statuses: List[Optional[str]] = [None] * len(data)
+        seen_ids: Set[int] = set()
+        seen_nicknames: Set[str] = set()
+        for position, user in enumerate(data):
+            if user.user_id in seen_ids or user.nickname in seen_nicknames:
+                statuses[position] = "duplicate"
+                continue
+            seen_ids.add(user.user_id)
+            seen_nicknames.add(user.nickname)
+        async with self._repository_manager as uow:
+            taken_ids, taken_nicknames = await uow.users_repository.find_taken(
+                list(seen_ids), list(seen_nicknames)
+            )
+            for position, user in enumerate(data):
+                if statuses[position]:
+                    continue
+                if user.user_id in taken_ids:
+                    statuses[position] = "user_exists"
+                elif user.nickname in taken_nicknames:
+                    statuses[position] = "nickname_exists"
+            candidates = [
+                user for user, status in zip(data, statuses) if status is None
+            ]
+            created = (
+                await uow.users_repository.create_users(candidates)
+                if candidates
+                else []
+            )
+        # the rest was taken by concurrent requests since the check
+        created_ids = {user.user_id for user in created}
+        log.info("Created %s of %s users in bulk.", len(created), len(data))
+        metrics.inc("users_bulk_created", len(created))
+        if created:
+            await self._add_nicknames([user.nickname for user in created])
+            await self._users_cache.add_list(
+                {self._key_builder(user.user_id): user for user in created}
+            )
+            await self._users_cache.delete_list(
+                [
+                    self._free_nickname_key_builder(user.nickname)
+                    for user in created
+                ]
+            )
+        return [
+            CreateUserResult(
+                user_id=user.user_id,
+                nickname=user.nickname,
+                status=status
+                or ("created" if user.user_id in created_ids else "conflict"),
+            )
+            for user, status in zip(data, statuses)
+        ]
+
     async def update_user(
         self: Self,
         user_id: int,
@@ -90,12 +367,60 @@ class UsersServiceImpl(UsersServiceProtocol):
     ) -> SInfoUser:
         if not data:
             raise DataNotTransmitted()
+        previous = None
         async with self._repository_manager as uow:
+            if "nickname" in data:
+                previous = await uow.users_repository.get_user(user_id=user_id)
             user = await uow.users_repository.update_user(user_id, data)
+        if "nickname" in data:
+            await self._add_nicknames([user.nickname])
+        stale_index_keys = (
+            [self._nickname_key_builder(previous.nickname)]
+            if previous and previous.nickname != user.nickname
+            else []
+        )
         key = self._key_builder(user.user_id)
-        await self._users_cache.add(key, user)
+        await self._users_cache.update_fields(
+            key,
+            user,
+            list(data),
+            index_keys=[self._nickname_key_builder(user.nickname)],
+            stale_index_keys=stale_index_keys,
+        )
+        if "nickname" in data:
+            await self._users_cache.delete(
+                self._free_nickname_key_builder(user.nickname)
+            )
         return user
 
+    async def _add_nicknames(self: Self, nicknames: List[str]) -> None:
+        """Add the committed nicknames to the filter or drop it.
+
+        Called before any cache write: a lost addition makes the filter
+        deny a taken nickname, a dropped filter is answered from the
+        database until it is rebuilt.
+        """
+        try:
+            await self._nicknames_filter.add_list(nicknames)
+        except RedisCacheDBException:
+            log.warning("Failed to add nicknames to the filter.", exc_info=True)
+            await self._nicknames_filter.drop()
+
+    async def update_users(
+        self: Self,
+        data: List[UpdateUserRequest],
+    ) -> List[SInfoUser]:
+        changes = list({user.user_id: user for user in data}.values())
+        async with self._repository_manager as uow:
+            users = await uow.users_repository.update_users(changes)
+        log.info("Updated %s of %s users in bulk.", len(users), len(changes))
+        metrics.inc("users_bulk_updated", len(users))
+        # dropped rather than rewritten, in a single pipeline
+        await self._users_cache.delete_list(
+            [self._key_builder(user.user_id) for user in users]
+        )
+        return users
+
     async def delete_user(
         self: Self,
         user_id: int,
@@ -103,4 +428,28 @@ class UsersServiceImpl(UsersServiceProtocol):
         async with self._repository_manager as uow:
             await uow.users_repository.delete_user(user_id)
         key = self._key_builder(user_id)
-        await self._users_cache.delete(key)
+        entry = await self._users_cache.get_entry(key)
+        index_keys = (
+            [self._nickname_key_builder(entry.value.nickname)]
+            if entry and entry.value
+            else []
+        )
+        await self._users_cache.delete(key, index_keys)
+
+    async def delete_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[int]:
+        async with self._repository_manager as uow:
+            users = await uow.users_repository.delete_users(
+                list(dict.fromkeys(users_id))
+            )
+        log.info("Deleted %s of %s users in bulk.", len(users), len(users_id))
+        metrics.inc("users_bulk_deleted", len(users))
+        await self._users_cache.delete_list(
+            [
+                *(self._key_builder(user.user_id) for user in users),
+                *(self._nickname_key_builder(user.nickname) for user in users),
+            ]
+        )
+        return [user.user_id for user in users]
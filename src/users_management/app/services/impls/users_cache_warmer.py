@@ -0,0 +1,77 @@
+"""
+Service implementation responsible for the users cache warm-up.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Self
+
+from users_management.app.exceptions import (
+    RedisCacheDBException,
+    SQLRepositoryException,
+)
+from users_management.app.schemas.users import SInfoUser
+from users_management.app.services import CacheWarmerProtocol
+from users_management.core.metrics import metrics
+from users_management.core.settings import CacheWarmUpConfig
+from users_management.gateways.repositories import (
+    CacheRepositoryProtocol,
+    HotKeysRepositoryProtocol,
+)
+from users_management.gateways.transactions import RepositoryManagerProtocol
+
+
+log = logging.getLogger(__name__)
+
+
+class UsersCacheWarmerImpl(CacheWarmerProtocol):
+    """Fills the cache with the hottest users ranked by the persisted
+    read counts, streaming them from the database in batches."""
+
+    def __init__(
+        self: Self,
+        repository_manager: RepositoryManagerProtocol,
+        users_cache: CacheRepositoryProtocol[SInfoUser],
+        key_builder: Callable[[int], str],
+        hot_users: HotKeysRepositoryProtocol,
+        config: CacheWarmUpConfig,
+    ) -> None:
+        self._repository_manager = repository_manager
+        self._users_cache = users_cache
+        self._key_builder = key_builder
+        self._hot_users = hot_users
+        self._config = config
+        self._cached = 0
+
+    async def warm_up(self: Self) -> int:
+        started_at = time.monotonic()
+        self._cached = 0
+        try:
+            async with asyncio.timeout(self._config.TIME_BUDGET):
+                await self._load()
+        except TimeoutError:
+            log.warning("Cache warm-up is out of the time budget.")
+        except (RedisCacheDBException, SQLRepositoryException):
+            log.warning("Cache warm-up failed.", exc_info=True)
+        duration = time.monotonic() - started_at
+        metrics.inc("users_cache_warm_up_entries", self._cached)
+        log.info(
+            "Cache warm-up cached %s users in %.3f s.", self._cached, duration
+        )
+        return self._cached
+
+    async def _load(self: Self) -> None:
+        users_id = await self._hot_users.top(self._config.TOP_USERS)
+        if not users_id:
+            log.info("No hot users to warm up the cache with.")
+            return
+        async with self._repository_manager as uow:
+            batches = uow.users_repository.stream_users(
+                users_id, self._config.BATCH_SIZE
+            )
+            async for users in batches:
+                await self._users_cache.add_list(
+                    {self._key_builder(user.user_id): user for user in users}
+                )
+                self._cached += len(users)
@@ -0,0 +1,20 @@
+"""
+Service protocol responsible for filling the cache ahead of the reads.
+"""
+
+from abc import abstractmethod
+from typing import Protocol, Self
+
+
+class CacheWarmerProtocol(Protocol):
+    @abstractmethod
+    async def warm_up(self: Self) -> int:
+        """Load the most read entries into the cache.
+
+        Gives up once the time budget is spent, the failures are logged
+        and not raised: a cold cache must not prevent the startup.
+
+        Returns:
+            int: number of cached entries.
+        """
+        ...
@@ -3,9 +3,13 @@ Service protocol responsible for user management.
 """
 
 from abc import abstractmethod
-from typing import Any, Dict, Protocol, Self
+from typing import Any, Dict, List, Protocol, Self
 
-from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
+from users_management.app.schemas.responses import CreateUserResult
 from users_management.app.schemas.users import SInfoUser
 
 
@@ -26,6 +30,22 @@ class UsersServiceProtocol(Protocol):
         """
         ...
 
+    async def get_user_json_by_id(
+        self: Self,
+        user_id: int,
+    ) -> bytes:
+        """Get data about the user serialized to JSON.
+
+        Cached users are returned without building the model.
+
+        Args:
+            user_id (int): ID to search for user data
+
+        Returns:
+            bytes: JSON of the user data.
+        """
+        ...
+
     async def find_user_by_nickname(
         self: Self,
         nickname: str,
@@ -51,6 +71,22 @@ class UsersServiceProtocol(Protocol):
         """
         ...
 
+    async def get_users_list_json(
+        self: Self,
+        users_id: list[int],
+    ) -> bytes:
+        """Get list user data serialized to JSON array.
+
+        Cached users are spliced into the array without building the models.
+
+        Args:
+            users_id (list[int]): list of user ID.
+
+        Returns:
+            bytes: JSON array of user data.
+        """
+        ...
+
     @abstractmethod
     async def create_user(
         self: Self,
@@ -66,6 +102,24 @@ class UsersServiceProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def create_users(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> List[CreateUserResult]:
+        """Add several new users at once.
+
+        The users conflicting with the existing ones or with each other
+        are skipped, the others are added.
+
+        Args:
+            data (List[CreateUserRequest]): data of the users.
+
+        Returns:
+            List[CreateUserResult]: outcome of every user, in order.
+        """
+        ...
+
     @abstractmethod
     async def update_user(
         self: Self,
@@ -83,6 +137,24 @@ class UsersServiceProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def update_users(
+        self: Self,
+        data: List[UpdateUserRequest],
+    ) -> List[SInfoUser]:
+        """Update several users at once.
+
+        The last change of a user repeated in the data wins.
+
+        Args:
+            data (List[UpdateUserRequest]): new data of the users.
+
+        Returns:
+            List[SInfoUser]: updated users, the users not found
+                are left out.
+        """
+        ...
+
     @abstractmethod
     async def delete_user(
         self: Self,
@@ -94,3 +166,18 @@ class UsersServiceProtocol(Protocol):
             user_id (int): user id.
         """
         ...
+
+    @abstractmethod
+    async def delete_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[int]:
+        """Delete several user accounts at once.
+
+        Args:
+            users_id (List[int]): IDs of the users.
+
+        Returns:
+            List[int]: IDs of the deleted users.
+        """
+        ...
@@ -2,9 +2,13 @@
 Module for users use case implementation.
 """
 
-from typing import Any, Dict, Self
+from typing import Any, Dict, List, Self
 
-from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
+from users_management.app.schemas.responses import CreateUserResult
 from users_management.app.schemas.users import SInfoUser
 from users_management.app.services import UsersServiceProtocol
 from users_management.app.use_cases import UsersUseCaseProtocol
@@ -24,6 +28,12 @@ class UsersUseCaseImpl(UsersUseCaseProtocol):
         user = await self._users_service.get_user_by_id(user_id)
         return user
 
+    async def get_user_json_by_id(
+        self: Self,
+        user_id: int,
+    ) -> bytes:
+        return await self._users_service.get_user_json_by_id(user_id)
+
     async def find_user_by_nickname(
         self: Self,
         nickname: str,
@@ -37,12 +47,24 @@ class UsersUseCaseImpl(UsersUseCaseProtocol):
         users_data = await self._users_service.get_users_list(users_id)
         return users_data
 
+    async def get_list_users_json_by_id(
+        self: Self,
+        users_id: list[int],
+    ) -> bytes:
+        return await self._users_service.get_users_list_json(users_id)
+
     async def create_user(
         self: Self,
         data: CreateUserRequest,
     ) -> SInfoUser:
         return await self._users_service.create_user(data)
 
+    async def create_users(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> List[CreateUserResult]:
+        return await self._users_service.create_users(data)
+
     async def update_user(
         self: Self,
         user_id: int,
@@ -50,8 +72,20 @@ class UsersUseCaseImpl(UsersUseCaseProtocol):
     ) -> SInfoUser:
         return await self._users_service.update_user(user_id, data)
 
+    async def update_users(
+        self: Self,
+        data: List[UpdateUserRequest],
+    ) -> List[SInfoUser]:
+        return await self._users_service.update_users(data)
+
     async def delete_user(
         self: Self,
         user_id: int,
     ) -> None:
         await self._users_service.delete_user(user_id)
+
+    async def delete_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[int]:
+        return await self._users_service.delete_users(users_id)
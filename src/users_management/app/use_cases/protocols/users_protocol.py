@@ -3,9 +3,13 @@ Module for users use case description.
 """
 
 from abc import abstractmethod
-from typing import Any, Dict, Protocol, Self
+from typing import Any, Dict, List, Protocol, Self
 
-from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
+from users_management.app.schemas.responses import CreateUserResult
 from users_management.app.schemas.users import SInfoUser
 
 
@@ -26,6 +30,20 @@ class UsersUseCaseProtocol(Protocol):
         """
         ...
 
+    async def get_user_json_by_id(
+        self: Self,
+        user_id: int,
+    ) -> bytes:
+        """Get information about the user serialized to JSON.
+
+        Args:
+            user_id (int): argument to search for user data
+
+        Returns:
+            bytes: JSON of the user model.
+        """
+        ...
+
     async def find_user_by_nickname(
         self: Self,
         nickname: str,
@@ -52,6 +70,20 @@ class UsersUseCaseProtocol(Protocol):
         """
         ...
 
+    async def get_list_users_json_by_id(
+        self: Self,
+        users_id: list[int],
+    ) -> bytes:
+        """Get information about the users serialized to JSON array.
+
+        Args:
+            users_id (list[int]): arguments to search for users data
+
+        Returns:
+            bytes: JSON array of users data.
+        """
+        ...
+
     @abstractmethod
     async def create_user(
         self: Self,
@@ -67,6 +99,21 @@ class UsersUseCaseProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def create_users(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> List[CreateUserResult]:
+        """Add several new users.
+
+        Args:
+            data (List[CreateUserRequest]): data of the users.
+
+        Returns:
+            List[CreateUserResult]: outcome of every user, in order.
+        """
+        ...
+
     @abstractmethod
     async def update_user(
         self: Self,
@@ -84,6 +131,21 @@ class UsersUseCaseProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def update_users(
+        self: Self,
+        data: List[UpdateUserRequest],
+    ) -> List[SInfoUser]:
+        """Update several users.
+
+        Args:
+            data (List[UpdateUserRequest]): new data of the users.
+
+        Returns:
+            List[SInfoUser]: updated users.
+        """
+        ...
+
     @abstractmethod
     async def delete_user(
         self: Self,
@@ -95,3 +157,18 @@ class UsersUseCaseProtocol(Protocol):
             user_id (int): user id.
         """
         ...
+
+    @abstractmethod
+    async def delete_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[int]:
+        """Delete several user accounts.
+
+        Args:
+            users_id (List[int]): IDs of the users.
+
+        Returns:
+            List[int]: IDs of the deleted users.
+        """
+        ...
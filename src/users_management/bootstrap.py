@@ -7,7 +7,14 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI
 
-from users_management.app.depends import RedisManager, SQLDBHelper
+from users_management.app.depends import (
+    CacheInvalidationListener,
+    HotUsersFlusher,
+    RedisManager,
+    SQLDBHelper,
+    UsersCacheNamespace,
+)
+from users_management.app.depends.services import get_users_cache_warmer
 from users_management.core import setup_logging
 from users_management.core.settings import settings
 from users_management.exceptions import apply_exceptions_handlers
@@ -23,8 +30,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     setup_logging(paths=settings.paths)
     SQLDBHelper.startup()
     RedisManager.startup()
+    await UsersCacheNamespace.refresh()
+    UsersCacheNamespace.startup()
+    if settings.local_cache.ENABLED:
+        CacheInvalidationListener.startup()
+    if settings.warm_up.ENABLED:
+        # bounded by the time budget, the readiness waits for it
+        await get_users_cache_warmer().warm_up()
+        HotUsersFlusher.startup()
     yield
     # shutdown
+    await HotUsersFlusher.shutdown()
+    await UsersCacheNamespace.shutdown()
+    await CacheInvalidationListener.shutdown()
     await SQLDBHelper.shutdown()
     await RedisManager.shutdown()
 
@@ -0,0 +1,51 @@
+"""
+Administrative command invalidating the whole users cache.
+
+Bumps the generation of the cache keys: the workers switch to the new keys
+within REDIS_CACHE_GENERATION_REFRESH_INTERVAL seconds, the entries of the
+previous generation expire by their TTL.
+
+Usage:
+    python -m users_management.commands.bump_cache_generation
+"""
+
+import argparse
+import asyncio
+import logging
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.settings import settings
+from users_management.gateways.connections.impls.redis import (
+    RedisConnectionManagerImpl,
+)
+from users_management.gateways.connections.impls.redis_cache_namespace import (
+    RedisCacheNamespaceImpl,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+async def bump() -> str:
+    redis_manager = RedisConnectionManagerImpl(config=settings.redis)
+    redis_manager.startup()
+    try:
+        namespace = RedisCacheNamespaceImpl(
+            redis_manager=redis_manager, config=settings.redis, schema=SInfoUser
+        )
+        await namespace.bump()
+        return namespace.version
+    finally:
+        await redis_manager.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    version = asyncio.run(bump())
+    print(f"Users cache namespace is switched to {version}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Administrative command rebuilding the nicknames Bloom filter.
+
+Streams every nickname from the database with a server-side cursor into a
+fresh bitmap and atomically replaces the live filter with it.
+
+Usage:
+    python -m users_management.commands.rebuild_nicknames_bloom \
+        [--batch-size 10000]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from users_management.core.settings import settings
+from users_management.gateways.connections.impls.redis import (
+    RedisConnectionManagerImpl,
+)
+from users_management.gateways.connections.impls.sql import (
+    SQLDatabaseManagerImpl,
+)
+from users_management.gateways.repositories.impls.nicknames_bloom import (
+    NicknamesBloomFilterRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.users import (
+    UsersRepositoryImpl,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+async def rebuild(batch_size: int) -> int:
+    sql_db_helper = SQLDatabaseManagerImpl(config=settings.sql_db)
+    redis_manager = RedisConnectionManagerImpl(config=settings.redis)
+    sql_db_helper.startup()
+    redis_manager.startup()
+    try:
+        nicknames_filter = NicknamesBloomFilterRepositoryImpl(
+            redis=redis_manager.get_connection(), config=settings.redis
+        )
+        async with sql_db_helper.get_connection()() as session:
+            users_repository = UsersRepositoryImpl(session=session)
+            return await nicknames_filter.rebuild(
+                users_repository.stream_nicknames(batch_size)
+            )
+    finally:
+        await sql_db_helper.shutdown()
+        await redis_manager.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    count = asyncio.run(rebuild(args.batch_size))
+    print(f"Nicknames filter is rebuilt with {count} nicknames.")
+
+
+if __name__ == "__main__":
+    main()
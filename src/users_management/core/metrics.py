@@ -0,0 +1,103 @@
+"""
+In-process application metrics.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+import math
+from typing import Callable, Dict, List, Optional, Self, Sequence, Tuple
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets.
+
+    Args:
+        buckets (Sequence[float]): upper bounds of the buckets.
+    """
+
+    def __init__(self: Self, buckets: Sequence[float]) -> None:
+        self._bounds: List[float] = [*sorted(buckets), math.inf]
+        self._counts: List[int] = [0] * len(self._bounds)
+        self._sum: float = 0.0
+        self._count: int = 0
+
+    def observe(self: Self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def snapshot(
+        self: Self,
+        name: str,
+        labels: str = "",
+    ) -> List[Tuple[str, float]]:
+        """Cumulative bucket counts, sum and count of the values.
+
+        Args:
+            name (str): metric name.
+            labels (str): rendered labels of the histogram, e.g. 'a="b"'.
+        """
+        values: List[Tuple[str, float]] = []
+        cumulative = 0
+        prefix = f"{labels}," if labels else ""
+        for bound, count in zip(self._bounds, self._counts):
+            cumulative += count
+            le = "+Inf" if bound == math.inf else f"{bound:g}"
+            values.append((f'{name}_bucket{{{prefix}le="{le}"}}', cumulative))
+        suffix = f"{{{labels}}}" if labels else ""
+        values.append((f"{name}_sum{suffix}", self._sum))
+        values.append((f"{name}_count{suffix}", self._count))
+        return values
+
+
+class MetricsRegistry:
+    """Registry of process-local counters, gauges and histograms.
+
+    Every worker process keeps its own registry, values are not aggregated
+    between uvicorn workers.
+    """
+
+    def __init__(self: Self) -> None:
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+
+    def inc(self: Self, name: str, value: int = 1) -> None:
+        """Increase the counter by value."""
+        self._counters[name] += value
+
+    def register_gauge(
+        self: Self, name: str, func: Callable[[], float]
+    ) -> None:
+        """Register a callable evaluated on every snapshot."""
+        self._gauges[name] = func
+
+    def observe(
+        self: Self,
+        name: str,
+        value: float,
+        buckets: Sequence[float],
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Add the value to the histogram of the labels, created with
+        the buckets on the first observation."""
+        rendered = ",".join(
+            f'{label}="{text}"' for label, text in (labels or {}).items()
+        )
+        histogram = self._histograms.get((name, rendered))
+        if histogram is None:
+            histogram = Histogram(buckets)
+            self._histograms[(name, rendered)] = histogram
+        histogram.observe(value)
+
+    def snapshot(self: Self) -> Dict[str, float]:
+        """Current values of all counters, gauges and histograms."""
+        values: Dict[str, float] = dict(self._counters)
+        for name, func in self._gauges.items():
+            values[name] = func()
+        for (name, labels), histogram in self._histograms.items():
+            values.update(histogram.snapshot(name, labels))
+        return values
+
+
+metrics: MetricsRegistry = MetricsRegistry()  # Global metrics registry.
@@ -4,7 +4,7 @@ Application config.
 
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 from pydantic import BaseModel
 from sqlalchemy import URL
@@ -25,6 +25,8 @@ class ApiPrefix(BaseModel):
     v1_prefix: str = "/v1"
     users: str = "/users"
     nicknames: str = users + "/nicknames"
+    users_bulk: str = users + "/bulk"
+    metrics: str = "/metrics"
 
 
 class SQLDatabaseConfig(BaseModel):
@@ -69,20 +71,164 @@ class RedisConfig(BaseModel):
     CACHE_DB: int = int(os.getenv("REDIS_CACHE_DB", "0"))
     USERNAME: str = os.getenv("REDIS_USERNAME", "guest")
     PASSWORD: str = os.getenv("REDIS_PASSWORD", "guest")
+    # comma-separated URLs of the nodes sharing the keys by consistent
+    # hashing, the single node above is used if empty
+    SHARD_URLS: List[str] = [
+        url for url in os.getenv("REDIS_SHARD_URLS", "").split(",") if url
+    ]
+    SHARD_REPLICAS: int = int(os.getenv("REDIS_SHARD_REPLICAS", "160"))
+    # comma-separated URLs of the replicas of the single node serving
+    # the reads, or host:port addresses of Sentinels discovering them
+    REPLICA_URLS: List[str] = [
+        url for url in os.getenv("REDIS_REPLICA_URLS", "").split(",") if url
+    ]
+    SENTINEL_ADDRESSES: List[str] = [
+        address
+        for address in os.getenv("REDIS_SENTINEL_ADDRESSES", "").split(",")
+        if address
+    ]
+    SENTINEL_SERVICE: str = os.getenv("REDIS_SENTINEL_SERVICE", "mymaster")
+    # seconds a failed replica is not read from
+    REPLICA_RETRY_INTERVAL: float = float(
+        os.getenv("REDIS_REPLICA_RETRY_INTERVAL", "5")
+    )
 
     CACHE_LIFETIME: int = int(os.getenv("REDIS_CACHE_LIFETIME", "5"))
+    # reads prolong the lifetime of the entries, which are not served
+    # longer than CACHE_MAX_LIFETIME seconds after being written
+    SLIDING_TTL_ENABLED: bool = bool(
+        int(os.getenv("REDIS_SLIDING_TTL_ENABLED", "0"))
+    )
+    CACHE_MAX_LIFETIME: int = int(os.getenv("REDIS_CACHE_MAX_LIFETIME", "3600"))
+    # random spread of the lifetimes, fraction of the lifetime: 0.1 - ±10%
+    CACHE_LIFETIME_JITTER: float = float(
+        os.getenv("REDIS_CACHE_LIFETIME_JITTER", "0.1")
+    )
+    # scale the lifetimes by the read frequency of the keys: keys read
+    # ADAPTIVE_TTL_HOT_READS times recently keep CACHE_LIFETIME,
+    # colder and hotter keys get down to MIN and up to MAX factor of it
+    ADAPTIVE_TTL_ENABLED: bool = bool(
+        int(os.getenv("REDIS_ADAPTIVE_TTL_ENABLED", "0"))
+    )
+    ADAPTIVE_TTL_MIN_FACTOR: float = float(
+        os.getenv("REDIS_ADAPTIVE_TTL_MIN_FACTOR", "0.5")
+    )
+    ADAPTIVE_TTL_MAX_FACTOR: float = float(
+        os.getenv("REDIS_ADAPTIVE_TTL_MAX_FACTOR", "4")
+    )
+    ADAPTIVE_TTL_HOT_READS: int = int(
+        os.getenv("REDIS_ADAPTIVE_TTL_HOT_READS", "16")
+    )
+    # entries older than the soft lifetime (in seconds) are served stale
+    # and refreshed in the background, 0 - soft expiry equals hard expiry
+    CACHE_SOFT_LIFETIME: int = int(os.getenv("REDIS_CACHE_SOFT_LIFETIME", "0"))
+    XFETCH_BETA: float = float(os.getenv("REDIS_XFETCH_BETA", "1.0"))
+    # lifetime of the entries of missing values, in seconds, 0 - disabled
+    NEGATIVE_CACHE_LIFETIME: int = int(
+        os.getenv("REDIS_NEGATIVE_CACHE_LIFETIME", "30")
+    )
+    # codec of the written entries: json, struct
+    CACHE_CODEC: str = os.getenv("REDIS_CACHE_CODEC", "json")
+    # layout of the user entries: string - a key per user,
+    # hash - users packed into hashes of CACHE_BUCKET_SIZE users; keep it
+    # under hash-max-listpack-entries and the entries under
+    # hash-max-listpack-value (fits the struct codec) to stay compact,
+    # fields - a hash per user with versioned fields, updated field by field
+    CACHE_LAYOUT: str = os.getenv("REDIS_CACHE_LAYOUT", "string")
+    CACHE_BUCKET_SIZE: int = int(os.getenv("REDIS_CACHE_BUCKET_SIZE", "100"))
+
+    # Bloom filter answering nickname availability without the database
+    NICKNAMES_BLOOM_ENABLED: bool = bool(
+        int(os.getenv("REDIS_NICKNAMES_BLOOM_ENABLED", "0"))
+    )
+    NICKNAMES_BLOOM_SIZE: int = int(
+        os.getenv("REDIS_NICKNAMES_BLOOM_SIZE", "16777216")  # bits
+    )
+    NICKNAMES_BLOOM_HASHES: int = int(
+        os.getenv("REDIS_NICKNAMES_BLOOM_HASHES", "7")
+    )
+
+    # the keys generation, bumped to drop the whole cache, is re-read
+    # by the workers every interval, in seconds
+    CACHE_GENERATION_REFRESH_INTERVAL: float = float(
+        os.getenv("REDIS_CACHE_GENERATION_REFRESH_INTERVAL", "5")
+    )
+
+    # cache-fill lease protecting the database from stampedes, in ms
+    LEASE_ENABLED: bool = bool(int(os.getenv("REDIS_LEASE_ENABLED", "0")))
+    LEASE_TTL: int = int(os.getenv("REDIS_LEASE_TTL", "2000"))
+    LEASE_WAIT: int = int(os.getenv("REDIS_LEASE_WAIT", "500"))
+    LEASE_POLL_INTERVAL: int = int(os.getenv("REDIS_LEASE_POLL_INTERVAL", "25"))
+
+    # seconds to wait for a connection and for a reply, bounding the
+    # latency a failing Redis adds to the requests
+    SOCKET_CONNECT_TIMEOUT: float = float(
+        os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "1")
+    )
+    SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1"))
+    # skip the cache calls after a number of failures in a row and serve
+    # the requests from the database, for the reset timeout (in seconds)
+    # before a probe call; skipped invalidations are replayed once the
+    # cache recovers, the whole cache is dropped if more were skipped
+    BREAKER_ENABLED: bool = bool(int(os.getenv("REDIS_BREAKER_ENABLED", "0")))
+    BREAKER_FAILURE_THRESHOLD: int = int(
+        os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", "5")
+    )
+    BREAKER_RESET_TIMEOUT: float = float(
+        os.getenv("REDIS_BREAKER_RESET_TIMEOUT", "10")
+    )
+    BREAKER_MAX_DEFERRED: int = int(
+        os.getenv("REDIS_BREAKER_MAX_DEFERRED", "10000")
+    )
 
     @property
     def users_cache_url(self) -> str:
         return f"redis://{self.USERNAME}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.CACHE_DB}"
 
 
+class LocalCacheConfig(BaseModel):
+    """Config of the in-process users cache"""
+
+    ENABLED: bool = bool(int(os.getenv("LOCAL_CACHE_ENABLED", "0")))
+    MAX_SIZE: int = int(os.getenv("LOCAL_CACHE_MAX_SIZE", "10000"))
+    LIFETIME: int = int(os.getenv("LOCAL_CACHE_LIFETIME", "30"))  # seconds
+    INVALIDATION_CHANNEL: str = os.getenv(
+        "LOCAL_CACHE_INVALIDATION_CHANNEL", "users:cache:invalidation"
+    )
+    # how the entries changed by other workers are dropped: pubsub -
+    # the writers publish the keys on the channel above, tracking - Redis
+    # pushes the changed keys with TRACKING_PREFIXES (RESP3 client
+    # tracking in broadcast mode). Tracking covers the string and fields
+    # layouts, the hash layout falls back to the channel; reads prolonging
+    # sliding lifetimes change the keys too
+    INVALIDATION: str = os.getenv("LOCAL_CACHE_INVALIDATION", "pubsub")
+    TRACKING_PREFIXES: List[str] = os.getenv(
+        "LOCAL_CACHE_TRACKING_PREFIXES", "user:"
+    ).split(",")
+
+
+class CacheWarmUpConfig(BaseModel):
+    """Config of the users cache warm-up at startup"""
+
+    ENABLED: bool = bool(int(os.getenv("WARM_UP_ENABLED", "0")))
+    # hottest users loaded into the cache at startup
+    TOP_USERS: int = int(os.getenv("WARM_UP_TOP_USERS", "10000"))
+    BATCH_SIZE: int = int(os.getenv("WARM_UP_BATCH_SIZE", "1000"))
+    TIME_BUDGET: float = float(os.getenv("WARM_UP_TIME_BUDGET", "10"))  # sec
+    # read counts persisted in Redis, decayed by DECAY per FLUSH_INTERVAL
+    TRACKED_USERS: int = int(os.getenv("WARM_UP_TRACKED_USERS", "100000"))
+    FLUSH_INTERVAL: float = float(os.getenv("WARM_UP_FLUSH_INTERVAL", "60"))
+    DECAY: float = float(os.getenv("WARM_UP_DECAY", "0.9"))
+
+
 class Settings:
     mode: str = str(os.getenv("MODE", "PROD"))
     api_key: str = os.getenv("API_KEY", "secret")
     api: ApiPrefix = ApiPrefix()
     sql_db: SQLDatabaseConfig = SQLDatabaseConfig()
     redis: RedisConfig = RedisConfig()
+    local_cache: LocalCacheConfig = LocalCacheConfig()
+    warm_up: CacheWarmUpConfig = CacheWarmUpConfig()
     paths: Paths = Paths()
 
 
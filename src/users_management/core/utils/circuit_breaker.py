@@ -0,0 +1,204 @@
+"""A utils module for skipping the calls of a failing dependency."""
+
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from users_management.core.metrics import metrics
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Operation = Callable[[], Coroutine[Any, Any, T]]
+
+
+class CircuitState(IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+@dataclass(frozen=True, slots=True)
+class BreakerPolicy:
+    """Thresholds of a circuit breaker.
+
+    Attributes:
+        failure_threshold (int): failures in a row opening the circuit.
+        reset_timeout (float): seconds before the probe call.
+        max_deferred (int): maximum number of deferred operations.
+    """
+
+    failure_threshold: int
+    reset_timeout: float
+    max_deferred: int
+
+
+class CircuitBreaker:
+    """Stops calling a dependency after consecutive failures.
+
+    The circuit opens after ``failure_threshold`` failures in a row and
+    the calls are skipped for ``reset_timeout`` seconds. Then a single
+    probe call is let through: its success closes the circuit, its
+    failure opens it again.
+
+    Operations skipped while the circuit is open, e.g. invalidations,
+    are deferred and replayed once it closes. At most ``max_deferred``
+    of them are kept, ``on_overflow`` is called instead of the replay
+    if some were dropped.
+
+    Args:
+        name (str): prefix of the metrics names.
+        errors (Tuple[Type[Exception], ...]): failures of the dependency.
+        policy (BreakerPolicy): thresholds of the breaker.
+        on_overflow (Optional[Operation[Any]]): called if deferred
+            operations were dropped.
+        clock (Callable[[], float]): source of the time in seconds.
+    """
+
+    def __init__(
+        self: Self,
+        name: str,
+        errors: Tuple[Type[Exception], ...],
+        policy: BreakerPolicy,
+        on_overflow: Optional[Operation[Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._name = name
+        self._errors = errors
+        self._failure_threshold = policy.failure_threshold
+        self._reset_timeout = policy.reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._opened = False
+        self._probing = False
+        self._deferred: Deque[Operation[Any]] = deque(
+            maxlen=policy.max_deferred
+        )
+        self._overflowed = False
+        self._on_overflow = on_overflow
+        self._clock = clock
+
+    @property
+    def state(self: Self) -> CircuitState:
+        if not self._opened:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at < self._reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def allow(self: Self) -> bool:
+        """Whether the call may go to the dependency."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            log.info("Circuit %s lets a probe call through.", self._name)
+            self._probing = True
+            return True
+        metrics.inc(f"{self._name}_skipped_calls")
+        return False
+
+    def record_success(self: Self, probe: bool) -> bool:
+        """Register a successful call, True if it closed the circuit.
+
+        Only the probe closes an open circuit: a call started before
+        the circuit opened says nothing about the dependency now.
+        """
+        self._failures = 0
+        if not (self._opened and probe):
+            return False
+        self._opened = self._probing = False
+        log.warning("Circuit %s is closed.", self._name)
+        return True
+
+    def record_failure(self: Self, probe: bool = False) -> None:
+        self._failures += 1
+        if probe or (
+            not self._opened and self._failures >= self._failure_threshold
+        ):
+            log.warning("Circuit %s is opened.", self._name)
+            metrics.inc(f"{self._name}_opened")
+            self._opened = True
+            self._opened_at = self._clock()
+            self._probing = False
+
+    async def call(
+        self: Self,
+        operation: Operation[T],
+        fallback: T,
+        invalidation: Optional[Operation[Any]] = None,
+    ) -> T:
+        """Run the operation unless the circuit is open.
+
+        Args:
+            operation (Operation[T]): call of the dependency.
+            fallback (T): result if the call is skipped or fails.
+            invalidation (Optional[Operation[Any]]): deferred if the call
+                is skipped or fails, e.g. to drop what it failed to update.
+
+        Returns:
+            T: result of the operation or the fallback.
+        """
+        if not self.allow():
+            if invalidation:
+                self.defer(invalidation)
+            return fallback
+        probe = self._probing
+        try:
+            result = await operation()
+        except self._errors:
+            log.warning("Call of %s failed.", self._name, exc_info=True)
+            self.record_failure(probe)
+            if invalidation:
+                self.defer(invalidation)
+            return fallback
+        except BaseException as e:
+            # the probe must end or no other call is ever let through
+            if probe and isinstance(e, Exception):
+                self.record_failure(probe)
+            elif probe:
+                log.info("Probe call of %s was cancelled.", self._name)
+                self._probing = False
+            raise
+        if self.record_success(probe):
+            await self._replay_deferred()
+        return result
+
+    def defer(self: Self, operation: Operation[Any]) -> None:
+        """Keep the operation until the circuit closes."""
+        if len(self._deferred) == self._deferred.maxlen:
+            self._overflowed = True
+        self._deferred.append(operation)
+
+    async def _replay_deferred(self: Self) -> None:
+        deferred, overflowed = list(self._deferred), self._overflowed
+        self._deferred.clear()
+        self._overflowed = False
+        try:
+            if overflowed and self._on_overflow:
+                log.warning("Deferred calls of %s were dropped.", self._name)
+                await self._on_overflow()
+                return
+            log.info("Replaying %s deferred calls.", len(deferred))
+            for operation in deferred:
+                await operation()
+        except self._errors:
+            log.warning("Replay of %s failed.", self._name, exc_info=True)
+            self.record_failure()
+            self._overflowed = overflowed
+            self._deferred.extend(deferred)
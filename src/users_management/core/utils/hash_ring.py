@@ -0,0 +1,51 @@
+"""A utils module for distributing keys between nodes."""
+
+from bisect import bisect
+import hashlib
+from typing import List, Self, Sequence, Union
+
+
+class HashRing:
+    """Consistent-hash ring: adding or removing a node moves only
+    the keys of that node.
+
+    Every node owns ``replicas`` points of the ring, a key belongs to
+    the node of the first point after the key hash. Only the part of
+    the key in braces is hashed if present, so keys sharing such a tag
+    always live on the same node.
+
+    Args:
+        nodes (Sequence[str]): names of the nodes, their order is the
+            order of the node indexes.
+        replicas (int): points per node.
+    """
+
+    def __init__(self: Self, nodes: Sequence[str], replicas: int = 160) -> None:
+        points = sorted(
+            (self._hash(f"{node}#{replica}".encode()), index)
+            for index, node in enumerate(nodes)
+            for replica in range(replicas)
+        )
+        self._hashes: List[int] = [point for point, _ in points]
+        self._nodes: List[int] = [index for _, index in points]
+
+    def get_node(self: Self, key: Union[str, bytes]) -> int:
+        """Index of the node owning the key."""
+        if isinstance(key, str):
+            key = key.encode()
+        position = bisect(self._hashes, self._hash(self._hash_tag(key)))
+        return self._nodes[position % len(self._nodes)]
+
+    @staticmethod
+    def _hash_tag(key: bytes) -> bytes:
+        start = key.find(b"{")
+        if start == -1:
+            return key
+        end = key.find(b"}", start + 1)
+        if end <= start + 1:
+            return key
+        return key[start + 1 : end]
+
+    @staticmethod
+    def _hash(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest())
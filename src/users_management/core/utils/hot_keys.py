@@ -0,0 +1,31 @@
+"""A utils module for counting the reads of the hottest keys."""
+
+from collections import Counter
+from typing import Dict, Generic, Hashable, Self, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+class HotKeysCounter(Generic[K]):
+    """Read counts of the keys accumulated between flushes.
+
+    Once ``max_keys`` distinct keys are counted, reads of new keys are
+    dropped until the next flush: keys read that rarely are not hot.
+
+    Args:
+        max_keys (int): maximum number of counted keys.
+    """
+
+    def __init__(self: Self, max_keys: int) -> None:
+        self._max_keys = max_keys
+        self._reads: Counter[K] = Counter()
+
+    def record(self: Self, key: K) -> None:
+        if key in self._reads or len(self._reads) < self._max_keys:
+            self._reads[key] += 1
+
+    def drain(self: Self) -> Dict[K, int]:
+        """Counts accumulated since the previous drain."""
+        reads, self._reads = self._reads, Counter()
+        return dict(reads)
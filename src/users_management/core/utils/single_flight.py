@@ -0,0 +1,58 @@
+"""A utils module for coalescing concurrent calls."""
+
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, Dict, Generic, Self, TypeVar
+
+from users_management.core.metrics import metrics
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller starts the call in a separate task, the others wait for
+    its result. Cancellation of any caller does not cancel the shared call.
+
+    Args:
+        name (str): prefix of the metrics names.
+    """
+
+    def __init__(self: Self, name: str) -> None:
+        self._name = name
+        self._calls: Dict[str, asyncio.Task[T]] = {}
+
+    async def do(
+        self: Self,
+        key: str,
+        func: Callable[[], Coroutine[Any, Any, T]],
+    ) -> T:
+        """Wait for the result of the shared call."""
+        return await asyncio.shield(self.start(key, func))
+
+    def start(
+        self: Self,
+        key: str,
+        func: Callable[[], Coroutine[Any, Any, T]],
+    ) -> asyncio.Task[T]:
+        """Start the shared call without waiting for it."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            metrics.inc(f"{self._name}_leaders")
+        else:
+            log.debug("Call coalesced by key: %s.", key)
+            metrics.inc(f"{self._name}_coalesced")
+        return task
+
+    def _forget(self: Self, key: str, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled() and (exc := task.exception()):
+            log.debug("Call by key %s failed: %r.", key, exc)
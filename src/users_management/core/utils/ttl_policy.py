@@ -0,0 +1,145 @@
+"""A utils module for choosing lifetimes of the cache entries."""
+
+from array import array
+from dataclasses import dataclass
+import math
+import random
+import sys
+from typing import Optional, Self, Tuple
+
+from users_management.core.metrics import metrics
+
+
+class AccessCounter:
+    """Approximate per-key read counter of fixed size (count-min sketch).
+
+    Counters are halved every ``width * 8`` reads, so the estimates
+    follow the recent popularity of the keys.
+
+    Args:
+        width (int): counters per row, a power of two up to 2 ** 16.
+    """
+
+    DEPTH = 4
+
+    def __init__(self: Self, width: int = 2**16) -> None:
+        self._mask = width - 1
+        self._width = width
+        self._rows = [array("I", bytes(4 * width)) for _ in range(self.DEPTH)]
+        self._reads = 0
+        self._aging_period = width * 8
+        # clears the bit every counter receives from its neighbour
+        self._halving_mask = int.from_bytes(
+            array("I", [0x7FFFFFFF] * width).tobytes(), sys.byteorder
+        )
+
+    def add(self: Self, key: str) -> None:
+        positions = self._positions(key)
+        for row, position in zip(self._rows, positions):
+            row[position] += 1
+        self._reads += 1
+        if self._reads >= self._aging_period:
+            self._age()
+
+    def estimate(self: Self, key: str) -> int:
+        return min(
+            row[position]
+            for row, position in zip(self._rows, self._positions(key))
+        )
+
+    def _positions(self: Self, key: str) -> Tuple[int, ...]:
+        digest = hash(key)
+        return tuple(
+            (digest >> (16 * i)) & self._mask for i in range(self.DEPTH)
+        )
+
+    def _age(self: Self) -> None:
+        """Halve all counters at once, shifting every row as one integer."""
+        for row in self._rows:
+            counters = int.from_bytes(row.tobytes(), sys.byteorder)
+            counters = (counters >> 1) & self._halving_mask
+            row[:] = array(
+                "I", counters.to_bytes(4 * self._width, sys.byteorder)
+            )
+        self._reads = 0
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveTTL:
+    """Scaling of the lifetime by the read frequency of the key.
+
+    A key read ``hot_reads`` times recently keeps the base lifetime,
+    colder keys get down to ``min_factor`` of it, hotter up to
+    ``max_factor``.
+
+    Attributes:
+        min_factor (float): lifetime factor of never read keys.
+        max_factor (float): lifetime factor of the hottest keys.
+        hot_reads (int): reads keeping the base lifetime.
+    """
+
+    min_factor: float = 1.0
+    max_factor: float = 1.0
+    hot_reads: int = 1
+
+
+class CacheTTLPolicy:
+    """Lifetimes of the cache entries, spread randomly and, if adaptive,
+    scaled by the read frequency of the key.
+
+    Args:
+        lifetime (int): base lifetime in seconds.
+        soft_lifetime (int): base soft lifetime in seconds.
+        jitter (float): random spread, fraction of the lifetime.
+        adaptive (Optional[AdaptiveTTL]): scaling by the read frequency,
+            None to keep the base lifetime.
+    """
+
+    BUCKETS = (10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200)
+
+    def __init__(
+        self: Self,
+        lifetime: int,
+        soft_lifetime: int,
+        jitter: float = 0.0,
+        adaptive: Optional[AdaptiveTTL] = None,
+    ) -> None:
+        self.lifetime = lifetime
+        self.soft_lifetime = soft_lifetime
+        self._jitter = jitter
+        self._adaptive = adaptive is not None
+        adaptive = adaptive or AdaptiveTTL()
+        self._min_factor = adaptive.min_factor
+        self._max_factor = adaptive.max_factor
+        self._hot_reads_log = math.log2(1 + adaptive.hot_reads)
+        self._counter = AccessCounter()
+        self.max_lifetime: int = math.ceil(
+            lifetime * max(1.0, self._max_factor) * (1 + jitter)
+        )
+
+    def record_access(self: Self, key: str) -> None:
+        if self._adaptive:
+            self._counter.add(key)
+
+    def lifetimes(self: Self, key: str) -> Tuple[int, float]:
+        """Lifetime and soft lifetime of the entry written now.
+
+        The jitter is applied to both, the read frequency to the lifetime
+        only: hot entries outlive their soft expiry and are refreshed
+        in the background instead of missing.
+        """
+        spread = random.uniform(1 - self._jitter, 1 + self._jitter)
+        factor = self._factor(key) if self._adaptive else 1.0
+        lifetime = max(1, round(self.lifetime * factor * spread))
+        metrics.observe("users_cache_ttl_seconds", lifetime, self.BUCKETS)
+        return lifetime, min(self.soft_lifetime * spread, lifetime)
+
+    def sliding_lifetime(self: Self, key: str) -> int:
+        """Lifetime an entry is prolonged to when read."""
+        factor = self._factor(key) if self._adaptive else 1.0
+        return max(1, round(self.lifetime * factor))
+
+    def _factor(self: Self, key: str) -> float:
+        reads = self._counter.estimate(key)
+        factor = math.log2(1 + reads) / self._hot_reads_log
+        return min(self._max_factor, max(self._min_factor, factor))
@@ -0,0 +1,4 @@
+from .protocols.layout_protocol import CacheLayoutProtocol
+
+
+__all__ = ("CacheLayoutProtocol",)
@@ -0,0 +1,105 @@
+"""Layout packing bucketed entries into small Redis hashes."""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Self, Sequence, Tuple
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+from users_management.gateways.cache_layouts import CacheLayoutProtocol
+from users_management.gateways.key_builders import split_bucketed_key
+
+
+class HashCacheLayoutImpl(CacheLayoutProtocol):
+    """Stores bucketed keys as fields of their bucket hash.
+
+    Small buckets are kept by Redis in the compact listpack encoding,
+    which saves the per-key overhead. Fields have no own lifetime: the
+    bucket expires as a whole, prolonged by every write, and staleness
+    of the fields is decided by the stamps in the entries.
+    Keys that are not bucketed are stored as plain strings.
+
+    Args:
+        lifetime (int): lifetime of a bucket in seconds.
+    """
+
+    def __init__(self: Self, lifetime: int) -> None:
+        self._lifetime = lifetime
+
+    def queue_set(
+        self: Self,
+        pipeline: Pipeline,
+        values: Dict[str, bytes],
+        ex: int,
+    ) -> None:
+        buckets: Dict[str, Dict[str, bytes]] = defaultdict(dict)
+        for key, value in values.items():
+            bucket, field = split_bucketed_key(key)
+            if field is None:
+                pipeline.set(key, value, ex=ex)
+            else:
+                buckets[bucket][field] = value
+        for bucket, fields in buckets.items():
+            pipeline.hset(bucket, mapping=fields)
+            pipeline.expire(bucket, self._lifetime)
+
+    def queue_delete(
+        self: Self,
+        pipeline: Pipeline,
+        keys: Sequence[str],
+    ) -> None:
+        plain_keys, buckets = self._group(keys)
+        if plain_keys:
+            pipeline.unlink(*(key for _, key in plain_keys))
+        for bucket, fields in buckets.items():
+            pipeline.hdel(bucket, *(field for _, field in fields))
+
+    async def get(
+        self: Self,
+        redis: redis.Redis,
+        keys: Sequence[str],
+        lifetimes: Optional[Sequence[int]] = None,
+    ) -> List[Optional[bytes]]:
+        """Plain keys are prolonged to their lifetimes,
+        buckets to the bucket lifetime."""
+        if len(keys) == 1 and lifetimes is None:
+            bucket, field = split_bucketed_key(keys[0])
+            if field is None:
+                return [await redis.get(bucket)]
+            return [await redis.hget(bucket, field)]
+        plain_keys, buckets = self._group(keys)
+        pipeline = redis.pipeline(transaction=False)
+        groups: List[List[Tuple[int, str]]] = []
+        if plain_keys:
+            groups.append(plain_keys)
+            pipeline.mget([key for _, key in plain_keys])
+        for bucket, fields in buckets.items():
+            groups.append(fields)
+            pipeline.hmget(bucket, [field for _, field in fields])
+        if lifetimes is not None:
+            for position, key in plain_keys:
+                pipeline.expire(key, lifetimes[position])
+            for bucket in buckets:
+                pipeline.expire(bucket, self._lifetime)
+        results = await pipeline.execute()
+        values: List[Optional[bytes]] = [None] * len(keys)
+        for group, group_values in zip(groups, results):
+            for (position, _), value in zip(group, group_values):
+                values[position] = value
+        return values
+
+    def _group(
+        self: Self,
+        keys: Sequence[str],
+    ) -> Tuple[List[Tuple[int, str]], Dict[str, List[Tuple[int, str]]]]:
+        """Split keys into plain keys and fields by buckets,
+        remembering their positions."""
+        plain_keys: List[Tuple[int, str]] = []
+        buckets: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for position, key in enumerate(keys):
+            bucket, field = split_bucketed_key(key)
+            if field is None:
+                plain_keys.append((position, key))
+            else:
+                buckets[bucket].append((position, field))
+        return plain_keys, buckets
@@ -0,0 +1,45 @@
+"""Layout storing every entry under its own string key."""
+
+from typing import Dict, List, Optional, Self, Sequence
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+from users_management.gateways.cache_layouts import CacheLayoutProtocol
+
+
+class StringCacheLayoutImpl(CacheLayoutProtocol):
+    def queue_set(
+        self: Self,
+        pipeline: Pipeline,
+        values: Dict[str, bytes],
+        ex: int,
+    ) -> None:
+        for key, value in values.items():
+            pipeline.set(key, value, ex=ex)
+
+    def queue_delete(
+        self: Self,
+        pipeline: Pipeline,
+        keys: Sequence[str],
+    ) -> None:
+        # the memory is reclaimed in the background
+        pipeline.unlink(*keys)
+
+    async def get(
+        self: Self,
+        redis: redis.Redis,
+        keys: Sequence[str],
+        lifetimes: Optional[Sequence[int]] = None,
+    ) -> List[Optional[bytes]]:
+        if lifetimes is None:
+            if len(keys) == 1:
+                return [await redis.get(keys[0])]
+            return await redis.mget(keys)
+        if len(keys) == 1:
+            return [await redis.getex(keys[0], ex=lifetimes[0])]
+        # a pipeline, unlike a script, is split between the shards
+        pipeline = redis.pipeline(transaction=False)
+        for key, lifetime in zip(keys, lifetimes):
+            pipeline.getex(key, ex=lifetime)
+        return await pipeline.execute()
@@ -0,0 +1,69 @@
+"""
+Module describing the interface of the cache storage layout.
+"""
+
+from abc import abstractmethod
+from typing import Dict, List, Optional, Protocol, Self, Sequence
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+
+class CacheLayoutProtocol(Protocol):
+    """Placement of the cache entries in Redis data structures.
+
+    Keys stay opaque to the cache repository, the layout decides
+    which Redis key and structure holds the entry of every key.
+    """
+
+    @abstractmethod
+    def queue_set(
+        self: Self,
+        pipeline: Pipeline,
+        values: Dict[str, bytes],
+        ex: int,
+    ) -> None:
+        """Queue writing of the entries.
+
+        Args:
+            pipeline (Pipeline): pipeline the commands are queued in.
+            values (Dict[str, bytes]): entries by keys.
+            ex (int): lifetime of the entries in seconds.
+        """
+        ...
+
+    @abstractmethod
+    def queue_delete(
+        self: Self,
+        pipeline: Pipeline,
+        keys: Sequence[str],
+    ) -> None:
+        """Queue deletion of the entries, without blocking the server
+        on freeing their memory.
+
+        Args:
+            pipeline (Pipeline): pipeline the commands are queued in.
+            keys (Sequence[str]): keys of the entries.
+        """
+        ...
+
+    @abstractmethod
+    async def get(
+        self: Self,
+        redis: redis.Redis,
+        keys: Sequence[str],
+        lifetimes: Optional[Sequence[int]] = None,
+    ) -> List[Optional[bytes]]:
+        """Read the entries in as few round trips as possible.
+
+        Args:
+            redis (redis.Redis): Redis instance.
+            keys (Sequence[str]): keys of the entries.
+            lifetimes (Optional[Sequence[int]]): lifetimes in seconds
+                the read entries are prolonged to, in the same round trip.
+
+        Returns:
+            List[Optional[bytes]]: entries aligned with the keys,
+                None for missing ones.
+        """
+        ...
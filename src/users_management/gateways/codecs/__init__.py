@@ -0,0 +1,4 @@
+from .protocols.codec_protocol import CacheCodecProtocol
+
+
+__all__ = ("CacheCodecProtocol",)
@@ -0,0 +1,19 @@
+"""JSON codec of the cached users."""
+
+from typing import Self
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.gateways.codecs import CacheCodecProtocol
+
+
+class JSONUsersCodecImpl(CacheCodecProtocol[SInfoUser]):
+    tag = b"J"
+
+    def encode(self: Self, data: SInfoUser) -> bytes:
+        return data.model_dump_json().encode()
+
+    def decode(self: Self, payload: bytes) -> SInfoUser:
+        return SInfoUser.model_validate_json(payload)
+
+    def to_json(self: Self, payload: bytes) -> bytes:
+        return payload
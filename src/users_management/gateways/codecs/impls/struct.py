@@ -0,0 +1,34 @@
+"""Fixed struct packing codec of the cached users."""
+
+import json
+import struct
+from typing import Self
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.gateways.codecs import CacheCodecProtocol
+
+
+class StructUsersCodecImpl(CacheCodecProtocol[SInfoUser]):
+    """Packs user_id (int64) and avatar (bool) followed by UTF-8 nickname."""
+
+    tag = b"S"
+    HEADER = struct.Struct(">q?")
+
+    def encode(self: Self, data: SInfoUser) -> bytes:
+        return (
+            self.HEADER.pack(data.user_id, data.avatar) + data.nickname.encode()
+        )
+
+    def decode(self: Self, payload: bytes) -> SInfoUser:
+        user_id, avatar = self.HEADER.unpack_from(payload)
+        nickname = payload[self.HEADER.size :].decode()
+        return SInfoUser(user_id=user_id, nickname=nickname, avatar=avatar)
+
+    def to_json(self: Self, payload: bytes) -> bytes:
+        user_id, avatar = self.HEADER.unpack_from(payload)
+        nickname = payload[self.HEADER.size :].decode()
+        return json.dumps(
+            {"user_id": user_id, "nickname": nickname, "avatar": avatar},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
@@ -0,0 +1,55 @@
+"""
+Module describing the interface of the cached values codec.
+"""
+
+from abc import abstractmethod
+from typing import Protocol, Self, TypeVar
+
+
+T = TypeVar("T")
+
+
+class CacheCodecProtocol(Protocol[T]):
+    """Codec of the cached values.
+
+    The tag is written in front of every payload, so entries encoded
+    by different codecs can coexist in the cache.
+    """
+
+    tag: bytes
+
+    @abstractmethod
+    def encode(self: Self, data: T) -> bytes:
+        """Serialize the value.
+
+        Args:
+            data (T): value.
+
+        Returns:
+            bytes: payload without the tag.
+        """
+        ...
+
+    @abstractmethod
+    def decode(self: Self, payload: bytes) -> T:
+        """Deserialize the value.
+
+        Args:
+            payload (bytes): payload without the tag.
+
+        Returns:
+            T: value.
+        """
+        ...
+
+    @abstractmethod
+    def to_json(self: Self, payload: bytes) -> bytes:
+        """Convert the payload to JSON without building the value.
+
+        Args:
+            payload (bytes): payload without the tag.
+
+        Returns:
+            bytes: JSON representation of the value.
+        """
+        ...
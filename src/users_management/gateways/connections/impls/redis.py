@@ -1,18 +1,30 @@
 """Module related to connection to repositories."""
 
+import asyncio
+from itertools import chain
 import logging
-from typing import Self
+from typing import Awaitable, Callable, List, Optional, Self, Sequence, Tuple
+from urllib.parse import urlsplit
 
 import redis.asyncio as redis
+from redis.asyncio.connection import AbstractConnection
+from redis.asyncio.sentinel import Sentinel
 from redis.exceptions import RedisError
 
 from users_management.app.exceptions import (
     RedisCacheDBException,
 )
 from users_management.core.settings import RedisConfig
+from users_management.core.utils.hash_ring import HashRing
 from users_management.gateways.connections import (
     GatewayConnectionProtocol,
 )
+from users_management.gateways.connections.impls.redis_replicated import (
+    ReplicatedRedis,
+)
+from users_management.gateways.connections.impls.redis_sharded import (
+    ShardedRedis,
+)
 
 
 log = logging.getLogger(__name__)
@@ -21,38 +33,229 @@ log = logging.getLogger(__name__)
 class RedisConnectionManagerImpl(GatewayConnectionProtocol[redis.Redis]):
     """A class for getting an instance of the redis pool.
 
+    With several shard URLs configured the instance shards the keys
+    between the nodes by consistent hashing. Otherwise, with replicas
+    configured or discovered by Sentinel, it reads from the replicas.
+
+    The keys changed on the primary nodes can also be tracked, see
+    ``track``.
+
     Args:
         config (RedisConfig): Rdis config.
     """
 
     def __init__(self: Self, config: RedisConfig):
         self._config = config
-        self._url: str = self._config.users_cache_url
-        self._pool: redis.ConnectionPool
+        self._urls: List[str] = self._config.SHARD_URLS or [
+            self._config.users_cache_url
+        ]
+        self._pools: List[redis.ConnectionPool] = []
         self._redis: redis.Redis
 
     def startup(self: Self) -> None:
         """Redis pool creation."""
         try:
-            self._pool = redis.ConnectionPool.from_url(
-                self._url,
-                decode_responses=True,
-            )
-            log.info("Redis conn pool [%s] is created.", id(self._pool))
-            self._redis = redis.Redis(connection_pool=self._pool)
-            log.info("Redis instance [%s] is created.", id(self._redis))
+            if self._config.SENTINEL_ADDRESSES:
+                self._redis = self._create_sentinel_instance()
+                return
+            shards = [self._create_instance(url) for url in self._urls]
+            if len(shards) == 1 and self._config.REPLICA_URLS:
+                self._redis = self._create_replicated_instance(shards[0])
+            elif len(shards) == 1:
+                self._redis = shards[0]
+            else:
+                # a change of the credentials or the database number
+                # must not move the keys between the nodes
+                ring = HashRing(
+                    [self._endpoint(url) for url in self._urls],
+                    self._config.SHARD_REPLICAS,
+                )
+                self._redis = ShardedRedis(shards=shards, ring=ring)
+                log.info(
+                    "Redis instance [%s] shards %s nodes.",
+                    id(self._redis),
+                    len(shards),
+                )
         except RedisError as e:
             log.error("Failed to initialize redis.", exc_info=True)
             raise RedisCacheDBException(str(e))
 
+    def _create_instance(self: Self, url: str) -> redis.Redis:
+        pool = redis.ConnectionPool.from_url(
+            url,
+            decode_responses=False,
+            socket_timeout=self._config.SOCKET_TIMEOUT,
+            socket_connect_timeout=self._config.SOCKET_CONNECT_TIMEOUT,
+        )
+        self._pools.append(pool)
+        log.info("Redis conn pool [%s] is created.", id(pool))
+        instance = redis.Redis(connection_pool=pool)
+        log.info("Redis instance [%s] is created.", id(instance))
+        return instance
+
+    def _create_replicated_instance(
+        self: Self,
+        primary: redis.Redis,
+    ) -> redis.Redis:
+        replica_urls = self._config.REPLICA_URLS
+        instance = ReplicatedRedis(
+            primary=primary,
+            replicas=[self._create_instance(url) for url in replica_urls],
+            endpoints=[
+                self._endpoint(url) for url in (self._urls[0], *replica_urls)
+            ],
+            retry_interval=self._config.REPLICA_RETRY_INTERVAL,
+        )
+        log.info(
+            "Redis instance [%s] reads from %s replicas.",
+            id(instance),
+            len(replica_urls),
+        )
+        return instance
+
+    def _create_sentinel_instance(self: Self) -> redis.Redis:
+        service = self._config.SENTINEL_SERVICE
+        sentinel = Sentinel(
+            [
+                self._address(address)
+                for address in self._config.SENTINEL_ADDRESSES
+            ],
+            username=self._config.USERNAME,
+            password=self._config.PASSWORD,
+            db=self._config.CACHE_DB,
+            decode_responses=False,
+            socket_timeout=self._config.SOCKET_TIMEOUT,
+            socket_connect_timeout=self._config.SOCKET_CONNECT_TIMEOUT,
+        )
+        # the pools follow the failovers announced by Sentinel,
+        # the replicas pool falls back to the primary without replicas
+        primary = sentinel.master_for(service)
+        replicas = sentinel.slave_for(service)
+        self._pools += [primary.connection_pool, replicas.connection_pool]
+        instance = ReplicatedRedis(
+            primary=primary,
+            replicas=[replicas],
+            endpoints=[f"{service}/primary", f"{service}/replicas"],
+            retry_interval=self._config.REPLICA_RETRY_INTERVAL,
+        )
+        log.info(
+            "Redis instance [%s] follows Sentinel service %s.",
+            id(instance),
+            service,
+        )
+        return instance
+
+    def _primaries(self: Self) -> List[redis.Redis]:
+        if isinstance(self._redis, ShardedRedis):
+            return list(self._redis.shards)
+        if isinstance(self._redis, ReplicatedRedis):
+            return [self._redis.primary]
+        return [self._redis]
+
+    def _primary_pools(self: Self) -> List[redis.ConnectionPool]:
+        return [primary.connection_pool for primary in self._primaries()]
+
+    @staticmethod
+    def _create_tracking_connection(
+        pool: redis.ConnectionPool,
+    ) -> AbstractConnection:
+        # not pooled: it only waits for the pushes, as long as it takes
+        return pool.connection_class(
+            **{
+                **pool.connection_kwargs,
+                "protocol": 3,
+                "socket_timeout": None,
+                "socket_keepalive": True,
+            }
+        )
+
+    @staticmethod
+    async def _enable_tracking(
+        connection: AbstractConnection,
+        prefixes: Sequence[str],
+        on_invalidate: Callable[[Optional[List[bytes]]], Awaitable[None]],
+    ) -> None:
+        await connection.connect()
+        # redis-py has no public hook for the pushes of a connection
+        connection._parser.set_invalidation_push_handler(
+            lambda push: on_invalidate(push[1])
+        )
+        await connection.send_command(
+            "CLIENT",
+            "TRACKING",
+            "ON",
+            "BCAST",
+            *chain.from_iterable(("PREFIX", prefix) for prefix in prefixes),
+        )
+        await connection.read_response()
+
+    @staticmethod
+    async def _read_pushes(connection: AbstractConnection) -> None:
+        while True:
+            await connection.read_response(push_request=True)
+
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        """Endpoint of the URL without the credentials."""
+        parts = urlsplit(url)
+        return f"{parts.hostname}:{parts.port or 6379}"
+
+    @staticmethod
+    def _address(address: str) -> Tuple[str, int]:
+        host, _, port = address.rpartition(":")
+        return host, int(port)
+
     def get_connection(self) -> redis.Redis:
         return self._redis
 
+    async def ping_all(self: Self) -> bool:
+        """Whether every primary node answers the ping.
+
+        The ping of the instance reaches a single node only: the first
+        shard or a replica.
+        """
+        pongs = await asyncio.gather(
+            *(primary.ping() for primary in self._primaries())
+        )
+        return all(pong is True for pong in pongs)
+
+    async def track(
+        self: Self,
+        prefixes: Sequence[str],
+        on_invalidate: Callable[[Optional[List[bytes]]], Awaitable[None]],
+    ) -> None:
+        """Receive the keys with the prefixes changed by any client.
+
+        Every primary node gets a RESP3 connection with client tracking
+        in broadcast mode, the node pushes the changed keys to it.
+        ``on_invalidate`` gets None - all keys - once the tracking is on,
+        since the changes before it are unknown, and on FLUSHALL.
+        Runs until cancelled or a connection is lost.
+
+        Args:
+            prefixes (Sequence[str]): prefixes of the tracked keys.
+            on_invalidate (Callable): called with the changed keys.
+        """
+        connections = [
+            self._create_tracking_connection(pool)
+            for pool in self._primary_pools()
+        ]
+        try:
+            for connection in connections:
+                await self._enable_tracking(connection, prefixes, on_invalidate)
+            await on_invalidate(None)
+            async with asyncio.TaskGroup() as group:
+                for connection in connections:
+                    group.create_task(self._read_pushes(connection))
+        finally:
+            for connection in connections:
+                await connection.disconnect()
+
     async def shutdown(self: Self) -> None:
         """Closing a connection to Redis."""
         if self._redis:
             await self._redis.aclose()
             log.info("Redis instance [%s] is closed.", id(self._redis))
-        if self._pool:
-            await self._pool.disconnect()
-            log.info("Redis conn pool [%s] is closed.", id(self._pool))
+        for pool in self._pools:
+            await pool.disconnect()
+            log.info("Redis conn pool [%s] is closed.", id(pool))
@@ -0,0 +1,97 @@
+"""Module related to the versioned namespace of the cache keys."""
+
+import asyncio
+from contextlib import suppress
+import hashlib
+import json
+import logging
+from typing import Optional, Self, Type
+
+from pydantic import BaseModel
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from users_management.core.settings import RedisConfig
+from users_management.gateways.connections import (
+    GatewayConnectionProtocol,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class RedisCacheNamespaceImpl:
+    """Version of the cache keys: the cached schema fingerprint and
+    the generation counter stored in Redis.
+
+    A deploy changing the schema and a bumped generation both switch
+    to keys never written before, the entries of the previous version
+    are not read anymore and expire by their TTL.
+
+    Args:
+        redis_manager (GatewayConnectionProtocol[redis.Redis]): Redis manager.
+        config (RedisConfig): Redis config.
+        schema (Type[BaseModel]): schema of the cached entries.
+    """
+
+    GENERATION_KEY = "users:cache:generation"
+
+    def __init__(
+        self: Self,
+        redis_manager: GatewayConnectionProtocol[redis.Redis],
+        config: RedisConfig,
+        schema: Type[BaseModel],
+    ) -> None:
+        self._redis_manager = redis_manager
+        self._config = config
+        self._fingerprint = self._schema_fingerprint(schema)
+        self._generation = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def version(self: Self) -> str:
+        return f"{self._fingerprint}.{self._generation}"
+
+    def startup(self: Self) -> None:
+        """Start following the generation in the running event loop."""
+        self._task = asyncio.create_task(self._run())
+        log.info("Cache namespace [%s] is started.", id(self))
+
+    async def shutdown(self: Self) -> None:
+        """Stop following the generation."""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            log.info("Cache namespace [%s] is stopped.", id(self))
+
+    async def refresh(self: Self) -> None:
+        """Read the current generation, the known one is kept
+        if Redis is unavailable."""
+        redis_instance = self._redis_manager.get_connection()
+        try:
+            generation = await redis_instance.get(self.GENERATION_KEY)
+        except RedisError:
+            log.warning("Cache generation is not refreshed.", exc_info=True)
+            return
+        generation = int(generation or 0)
+        if generation != self._generation:
+            log.info("Cache generation changed to %s.", generation)
+            self._generation = generation
+
+    async def bump(self: Self) -> int:
+        """Switch every worker to a new generation of the keys."""
+        redis_instance = self._redis_manager.get_connection()
+        self._generation = await redis_instance.incr(self.GENERATION_KEY)
+        log.info("Cache generation is bumped to %s.", self._generation)
+        return self._generation
+
+    async def _run(self: Self) -> None:
+        while True:
+            await asyncio.sleep(self._config.CACHE_GENERATION_REFRESH_INTERVAL)
+            await self.refresh()
+
+    @staticmethod
+    def _schema_fingerprint(schema: Type[BaseModel]) -> str:
+        dumped = json.dumps(schema.model_json_schema(), sort_keys=True)
+        return hashlib.blake2b(dumped.encode(), digest_size=4).hexdigest()
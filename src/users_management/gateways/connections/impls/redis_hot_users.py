@@ -0,0 +1,73 @@
+"""Module related to persisting the read counts of the users."""
+
+import asyncio
+from contextlib import suppress
+import logging
+from typing import Optional, Self
+
+import redis.asyncio as redis
+
+from users_management.app.exceptions import RedisCacheDBException
+from users_management.core.settings import CacheWarmUpConfig
+from users_management.core.utils.hot_keys import HotKeysCounter
+from users_management.gateways.connections import (
+    GatewayConnectionProtocol,
+)
+from users_management.gateways.repositories.impls.hot_users import (
+    HotUsersRepositoryImpl,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class RedisHotUsersFlusherImpl:
+    """Background task adding the counted reads to the ranking in Redis.
+
+    Args:
+        redis_manager (GatewayConnectionProtocol[redis.Redis]): Redis manager.
+        counter (HotKeysCounter[int]): read counts of the worker process.
+        config (CacheWarmUpConfig): warm-up config.
+    """
+
+    def __init__(
+        self: Self,
+        redis_manager: GatewayConnectionProtocol[redis.Redis],
+        counter: HotKeysCounter[int],
+        config: CacheWarmUpConfig,
+    ) -> None:
+        self._redis_manager = redis_manager
+        self._counter = counter
+        self._config = config
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def startup(self: Self) -> None:
+        """Start flushing in the running event loop."""
+        self._task = asyncio.create_task(self._run())
+        log.info("Hot users flusher [%s] is started.", id(self))
+
+    async def shutdown(self: Self) -> None:
+        """Stop flushing, the counts of the last period are flushed."""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            await self._flush()
+            log.info("Hot users flusher [%s] is stopped.", id(self))
+
+    async def _run(self: Self) -> None:
+        while True:
+            await asyncio.sleep(self._config.FLUSH_INTERVAL)
+            await self._flush()
+
+    async def _flush(self: Self) -> None:
+        reads = self._counter.drain()
+        if not reads:
+            return
+        hot_users = HotUsersRepositoryImpl(
+            redis=self._redis_manager.get_connection(), config=self._config
+        )
+        try:
+            await hot_users.add_reads(reads)
+        except RedisCacheDBException:
+            log.warning("Reads of %s users are not flushed.", len(reads))
@@ -0,0 +1,85 @@
+"""Module related to the cross-worker invalidation of the local cache."""
+
+import asyncio
+from contextlib import suppress
+import logging
+from typing import Any, Dict, Optional, Self
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from users_management.gateways.connections import (
+    GatewayConnectionProtocol,
+)
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class RedisInvalidationListenerImpl:
+    """Background subscriber dropping local cache entries changed elsewhere.
+
+    Args:
+        redis_manager (GatewayConnectionProtocol[redis.Redis]): Redis manager.
+        store (LocalCacheStore[Any]): local cache of the worker process.
+        channel (str): invalidation channel name.
+    """
+
+    RETRY_DELAY: float = 1.0
+
+    def __init__(
+        self: Self,
+        redis_manager: GatewayConnectionProtocol[redis.Redis],
+        store: LocalCacheStore[Any],
+        channel: str,
+    ) -> None:
+        self._redis_manager = redis_manager
+        self._store = store
+        self._channel = channel
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def startup(self: Self) -> None:
+        """Start listening in the running event loop."""
+        self._task = asyncio.create_task(self._listen())
+        log.info("Cache invalidation listener [%s] is started.", id(self))
+
+    async def shutdown(self: Self) -> None:
+        """Stop listening."""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            log.info("Cache invalidation listener [%s] is stopped.", id(self))
+
+    async def _listen(self: Self) -> None:
+        while True:
+            try:
+                redis_instance = self._redis_manager.get_connection()
+                async with redis_instance.pubsub(
+                    ignore_subscribe_messages=True
+                ) as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    # Messages could be lost while the listener was offline.
+                    self._store.clear()
+                    async for message in pubsub.listen():
+                        self._handle_message(message)
+            except RedisError:
+                log.warning(
+                    "Cache invalidation listener lost connection.",
+                    exc_info=True,
+                )
+                self._store.clear()
+                await asyncio.sleep(self.RETRY_DELAY)
+
+    def _handle_message(self: Self, message: Dict[str, Any]) -> None:
+        data = message["data"]
+        if isinstance(data, bytes):
+            data = data.decode()
+        origin, _, key = data.partition("|")
+        if origin == self._store.instance_id:
+            return
+        log.debug("Local cache invalidation by key: %s.", key)
+        self._store.pop(key)
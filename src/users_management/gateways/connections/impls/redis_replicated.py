@@ -0,0 +1,184 @@
+"""Module related to the Redis client reading from the replicas."""
+
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    TypeVar,
+)
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    TimeoutError as RedisTimeoutError,
+)
+
+from users_management.core.metrics import metrics
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Commands served by the replicas.
+READ_COMMANDS = frozenset(
+    (
+        "GET",
+        "MGET",
+        "HGET",
+        "HMGET",
+        "HGETALL",
+        "EXISTS",
+        "ZRANGE",
+        "ZREVRANGE",
+        "ZSCORE",
+        "GETBIT",
+        "TTL",
+        "PTTL",
+    )
+)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 1)
+
+
+class ReplicatedRedis(redis.Redis):
+    """Redis client sending the reads to the replicas round-robin,
+    everything else to the primary.
+
+    A replica failing to connect is skipped for the retry interval,
+    the read falls back to the next replica and then to the primary.
+    Replicas lag behind the primary: a read right after a write may
+    miss the written entry and load it from the database.
+
+    Args:
+        primary (redis.Redis): client of the primary.
+        replicas (Sequence[redis.Redis]): clients of the replicas.
+        endpoints (Sequence[str]): names of the primary and the replicas
+            in the latency metrics.
+        retry_interval (float): seconds a failed replica is skipped.
+    """
+
+    def __init__(
+        self: Self,
+        primary: redis.Redis,
+        replicas: Sequence[redis.Redis],
+        endpoints: Sequence[str],
+        retry_interval: float,
+    ) -> None:
+        super().__init__(connection_pool=primary.connection_pool)
+        self.primary = primary
+        self.replicas = list(replicas)
+        self._endpoints = list(endpoints)
+        self._retry_interval = retry_interval
+        self._down_until: List[float] = [0.0] * len(self.replicas)
+        self._next = 0
+
+    def pipeline(
+        self: Self,
+        transaction: bool = True,
+        shard_hint: Optional[str] = None,
+    ) -> "ReplicatedPipeline":
+        """Pipeline run on a replica if it only reads."""
+        return ReplicatedPipeline(self, transaction)
+
+    async def execute_command(self: Self, *args: Any, **options: Any) -> Any:
+        if args[0] in READ_COMMANDS:
+            return await self.read(
+                lambda client: client.execute_command(*args, **options)
+            )
+        return await self.timed(
+            0, self.primary.execute_command(*args, **options)
+        )
+
+    async def read(
+        self: Self, call: Callable[[redis.Redis], Awaitable[T]]
+    ) -> T:
+        """Run the read on the next available replica."""
+        for index in self._available_replicas():
+            try:
+                return await self.timed(index + 1, call(self.replicas[index]))
+            except (RedisConnectionError, RedisTimeoutError):
+                log.warning(
+                    "Redis replica %s is unavailable.",
+                    self._endpoints[index + 1],
+                    exc_info=True,
+                )
+                metrics.inc("redis_replica_fallbacks")
+                self._down_until[index] = (
+                    time.monotonic() + self._retry_interval
+                )
+        return await self.timed(0, call(self.primary))
+
+    async def timed(self: Self, endpoint: int, call: Awaitable[T]) -> T:
+        """Await the call observing its latency by the endpoint."""
+        started_at = time.perf_counter()
+        try:
+            return await call
+        finally:
+            metrics.observe(
+                "redis_command_seconds",
+                time.perf_counter() - started_at,
+                LATENCY_BUCKETS,
+                labels={"endpoint": self._endpoints[endpoint]},
+            )
+
+    async def aclose(
+        self: Self,
+        close_connection_pool: Optional[bool] = None,
+    ) -> None:
+        for client in (self.primary, *self.replicas):
+            await client.aclose(close_connection_pool)
+
+    def _available_replicas(self: Self) -> List[int]:
+        """Replicas not known to be down, starting from the next one."""
+        count = len(self.replicas)
+        start, self._next = self._next, (self._next + 1) % count
+        now = time.monotonic()
+        return [
+            index
+            for index in ((start + offset) % count for offset in range(count))
+            if self._down_until[index] <= now
+        ]
+
+
+class ReplicatedPipeline(Pipeline):
+    """Pipeline of the replicated client, not transactional pipelines
+    of reads only run on a replica, the others on the primary.
+
+    Args:
+        redis (ReplicatedRedis): replicated client.
+        transaction (bool): run the commands atomically.
+    """
+
+    def __init__(self: Self, redis: ReplicatedRedis, transaction: bool) -> None:
+        super().__init__(
+            redis.primary.connection_pool,
+            redis.response_callbacks,
+            transaction,
+            None,
+        )
+        self._redis = redis
+
+    async def execute(self: Self, raise_on_error: bool = True) -> List[Any]:
+        if self.is_transaction or self.scripts or not self._reads_only():
+            return await self._redis.timed(0, super().execute(raise_on_error))
+        try:
+            return await self._redis.read(
+                lambda client: self._copy_to(client).execute(raise_on_error)
+            )
+        finally:
+            await self.reset()
+
+    def _reads_only(self: Self) -> bool:
+        return all(args[0] in READ_COMMANDS for args, _ in self.command_stack)
+
+    def _copy_to(self: Self, client: redis.Redis) -> Pipeline:
+        pipeline = client.pipeline(transaction=False)
+        pipeline.command_stack = list(self.command_stack)
+        return pipeline
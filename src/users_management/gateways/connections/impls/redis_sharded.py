@@ -0,0 +1,250 @@
+"""Module related to the Redis client sharding the keys between nodes."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Self, Sequence, Tuple
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
+
+from users_management.core.utils.hash_ring import HashRing
+
+
+log = logging.getLogger(__name__)
+
+# Commands taking only keys, split between the nodes and merged back.
+SPLIT_COMMANDS = frozenset(("MGET", "DEL", "UNLINK", "EXISTS", "TOUCH"))
+# Commands without keys run on every node, the first reply is returned.
+BROADCAST_COMMANDS = frozenset(("SCRIPT LOAD", "SCRIPT FLUSH"))
+# Commands with the number of keys as the second argument.
+NUMKEYS_COMMANDS = frozenset(("EVAL", "EVALSHA", "EVAL_RO", "EVALSHA_RO"))
+# Commands with a destination key followed by the number of keys.
+STORE_COMMANDS = frozenset(("ZUNIONSTORE", "ZINTERSTORE", "ZDIFFSTORE"))
+# Commands with a source and a destination key.
+TWO_KEYS_COMMANDS = frozenset(("RENAME", "RENAMENX", "COPY", "SMOVE"))
+# Commands without keys, run on the first node.
+CONTROL_COMMANDS = frozenset(("PUBLISH", "PING", "INFO", "CLIENT TRACKING"))
+
+
+class ShardingError(RedisError):
+    """The keys of a command do not live on the same node."""
+
+
+class ShardedRedis(redis.Redis):
+    """Redis client routing every command to the node owning its keys.
+
+    Commands taking only keys (MGET, DEL...) are split between the nodes,
+    run concurrently and their replies are merged back in order. Other
+    commands, scripts included, must keep their keys on one node, which
+    is what hash tags are for. Keyless commands, pub/sub included,
+    run on the first node.
+
+    Args:
+        shards (Sequence[redis.Redis]): clients of the nodes.
+        ring (HashRing): ring distributing the keys between the nodes.
+    """
+
+    def __init__(
+        self: Self,
+        shards: Sequence[redis.Redis],
+        ring: HashRing,
+    ) -> None:
+        super().__init__(connection_pool=shards[0].connection_pool)
+        self.shards = list(shards)
+        self._ring = ring
+
+    def get_shard(self: Self, key: Any) -> int:
+        """Index of the node owning the key."""
+        return self._ring.get_node(key)
+
+    def route(self: Self, args: Sequence[Any]) -> int:
+        """Index of the node the command must run on."""
+        keys = command_keys(args)
+        if not keys:
+            return 0
+        nodes = {self.get_shard(key) for key in keys}
+        if len(nodes) > 1:
+            raise ShardingError(f"Keys of {args[0]} are on different nodes.")
+        return nodes.pop()
+
+    def group(self: Self, keys: Sequence[Any]) -> Dict[int, List[int]]:
+        """Positions of the keys grouped by the owning node."""
+        groups: Dict[int, List[int]] = {}
+        for position, key in enumerate(keys):
+            groups.setdefault(self.get_shard(key), []).append(position)
+        return groups
+
+    def pipeline(
+        self: Self,
+        transaction: bool = True,
+        shard_hint: Optional[str] = None,
+    ) -> "ShardedPipeline":
+        """Pipeline queueing the commands per node, transactions
+        are atomic within a node only."""
+        return ShardedPipeline(self, transaction)
+
+    async def execute_command(self: Self, *args: Any, **options: Any) -> Any:
+        command = args[0]
+        if command in SPLIT_COMMANDS:
+            keys = args[1:]
+            groups = self.group(keys)
+            replies = await asyncio.gather(
+                *(
+                    self.shards[node].execute_command(
+                        command,
+                        *(keys[position] for position in positions),
+                        **split_options(options, keys, positions),
+                    )
+                    for node, positions in groups.items()
+                )
+            )
+            return merge_replies(command, len(keys), groups, replies)
+        if command in BROADCAST_COMMANDS:
+            replies = await asyncio.gather(
+                *(
+                    shard.execute_command(*args, **options)
+                    for shard in self.shards
+                )
+            )
+            return replies[0]
+        return await self.shards[self.route(args)].execute_command(
+            *args, **options
+        )
+
+    async def aclose(
+        self: Self,
+        close_connection_pool: Optional[bool] = None,
+    ) -> None:
+        for shard in self.shards:
+            await shard.aclose(close_connection_pool)
+
+
+class ShardedPipeline(Pipeline):
+    """Pipeline of the sharded client, the commands are queued
+    in a pipeline per node, executed concurrently.
+
+    Args:
+        redis (ShardedRedis): sharded client.
+        transaction (bool): run the commands of every node atomically.
+    """
+
+    def __init__(self: Self, redis: ShardedRedis, transaction: bool) -> None:
+        super().__init__(
+            redis.connection_pool, redis.response_callbacks, transaction, None
+        )
+        self._redis = redis
+        self._pipelines: Dict[int, Pipeline] = {}
+        # command, positions of its keys and of its replies by node
+        self._queued: List[
+            Tuple[str, int, Dict[int, List[int]], Dict[int, int]]
+        ] = []
+
+    def __len__(self: Self) -> int:
+        return len(self._queued)
+
+    def execute_command(self: Self, *args: Any, **kwargs: Any) -> Self:
+        command = args[0]
+        if command in SPLIT_COMMANDS:
+            keys = args[1:]
+            groups = self._redis.group(keys)
+            replies = {
+                node: self._queue(
+                    node,
+                    command,
+                    *(keys[position] for position in positions),
+                    **split_options(kwargs, keys, positions),
+                )
+                for node, positions in groups.items()
+            }
+            self._queued.append((command, len(keys), groups, replies))
+        else:
+            node = self._redis.route(args)
+            reply = self._queue(node, *args, **kwargs)
+            self._queued.append((command, 1, {node: [0]}, {node: reply}))
+        return self
+
+    async def execute(self: Self, raise_on_error: bool = True) -> List[Any]:
+        nodes = list(self._pipelines)
+        queued = self._queued
+        try:
+            for pipeline in self._pipelines.values():
+                pipeline.scripts.update(self.scripts)
+            results = await asyncio.gather(
+                *(
+                    self._pipelines[node].execute(raise_on_error)
+                    for node in nodes
+                )
+            )
+        finally:
+            await self.reset()
+        by_node = dict(zip(nodes, results))
+        merged: List[Any] = []
+        for command, size, groups, replies in queued:
+            node_replies = [by_node[node][replies[node]] for node in groups]
+            if command in SPLIT_COMMANDS:
+                merged.append(
+                    merge_replies(command, size, groups, node_replies)
+                )
+            else:
+                merged.append(node_replies[0])
+        return merged
+
+    async def reset(self: Self) -> None:
+        for pipeline in self._pipelines.values():
+            await pipeline.reset()
+        self._pipelines = {}
+        self._queued = []
+        await super().reset()
+
+    def _queue(self: Self, node: int, *args: Any, **kwargs: Any) -> int:
+        """Queue the command in the pipeline of the node,
+        the position of its reply is returned."""
+        pipeline = self._pipelines.get(node)
+        if pipeline is None:
+            pipeline = self._pipelines[node] = self._redis.shards[
+                node
+            ].pipeline(transaction=self.is_transaction)
+        pipeline.execute_command(*args, **kwargs)
+        return len(pipeline.command_stack) - 1
+
+
+def command_keys(args: Sequence[Any]) -> Sequence[Any]:
+    """Keys of the command."""
+    command = args[0]
+    if command in CONTROL_COMMANDS or command in BROADCAST_COMMANDS:
+        return ()
+    if command in NUMKEYS_COMMANDS:
+        return args[3 : 3 + int(args[2])]
+    if command in STORE_COMMANDS:
+        return (args[1], *args[3 : 3 + int(args[2])])
+    if command in TWO_KEYS_COMMANDS:
+        return args[1:3]
+    return args[1:2]
+
+
+def split_options(
+    options: Dict[str, Any],
+    keys: Sequence[Any],
+    positions: Sequence[int],
+) -> Dict[str, Any]:
+    """Options of the command part sent to one node."""
+    if "keys" not in options:
+        return options
+    return {**options, "keys": [keys[position] for position in positions]}
+
+
+def merge_replies(
+    command: str,
+    size: int,
+    groups: Dict[int, List[int]],
+    replies: Sequence[Any],
+) -> Any:
+    """Reply of the split command from the replies of the nodes."""
+    if command != "MGET":
+        return sum(replies)
+    values: List[Any] = [None] * size
+    for positions, node_values in zip(groups.values(), replies):
+        for position, value in zip(positions, node_values):
+            values[position] = value
+    return values
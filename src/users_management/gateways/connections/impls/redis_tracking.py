@@ -0,0 +1,82 @@
+"""Module related to the local cache invalidation by Redis client tracking."""
+
+import asyncio
+from contextlib import suppress
+import logging
+from typing import Any, List, Optional, Self, Sequence
+
+from redis.exceptions import RedisError
+
+from users_management.gateways.connections.impls.redis import (
+    RedisConnectionManagerImpl,
+)
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class RedisTrackingListenerImpl:
+    """Background task dropping the local cache entries Redis reports
+    as changed, whoever changed them.
+
+    Unlike the invalidation channel, no writer has to publish anything:
+    Redis pushes the keys with the tracked prefixes changed on any node,
+    expired and evicted keys included.
+
+    Args:
+        redis_manager (RedisConnectionManagerImpl): Redis manager.
+        store (LocalCacheStore[Any]): local cache of the worker process.
+        prefixes (Sequence[str]): prefixes of the keys cached locally.
+    """
+
+    RETRY_DELAY: float = 1.0
+
+    def __init__(
+        self: Self,
+        redis_manager: RedisConnectionManagerImpl,
+        store: LocalCacheStore[Any],
+        prefixes: Sequence[str],
+    ) -> None:
+        self._redis_manager = redis_manager
+        self._store = store
+        self._prefixes = prefixes
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def startup(self: Self) -> None:
+        """Start tracking in the running event loop."""
+        self._task = asyncio.create_task(self._listen())
+        log.info("Cache tracking listener [%s] is started.", id(self))
+
+    async def shutdown(self: Self) -> None:
+        """Stop tracking."""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            log.info("Cache tracking listener [%s] is stopped.", id(self))
+
+    async def _listen(self: Self) -> None:
+        while True:
+            try:
+                await self._redis_manager.track(
+                    self._prefixes, self._invalidate
+                )
+            except* RedisError:
+                log.warning(
+                    "Cache tracking listener lost connection.", exc_info=True
+                )
+            # Changes could be missed while the listener was offline.
+            self._store.clear()
+            await asyncio.sleep(self.RETRY_DELAY)
+
+    async def _invalidate(self: Self, keys: Optional[List[bytes]]) -> None:
+        if keys is None:
+            log.info("Local cache invalidation of all keys.")
+            self._store.clear()
+            return
+        for key in keys:
+            log.debug("Local cache invalidation by key: %s.", key)
+            self._store.invalidate(key.decode())
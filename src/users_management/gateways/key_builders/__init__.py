@@ -1,6 +1,22 @@
 from users_management.gateways.key_builders.cache_key_builders import (
+    UsersCacheKeys,
+    get_bucketed_key_by_user_id,
+    get_fields_key_by_user_id,
+    get_key_by_free_nickname,
+    get_key_by_nickname,
     get_key_by_user_id,
+    get_lease_key,
+    split_bucketed_key,
 )
 
 
-__all__ = ("get_key_by_user_id",)
+__all__ = (
+    "UsersCacheKeys",
+    "get_bucketed_key_by_user_id",
+    "get_fields_key_by_user_id",
+    "get_key_by_free_nickname",
+    "get_key_by_nickname",
+    "get_key_by_user_id",
+    "get_lease_key",
+    "split_bucketed_key",
+)
@@ -1,2 +1,67 @@
-def get_key_by_user_id(user_id: int) -> str:
-    return f"user:{user_id}:info"
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+
+BUCKET_PREFIX = "users:"
+BUCKET_SUFFIX = ":bucket"
+BUCKET_FIELD_SEPARATOR = "#"
+
+
+@dataclass(frozen=True, slots=True)
+class UsersCacheKeys:
+    """Key builders of the users cache entries.
+
+    Attributes:
+        by_user_id (Callable[[int], str]): key of the user entry.
+        by_nickname (Callable[[str], str]): key of the nickname index.
+        by_free_nickname (Callable[[str], str]): key of the free
+            nickname entry.
+    """
+
+    by_user_id: Callable[[int], str]
+    by_nickname: Callable[[str], str]
+    by_free_nickname: Callable[[str], str]
+
+
+def get_key_by_user_id(user_id: int, namespace: str) -> str:
+    return f"user:{namespace}:{user_id}:info"
+
+
+def get_fields_key_by_user_id(user_id: int, namespace: str) -> str:
+    return f"user:{namespace}:{user_id}:fields"
+
+
+def get_bucketed_key_by_user_id(
+    user_id: int, namespace: str, bucket_size: int
+) -> str:
+    return (
+        f"{BUCKET_PREFIX}{namespace}:{user_id // bucket_size}{BUCKET_SUFFIX}"
+        f"{BUCKET_FIELD_SEPARATOR}{user_id}"
+    )
+
+
+def split_bucketed_key(key: str) -> Tuple[str, Optional[str]]:
+    """Split the key into the bucket key and the field,
+    the field is None for not bucketed keys, e.g. the nickname keys,
+    whichever characters the nickname has."""
+    bucket, separator, field = key.rpartition(BUCKET_FIELD_SEPARATOR)
+    if (
+        separator
+        and bucket.startswith(BUCKET_PREFIX)
+        and bucket.endswith(BUCKET_SUFFIX)
+        and field.isdigit()
+    ):
+        return bucket, field
+    return key, None
+
+
+def get_key_by_nickname(nickname: str, namespace: str) -> str:
+    return f"nickname:{namespace}:{nickname}:user"
+
+
+def get_key_by_free_nickname(nickname: str, namespace: str) -> str:
+    return f"nickname:{namespace}:{nickname}:free"
+
+
+def get_lease_key(key: str) -> str:
+    return f"{key}:lease"
@@ -1,10 +1,16 @@
 from .exceptions_handler import handle_redis_exceptions, handle_sql_exceptions
-from .protocols.cache_protocol import CacheRepositoryProtocol
-from .protocols.users_protocol import UsersRepositoryProtocol
+from .protocols.bloom_filter_protocol import BloomFilterRepositoryProtocol
+from .protocols.cache_protocol import CacheEntry, CacheRepositoryProtocol
+from .protocols.hot_keys_protocol import HotKeysRepositoryProtocol
+from .protocols.users_protocol import UserConflict, UsersRepositoryProtocol
 
 
 __all__ = (
+    "BloomFilterRepositoryProtocol",
+    "CacheEntry",
     "CacheRepositoryProtocol",
+    "HotKeysRepositoryProtocol",
+    "UserConflict",
     "UsersRepositoryProtocol",
     "handle_redis_exceptions",
     "handle_sql_exceptions",
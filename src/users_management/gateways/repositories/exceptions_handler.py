@@ -1,4 +1,5 @@
 from functools import wraps
+import inspect
 import logging
 from typing import Tuple, Type, Union
 
@@ -21,6 +22,7 @@ def handle_repository_exceptions(
 ):
     """
     Universal decorator for handling repository exceptions.
+    Async generators are wrapped for the whole iteration.
 
     Args:
         specific_exceptions: One or more exception types to catch (e.g., SQLAlchemyError, RedisError).
@@ -29,22 +31,36 @@ def handle_repository_exceptions(
     """
 
     def decorator(func):
+        def reraise(e, args, kwargs):
+            log.error(
+                "%s in %s with args %s, kwargs %s: %s",
+                log_message,
+                func.__name__,
+                args,
+                kwargs,
+                str(e),
+                exc_info=True,
+            )
+            raise custom_exception(str(e))
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             try:
                 return await func(*args, **kwargs)
             except specific_exceptions as e:
-                log.error(
-                    "%s in %s with args %s, kwargs %s: %s",
-                    log_message,
-                    func.__name__,
-                    args,
-                    kwargs,
-                    str(e),
-                    exc_info=True,
-                )
-                raise custom_exception(str(e))
+                reraise(e, args, kwargs)
+
+        @wraps(func)
+        async def async_gen_wrapper(*args, **kwargs):
+            # the errors are raised while iterating, not on the call
+            try:
+                async for item in func(*args, **kwargs):
+                    yield item
+            except specific_exceptions as e:
+                reraise(e, args, kwargs)
 
+        if inspect.isasyncgenfunction(func):
+            return async_gen_wrapper
         return async_wrapper
 
     return decorator
@@ -0,0 +1,88 @@
+"""
+A module that describes the ranking of the most read users stored in Redis.
+"""
+
+import logging
+import time
+from typing import Dict, List, Self
+
+import redis.asyncio as redis
+
+from users_management.core.settings import CacheWarmUpConfig
+from users_management.gateways.repositories import (
+    HotKeysRepositoryProtocol,
+    handle_redis_exceptions,
+)
+
+
+log = logging.getLogger(__name__)
+
+# Decays the scores by the time passed since the last decay, then adds
+# the reads and keeps only the tracked number of the hottest users.
+# The first flush only records the decay time.
+# KEYS[1] - ranking, KEYS[2] - last decay time; ARGV: now, decay per
+# interval, interval, tracked users, then user ID and count pairs.
+ADD_READS_SCRIPT = """
+local now = tonumber(ARGV[1])
+local decayed_at = tonumber(redis.call("GET", KEYS[2]))
+if not decayed_at then
+    redis.call("SET", KEYS[2], ARGV[1])
+elseif now > decayed_at then
+    local factor = tonumber(ARGV[2]) ^ ((now - decayed_at) / tonumber(ARGV[3]))
+    redis.call("ZUNIONSTORE", KEYS[1], 1, KEYS[1], "WEIGHTS", factor)
+    redis.call("SET", KEYS[2], ARGV[1])
+end
+for i = 5, #ARGV, 2 do
+    redis.call("ZINCRBY", KEYS[1], ARGV[i + 1], ARGV[i])
+end
+redis.call("ZREMRANGEBYRANK", KEYS[1], 0, -tonumber(ARGV[4]) - 1)
+return 0
+"""
+
+
+class HotUsersRepositoryImpl(HotKeysRepositoryProtocol):
+    """Sorted set of user IDs scored by exponentially decayed read counts.
+
+    Every worker adds its own counts, so the ranking outlives restarts
+    and deploys and reflects the reads of the whole fleet. The scores
+    decay by ``DECAY`` per ``FLUSH_INTERVAL`` whatever the number of
+    workers flushing.
+
+    Args:
+        redis (redis.Redis): Redis instance.
+        config (CacheWarmUpConfig): warm-up config.
+    """
+
+    # the hash tag keeps both keys on one node of a sharded Redis
+    KEY = "{users:hot}"
+    DECAYED_AT_KEY = "{users:hot}:decayed_at"
+
+    def __init__(
+        self: Self,
+        redis: redis.Redis,
+        config: CacheWarmUpConfig,
+    ) -> None:
+        self._redis = redis
+        self._config = config
+        self._add_reads_script = self._redis.register_script(ADD_READS_SCRIPT)
+
+    @handle_redis_exceptions
+    async def add_reads(self: Self, reads: Dict[int, int]) -> None:
+        log.info("Adding reads of %s users to the ranking.", len(reads))
+        args: List[float] = [
+            time.time(),
+            self._config.DECAY,
+            self._config.FLUSH_INTERVAL,
+            self._config.TRACKED_USERS,
+        ]
+        for user_id, count in reads.items():
+            args.extend((user_id, count))
+        await self._add_reads_script(
+            keys=[self.KEY, self.DECAYED_AT_KEY], args=args
+        )
+
+    @handle_redis_exceptions
+    async def top(self: Self, limit: int) -> List[int]:
+        log.info("Request %s hottest users.", limit)
+        user_ids = await self._redis.zrevrange(self.KEY, 0, limit - 1)
+        return [int(user_id) for user_id in user_ids]
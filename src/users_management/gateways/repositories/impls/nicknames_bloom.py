@@ -0,0 +1,136 @@
+"""
+A module that describes a Bloom filter of nicknames stored in a Redis bitmap.
+"""
+
+import hashlib
+import logging
+from typing import AsyncIterator, List, Optional, Self
+
+import redis.asyncio as redis
+
+from users_management.core.metrics import metrics
+from users_management.core.settings import RedisConfig
+from users_management.gateways.repositories import (
+    BloomFilterRepositoryProtocol,
+    handle_redis_exceptions,
+)
+
+
+log = logging.getLogger(__name__)
+
+# Sets the bits in the live filter and, while a rebuild is running,
+# in the filter being built. A filter that was never built is not created.
+ADD_SCRIPT = """
+local live = redis.call("EXISTS", KEYS[1]) == 1
+local rebuilding = redis.call("EXISTS", KEYS[2]) == 1
+for i = 1, #ARGV do
+    if live then redis.call("SETBIT", KEYS[1], ARGV[i], 1) end
+    if rebuilding then redis.call("SETBIT", KEYS[2], ARGV[i], 1) end
+end
+return 0
+"""
+
+# Returns -1 if the filter is not built, 0 if any bit is unset, 1 otherwise.
+CHECK_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return -1
+end
+for i = 1, #ARGV do
+    if redis.call("GETBIT", KEYS[1], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+
+
+class NicknamesBloomFilterRepositoryImpl(BloomFilterRepositoryProtocol):
+    """Bloom filter kept as a plain Redis bitmap, no modules are required.
+
+    Args:
+        redis (redis.Redis): Redis instance.
+        config (RedisConfig): Redis config.
+    """
+
+    # the hash tag keeps both keys on one node of a sharded Redis
+    KEY = "{nicknames:bloom}"
+    REBUILD_KEY = "{nicknames:bloom}:rebuild"
+
+    def __init__(self: Self, redis: redis.Redis, config: RedisConfig) -> None:
+        self._redis = redis
+        self._config = config
+        self._size = self._config.NICKNAMES_BLOOM_SIZE
+        self._hashes = self._config.NICKNAMES_BLOOM_HASHES
+        self._add_script = self._redis.register_script(ADD_SCRIPT)
+        self._check_script = self._redis.register_script(CHECK_SCRIPT)
+
+    @handle_redis_exceptions
+    async def add(self: Self, item: str) -> None:
+        if not self._config.NICKNAMES_BLOOM_ENABLED:
+            return
+        log.info("Adding nickname to the filter: %s.", item)
+        await self._add_script(
+            keys=[self.KEY, self.REBUILD_KEY], args=self._positions(item)
+        )
+
+    @handle_redis_exceptions
+    async def add_list(self: Self, items: List[str]) -> None:
+        if not self._config.NICKNAMES_BLOOM_ENABLED or not items:
+            return
+        log.info("Adding %s nicknames to the filter.", len(items))
+        await self._add_script(
+            keys=[self.KEY, self.REBUILD_KEY],
+            args=[
+                position for item in items for position in self._positions(item)
+            ],
+        )
+
+    @handle_redis_exceptions
+    async def might_contain(self: Self, item: str) -> Optional[bool]:
+        if not self._config.NICKNAMES_BLOOM_ENABLED:
+            return None
+        result = await self._check_script(
+            keys=[self.KEY], args=self._positions(item)
+        )
+        if result == -1:
+            log.warning("Nicknames filter is not built.")
+            return None
+        metrics.inc(
+            "nicknames_bloom_positives"
+            if result
+            else "nicknames_bloom_negatives"
+        )
+        return bool(result)
+
+    @handle_redis_exceptions
+    async def drop(self: Self) -> None:
+        if not self._config.NICKNAMES_BLOOM_ENABLED:
+            return
+        log.warning("Dropping nicknames filter.")
+        await self._redis.delete(self.KEY)
+
+    @handle_redis_exceptions
+    async def rebuild(self: Self, batches: AsyncIterator[List[str]]) -> int:
+        log.info("Rebuilding nicknames filter of %s bits.", self._size)
+        await self._redis.delete(self.REBUILD_KEY)
+        # allocate the whole bitmap, so adds during the scan reach it
+        await self._redis.setbit(self.REBUILD_KEY, self._size - 1, 0)
+        count = 0
+        async for batch in batches:
+            pipeline = self._redis.pipeline(transaction=False)
+            for item in batch:
+                for position in self._positions(item):
+                    pipeline.setbit(self.REBUILD_KEY, position, 1)
+            await pipeline.execute()
+            count += len(batch)
+            log.info("Nicknames added to the filter: %s.", count)
+        await self._redis.rename(self.REBUILD_KEY, self.KEY)
+        log.info("Nicknames filter is rebuilt with %s nicknames.", count)
+        return count
+
+    def _positions(self: Self, item: str) -> List[int]:
+        """Bit positions of the item by double hashing."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * second) % self._size for i in range(self._hashes)]
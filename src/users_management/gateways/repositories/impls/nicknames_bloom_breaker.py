@@ -0,0 +1,61 @@
+"""
+A module that describes a Bloom filter skipped while its storage fails.
+"""
+
+from typing import AsyncIterator, List, Optional, Self
+
+from users_management.core.utils.circuit_breaker import CircuitBreaker
+from users_management.gateways.repositories import (
+    BloomFilterRepositoryProtocol,
+)
+
+
+class BreakerBloomFilterRepositoryImpl(BloomFilterRepositoryProtocol):
+    """Bloom filter guarded by a circuit breaker.
+
+    While the storage fails the filter answers as if it was not built,
+    so membership is checked in the database. Additions are deferred
+    until the circuit closes: a lost one would make the filter deny
+    a taken item.
+
+    Args:
+        bloom_filter (BloomFilterRepositoryProtocol): guarded filter.
+        breaker (CircuitBreaker): process-wide breaker of the storage.
+    """
+
+    def __init__(
+        self: Self,
+        bloom_filter: BloomFilterRepositoryProtocol,
+        breaker: CircuitBreaker,
+    ) -> None:
+        self._filter = bloom_filter
+        self._breaker = breaker
+
+    async def add(self: Self, item: str) -> None:
+        await self._breaker.call(
+            lambda: self._filter.add(item),
+            None,
+            invalidation=lambda: self._filter.add(item),
+        )
+
+    async def add_list(self: Self, items: List[str]) -> None:
+        if not items:
+            return
+        await self._breaker.call(
+            lambda: self._filter.add_list(items),
+            None,
+            invalidation=lambda: self._filter.add_list(items),
+        )
+
+    async def might_contain(self: Self, item: str) -> Optional[bool]:
+        return await self._breaker.call(
+            lambda: self._filter.might_contain(item), None
+        )
+
+    async def drop(self: Self) -> None:
+        await self._breaker.call(
+            self._filter.drop, None, invalidation=self._filter.drop
+        )
+
+    async def rebuild(self: Self, batches: AsyncIterator[List[str]]) -> int:
+        return await self._filter.rebuild(batches)
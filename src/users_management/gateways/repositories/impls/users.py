@@ -1,13 +1,47 @@
 import logging
-from typing import Any, Dict, Optional, Self
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Self,
+    Set,
+    Tuple,
+)
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    ARRAY,
+    any_,
+    bindparam,
+    column,
+    delete,
+    exists,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from users_management.app.models import InfoUser
-from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
 from users_management.app.schemas.users import SInfoUser
+from users_management.core.models.utils.to_utc_converter import (
+    to_utc_converter,
+)
 from users_management.gateways.repositories import (
+    UserConflict,
     UsersRepositoryProtocol,
     handle_sql_exceptions,
 )
@@ -15,9 +49,43 @@ from users_management.gateways.repositories import (
 
 log = logging.getLogger(__name__)
 
+validate_user: Final = SInfoUser.__pydantic_validator__.validate_python
+
+
+def to_user(row: Row[Any]) -> SInfoUser:
+    """Build the user from a row of UsersRepositoryImpl.USER_COLUMNS.
+
+    The columns already have the types of the schema: a plain dict goes
+    straight to the core validator, skipping the attribute lookups
+    of from_attributes. The compiled validator is cheaper than the
+    Python model_construct too, see benchmarks/users_read_path.py.
+    """
+    user_id, nickname, avatar, updated_at = row
+    return validate_user(
+        {
+            "user_id": user_id,
+            "nickname": nickname,
+            "avatar": avatar,
+            "updated_at": updated_at,
+        }
+    )
+
 
 class UsersRepositoryImpl(UsersRepositoryProtocol):
     USER_INFO_MODEL = InfoUser
+    # batches of this size and larger are inserted by COPY
+    COPY_THRESHOLD = 1000
+    COPY_COLUMNS = ("user_id", "nickname", "avatar", "created_at", "updated_at")
+    # read as rows, not as entities of the session identity map
+    USER_COLUMNS = (
+        InfoUser.user_id,
+        InfoUser.nickname,
+        InfoUser.avatar,
+        InfoUser.updated_at,
+    )
+    # IDs per query of a users lookup, larger lookups are split,
+    # the chunks are queried one by one in the unit of work transaction
+    CHUNK_SIZE = 5000
 
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -28,64 +96,233 @@ class UsersRepositoryImpl(UsersRepositoryProtocol):
         **filter_by: Any,
     ) -> Optional[SInfoUser]:
         log.info("Request user data with filter: %s.", filter_by)
-        stmt = select(self.USER_INFO_MODEL).filter_by(**filter_by)
+        stmt = select(*self.USER_COLUMNS).filter_by(**filter_by)
         result = await self._session.execute(stmt)
-        user_orm = result.scalars().one_or_none()
-        if not user_orm:
+        row = result.one_or_none()
+        if not row:
             log.info("User not found with filter: %s.", filter_by)
             return None
-        user = SInfoUser.model_validate(user_orm, from_attributes=True)
+        user = to_user(row)
         log.info("User data found filter by: %s.", filter_by)
         return user
 
+    @handle_sql_exceptions
+    async def exists_nickname(
+        self: Self,
+        nickname: str,
+    ) -> bool:
+        log.info("Check nickname existence: %s.", nickname)
+        # answered by the nickname index alone, the row is not fetched
+        stmt = select(exists().where(self.USER_INFO_MODEL.nickname == nickname))
+        result = await self._session.execute(stmt)
+        return bool(result.scalar())
+
+    @handle_sql_exceptions
+    async def find_taken(
+        self: Self,
+        users_id: List[int],
+        nicknames: List[str],
+    ) -> Tuple[Set[int], Set[str]]:
+        log.info("Check existence of %s users.", len(users_id))
+        model = self.USER_INFO_MODEL
+        # arrays keep the statement at two parameters whatever the batch
+        users_id_array = bindparam(
+            "users_id", users_id, ARRAY(model.user_id.type)
+        )
+        nicknames_array = bindparam(
+            "nicknames", nicknames, ARRAY(model.nickname.type)
+        )
+        stmt = select(model.user_id, model.nickname).where(
+            or_(
+                model.user_id == any_(users_id_array),
+                model.nickname == any_(nicknames_array),
+            )
+        )
+        result = await self._session.execute(stmt)
+        rows = result.all()
+        return (
+            {row.user_id for row in rows} & set(users_id),
+            {row.nickname for row in rows} & set(nicknames),
+        )
+
+    @handle_sql_exceptions
+    async def stream_nicknames(
+        self: Self,
+        batch_size: int,
+    ) -> AsyncIterator[List[str]]:
+        log.info("Streaming all nicknames by %s.", batch_size)
+        stmt = select(self.USER_INFO_MODEL.nickname).execution_options(
+            yield_per=batch_size
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for partition in result.partitions():
+            yield list(partition)
+
+    @handle_sql_exceptions
+    async def stream_users(
+        self: Self,
+        users_id: List[int],
+        batch_size: int,
+    ) -> AsyncIterator[List[SInfoUser]]:
+        log.info("Streaming %s users by %s.", len(users_id), batch_size)
+        model = self.USER_INFO_MODEL
+        users_id_array = bindparam(
+            "users_id", users_id, ARRAY(model.user_id.type)
+        )
+        stmt = (
+            select(*self.USER_COLUMNS)
+            .where(model.user_id == any_(users_id_array))
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        async for partition in result.partitions():
+            yield [to_user(row) for row in partition]
+
     @handle_sql_exceptions
     async def get_users_list(
         self: Self,
         users_id: list[int],
     ) -> Optional[list[SInfoUser]]:
         log.info("Request list of users data with IDs: %s.", users_id)
-        stmt = select(self.USER_INFO_MODEL).filter(
-            self.USER_INFO_MODEL.user_id.in_(users_id)
-        )
-        result = await self._session.execute(stmt)
-        users_list_orm = result.scalars().all()
-        if len(users_list_orm) < len(users_id):
+        unique_ids = list(dict.fromkeys(users_id))
+        chunks = [
+            unique_ids[start : start + self.CHUNK_SIZE]
+            for start in range(0, len(unique_ids), self.CHUNK_SIZE)
+        ]
+        users_list = [
+            user for chunk in chunks for user in await self._select_users(chunk)
+        ]
+        if len(users_list) < len(unique_ids):
             log.warning(
                 "Not all user data was found with filter: %s.", users_id
             )
             return None
-        users_list = [
-            SInfoUser.model_validate(user, from_attributes=True)
-            for user in users_list_orm
-        ]
         log.info("Users data found with filter: %s.", users_id)
-        return users_list
+        users_by_id = {user.user_id: user for user in users_list}
+        return [users_by_id[user_id] for user_id in users_id]
+
+    async def _select_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[SInfoUser]:
+        """Select the users found by IDs, in any order."""
+        model = self.USER_INFO_MODEL
+        # one array parameter, the same statement whatever the number of IDs
+        users_id_array = bindparam(
+            "users_id", users_id, ARRAY(model.user_id.type)
+        )
+        stmt = select(*self.USER_COLUMNS).where(
+            model.user_id == any_(users_id_array)
+        )
+        result = await self._session.execute(stmt)
+        return [to_user(row) for row in result]
 
     @handle_sql_exceptions
     async def create_user(
         self: Self,
         data: CreateUserRequest,
-    ) -> SInfoUser:
+    ) -> SInfoUser | UserConflict:
         log.info(
             "Creating new user with ID: %s and nickname: %s.",
             data.user_id,
             data.nickname,
         )
-        stmt = (
-            insert(self.USER_INFO_MODEL)
+        model = self.USER_INFO_MODEL
+        inserted = (
+            pg_insert(model)
             .values(data.model_dump())
-            .returning(self.USER_INFO_MODEL)
+            .on_conflict_do_nothing()
+            .returning(*self.USER_COLUMNS)
+            .cte("inserted")
         )
+        # one row whether the user is inserted or not, the nickname check
+        # does not see the inserted row
+        stmt = select(
+            *inserted.c,
+            exists()
+            .where(model.nickname == data.nickname)
+            .label("nickname_taken"),
+        ).select_from(select(literal(1)).subquery().outerjoin(inserted, true()))
         result = await self._session.execute(stmt)
-        user_orm = result.scalars().one_or_none()
+        row = result.one()
+        if row.user_id is None:
+            # a nickname taken by a concurrent transaction is not seen,
+            # the conflict is reported on the ID then
+            conflict = (
+                UserConflict.NICKNAME
+                if row.nickname_taken
+                else UserConflict.USER_ID
+            )
+            log.info(
+                "User with ID: %s and nickname: %s conflicts on %s.",
+                data.user_id,
+                data.nickname,
+                conflict,
+            )
+            return conflict
         log.info(
             "User successfully created with ID: %s and nickname: %s.",
             data.user_id,
             data.nickname,
         )
-        user = SInfoUser.model_validate(user_orm, from_attributes=True)
+        user = SInfoUser.model_validate(row, from_attributes=True)
         return user
 
+    @handle_sql_exceptions
+    async def create_users(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> List[SInfoUser]:
+        log.info("Creating %s new users.", len(data))
+        if len(data) >= self.COPY_THRESHOLD:
+            stmt = await self._copy_to_staging(data)
+        else:
+            stmt = pg_insert(self.USER_INFO_MODEL).values(
+                [user.model_dump() for user in data]
+            )
+        result = await self._session.execute(
+            stmt.on_conflict_do_nothing().returning(self.USER_INFO_MODEL)
+        )
+        users = [
+            SInfoUser.model_validate(user, from_attributes=True)
+            for user in result.scalars()
+        ]
+        log.info("Created %s of %s new users.", len(users), len(data))
+        return users
+
+    async def _copy_to_staging(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> Insert:
+        """COPY the users into a temporary table, the returned statement
+        moves them into the users table."""
+        staging = f"{self.USER_INFO_MODEL.__tablename__}_staging"
+        connection = await self._session.connection()
+        await connection.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                f"(LIKE {self.USER_INFO_MODEL.__tablename__}) "
+                "ON COMMIT DELETE ROWS"
+            )
+        )
+        now = to_utc_converter()
+        driver_connection = (
+            await connection.get_raw_connection()
+        ).driver_connection
+        await driver_connection.copy_records_to_table(
+            staging,
+            records=[
+                (user.user_id, user.nickname, False, now, now) for user in data
+            ],
+            columns=self.COPY_COLUMNS,
+        )
+        return pg_insert(self.USER_INFO_MODEL).from_select(
+            self.COPY_COLUMNS,
+            select(*(column(name) for name in self.COPY_COLUMNS)).select_from(
+                table(staging)
+            ),
+        )
+
     @handle_sql_exceptions
     async def update_user(
         self: Self,
@@ -109,6 +346,33 @@ class UsersRepositoryImpl(UsersRepositoryProtocol):
         user = SInfoUser.model_validate(user_orm, from_attributes=True)
         return user
 
+    @handle_sql_exceptions
+    async def update_users(
+        self: Self,
+        data: List[UpdateUserRequest],
+    ) -> List[SInfoUser]:
+        log.info("Updating %s users.", len(data))
+        model = self.USER_INFO_MODEL
+        changes = values(
+            column("user_id", model.user_id.type),
+            column("avatar", model.avatar.type),
+            name="changes",
+        ).data([(user.user_id, user.avatar) for user in data])
+        stmt = (
+            update(model)
+            .where(model.user_id == changes.c.user_id)
+            .values(avatar=changes.c.avatar)
+            .returning(model)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        users = [
+            SInfoUser.model_validate(user, from_attributes=True)
+            for user in result.scalars()
+        ]
+        log.info("Updated %s of %s users.", len(users), len(data))
+        return users
+
     @handle_sql_exceptions
     async def delete_user(
         self: Self,
@@ -120,3 +384,24 @@ class UsersRepositoryImpl(UsersRepositoryProtocol):
         )
         await self._session.execute(stmt)
         log.info("Successful deletion user with ID: %s.", user_id)
+
+    @handle_sql_exceptions
+    async def delete_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[SInfoUser]:
+        log.info("Deleting %s users.", len(users_id))
+        model = self.USER_INFO_MODEL
+        users_id_array = bindparam(
+            "users_id", users_id, ARRAY(model.user_id.type)
+        )
+        stmt = (
+            delete(model)
+            .where(model.user_id == any_(users_id_array))
+            .returning(*self.USER_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        users = [to_user(row) for row in result]
+        log.info("Deleted %s of %s users.", len(users), len(users_id))
+        return users
@@ -2,15 +2,39 @@
 A module that describes an implementation for interacting with cache storage.
 """
 
-from datetime import timedelta
+import asyncio
 import logging
-from typing import List, Optional, Self
+import math
+import random
+import struct
+import time
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from uuid import uuid4
 
 import redis.asyncio as redis
 
 from users_management.app.schemas.users import SInfoUser
+from users_management.core.metrics import metrics
 from users_management.core.settings import RedisConfig
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.cache_layouts import CacheLayoutProtocol
+from users_management.gateways.codecs import CacheCodecProtocol
+from users_management.gateways.codecs.impls.json import JSONUsersCodecImpl
+from users_management.gateways.codecs.impls.struct import (
+    StructUsersCodecImpl,
+)
+from users_management.gateways.key_builders import get_lease_key
 from users_management.gateways.repositories import (
+    CacheEntry,
     CacheRepositoryProtocol,
     handle_redis_exceptions,
 )
@@ -18,50 +42,343 @@ from users_management.gateways.repositories import (
 
 log = logging.getLogger(__name__)
 
+V = TypeVar("V")
+
+ENTRY_VERSION = b"\x01"
+ENTRY_HEADER = struct.Struct(">ddf")
+NEGATIVE_ENTRY = b"N"
+NEGATIVE_HEADER = struct.Struct(">d")
+
+JSON_CODEC = JSONUsersCodecImpl()
+CODECS_BY_TAG: Dict[bytes, CacheCodecProtocol[SInfoUser]] = {
+    codec.tag: codec for codec in (JSON_CODEC, StructUsersCodecImpl())
+}
+
+# Deletes the lease only if it is still held by the same token.
+RELEASE_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
 class UsersCacheRepositoryImpl(CacheRepositoryProtocol[SInfoUser]):
-    def __init__(self: Self, redis: redis.Redis, config: RedisConfig) -> None:
+    def __init__(
+        self: Self,
+        redis: redis.Redis,
+        config: RedisConfig,
+        codec: CacheCodecProtocol[SInfoUser],
+        layout: CacheLayoutProtocol,
+        ttl_policy: CacheTTLPolicy,
+    ) -> None:
         self._redis = redis
         self._config = config
-        self._expiration = int(
-            timedelta(minutes=self._config.CACHE_LIFETIME).total_seconds()
+        self._codec = codec
+        self._layout = layout
+        self._ttl_policy = ttl_policy
+        self._sliding = self._config.SLIDING_TTL_ENABLED
+        self._max_lifetime = (
+            self._config.CACHE_MAX_LIFETIME
+            if self._sliding
+            else self._ttl_policy.max_lifetime
+        )
+        self._leases: Dict[str, str] = {}
+        self._release_lease_script = self._redis.register_script(
+            RELEASE_LEASE_SCRIPT
         )
 
     @handle_redis_exceptions
-    async def add(self: Self, key: str, data: SInfoUser) -> None:
+    async def add(
+        self: Self,
+        key: str,
+        data: SInfoUser,
+        delta: float = 0.0,
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
         log.info("Adding cache by key: %s.", key)
-        json_data = data.model_dump_json()
-        await self._redis.set(key, json_data, ex=self._expiration)
+        pipeline = self._redis.pipeline(
+            transaction=bool(index_keys or stale_index_keys)
+        )
+        if stale_index_keys:
+            pipeline.delete(*stale_index_keys)
+        lifetime, soft_lifetime = self._ttl_policy.lifetimes(key)
+        self._layout.queue_set(
+            pipeline, {key: self._dump(data, soft_lifetime, delta)}, lifetime
+        )
+        for index_key in index_keys:
+            pipeline.set(index_key, key, ex=lifetime)
+        await pipeline.execute()
+
+    async def update_fields(
+        self: Self,
+        key: str,
+        data: SInfoUser,
+        fields: Sequence[str],
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        # the whole entry is a single value in these layouts
+        await self.add(
+            key,
+            data,
+            index_keys=index_keys,
+            stale_index_keys=stale_index_keys,
+        )
 
     @handle_redis_exceptions
+    async def resolve_index(self: Self, index_key: str) -> Optional[str]:
+        log.info("Searching the cache index by key: %s.", index_key)
+        if self._sliding:
+            key = await self._redis.getex(
+                index_key, ex=self._ttl_policy.lifetime
+            )
+        else:
+            key = await self._redis.get(index_key)
+        return key.decode() if key else None
+
     async def get(self: Self, key: str) -> Optional[SInfoUser]:
+        entry = await self.get_entry(key)
+        return entry.value if entry else None
+
+    @handle_redis_exceptions
+    async def get_entry(
+        self: Self,
+        key: str,
+    ) -> Optional[CacheEntry[SInfoUser]]:
         log.info("Searching the cache by key: %s.", key)
-        value = await self._redis.get(key)
-        return SInfoUser.model_validate_json(value) if value else None
+        (value,) = await self._read([key])
+        return self._load(value) if value else None
+
+    @handle_redis_exceptions
+    async def get_json(self: Self, key: str) -> Optional[CacheEntry[bytes]]:
+        log.info("Searching the cache JSON by key: %s.", key)
+        (value,) = await self._read([key])
+        return self._load_json(value) if value else None
+
+    @handle_redis_exceptions
+    async def add_negative(self: Self, key: str) -> None:
+        if not self._config.NEGATIVE_CACHE_LIFETIME:
+            return
+        log.info("Adding negative cache by key: %s.", key)
+        lifetime = self._config.NEGATIVE_CACHE_LIFETIME
+        expires_at = time.time() + lifetime
+        pipeline = self._redis.pipeline(transaction=False)
+        self._layout.queue_set(
+            pipeline,
+            {key: NEGATIVE_ENTRY + NEGATIVE_HEADER.pack(expires_at)},
+            lifetime,
+        )
+        await pipeline.execute()
 
     @handle_redis_exceptions
-    async def delete(self: Self, key: str) -> None:
+    async def delete(
+        self: Self,
+        key: str,
+        index_keys: Sequence[str] = (),
+    ) -> None:
         log.info("Deleting the cache by key: %s.", key)
-        await self._redis.delete(key)
+        pipeline = self._redis.pipeline(transaction=False)
+        self._layout.queue_delete(pipeline, [key])
+        if index_keys:
+            pipeline.unlink(*index_keys)
+        await pipeline.execute()
 
     @handle_redis_exceptions
     async def add_list(
         self,
-        data_list: List[SInfoUser],
+        data_map: Dict[str, SInfoUser],
     ) -> None:
-        pipeline = self._redis.pipeline()
-        for user in data_list:
-            key = self.get_key_by_user_id(user.user_id)
-            value = user.model_dump_json()
-            pipeline.set(key, value, ex=self._expiration)
+        log.info("Adding cache by keys: %s.", list(data_map))
+        pipeline = self._redis.pipeline(transaction=False)
+        for key, user in data_map.items():
+            lifetime, soft_lifetime = self._ttl_policy.lifetimes(key)
+            self._layout.queue_set(
+                pipeline, {key: self._dump(user, soft_lifetime)}, lifetime
+            )
         await pipeline.execute()
 
     @handle_redis_exceptions
-    async def get_list(self, keys: List[str]) -> Optional[List[SInfoUser]]:
-        values = await self._redis.mget(keys)
+    async def delete_list(self: Self, keys: List[str]) -> None:
+        log.info("Deleting the cache by keys: %s.", keys)
+        pipeline = self._redis.pipeline(transaction=False)
+        self._layout.queue_delete(pipeline, keys)
+        await pipeline.execute()
+
+    @handle_redis_exceptions
+    async def get_list(self, keys: List[str]) -> List[Optional[SInfoUser]]:
+        log.info("Searching the cache by keys: %s.", keys)
+        values = await self._read(keys)
+        entries = [self._load(value) if value else None for value in values]
+        return [entry.value if entry else None for entry in entries]
+
+    @handle_redis_exceptions
+    async def get_list_json(self, keys: List[str]) -> List[Optional[bytes]]:
+        log.info("Searching the cache JSON by keys: %s.", keys)
+        values = await self._read(keys)
+        entries = [self._load_json(v) if v else None for v in values]
+        return [entry.value if entry else None for entry in entries]
+
+    @handle_redis_exceptions
+    async def acquire_lease(self: Self, key: str) -> bool:
+        if not self._config.LEASE_ENABLED:
+            return True
+        token = uuid4().hex
+        if await self._redis.set(
+            get_lease_key(key), token, nx=True, px=self._config.LEASE_TTL
+        ):
+            log.info("Cache fill lease acquired by key: %s.", key)
+            metrics.inc("users_cache_lease_acquired")
+            self._leases[key] = token
+            return True
+        log.info("Cache fill lease is held by another caller: %s.", key)
+        metrics.inc("users_cache_lease_contended")
+        return False
+
+    @handle_redis_exceptions
+    async def release_lease(self: Self, key: str) -> None:
+        if token := self._leases.pop(key, None):
+            await self._release_lease_script(
+                keys=[get_lease_key(key)], args=[token]
+            )
+
+    def holds_lease(self: Self, key: str) -> bool:
+        return key in self._leases
+
+    async def wait_for(
+        self: Self,
+        key: str,
+    ) -> Optional[CacheEntry[SInfoUser]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._config.LEASE_WAIT / 1000
+        while loop.time() < deadline:
+            await asyncio.sleep(self._config.LEASE_POLL_INTERVAL / 1000)
+            if entry := await self.get_entry(key):
+                metrics.inc("users_cache_lease_wait_hits")
+                return entry
+        log.warning("Cache fill lease wait timed out by key: %s.", key)
+        metrics.inc("users_cache_lease_wait_timeouts")
+        return None
 
-        if any(v is None for v in values):
-            log.info("Some keys not found in cache: %s.", keys)
+    async def _read(self: Self, keys: List[str]) -> List[Optional[bytes]]:
+        """Read the entries, prolonging them in the sliding mode."""
+        for key in keys:
+            self._ttl_policy.record_access(key)
+        lifetimes = (
+            [self._ttl_policy.sliding_lifetime(key) for key in keys]
+            if self._sliding
+            else None
+        )
+        return await self._layout.get(self._redis, keys, lifetimes)
+
+    def _dump(
+        self: Self,
+        data: SInfoUser,
+        soft_lifetime: float,
+        delta: float = 0.0,
+    ) -> bytes:
+        """Serialize the value with its write time, soft expiry
+        and load time.
+
+        Layout: version, codec tag, write time (float64),
+        soft expiry (float64), load time (float32), codec payload.
+        """
+        written_at = time.time()
+        return (
+            ENTRY_VERSION
+            + self._codec.tag
+            + ENTRY_HEADER.pack(written_at, written_at + soft_lifetime, delta)
+            + self._codec.encode(data)
+        )
+
+    def _load(self: Self, value: bytes) -> Optional[CacheEntry[SInfoUser]]:
+        return self._load_with(value, lambda codec, data: codec.decode(data))
+
+    def _load_json(self: Self, value: bytes) -> Optional[CacheEntry[bytes]]:
+        return self._load_with(value, lambda codec, data: codec.to_json(data))
+
+    def _load_with(
+        self: Self,
+        value: bytes,
+        decode: Callable[[CacheCodecProtocol[SInfoUser], bytes], V],
+    ) -> Optional[CacheEntry[V]]:
+        """Deserialize the value, entries that cannot be decoded
+        are treated as missing."""
+        if value[:1] == NEGATIVE_ENTRY:
+            return self._load_negative(value)
+        try:
+            codec, written_at, soft_expires_at, delta, payload = self._split(
+                value
+            )
+            data = decode(codec, payload)
+        except (ValueError, struct.error, UnicodeDecodeError):
+            log.warning("Undecodable cache entry: %r.", value[:16])
+            metrics.inc("users_cache_decode_errors")
+            return None
+        return self._with_freshness(data, written_at, soft_expires_at, delta)
+
+    def _with_freshness(
+        self: Self,
+        data: V,
+        written_at: float,
+        soft_expires_at: float,
+        delta: float,
+    ) -> Optional[CacheEntry[V]]:
+        """Decide whether the value should be refreshed.
+
+        An entry past its soft expiry is stale. Before that the refresh is
+        started early with a probability growing towards the expiry
+        (XFetch), so hot keys are reloaded by a single request.
+        Entries older than the maximum lifetime are treated as missing:
+        fields of a bucket have no own TTL and sliding reads prolong it.
+        """
+        now = time.time()
+        if now >= written_at + self._max_lifetime:
+            metrics.inc("users_cache_lifetime_cap_misses")
             return None
+        if now >= soft_expires_at:
+            metrics.inc("users_cache_stale_hits")
+            return CacheEntry(data, is_stale=True, needs_refresh=True)
+        early_by = -delta * self._config.XFETCH_BETA
+        early_by *= math.log(1.0 - random.random())
+        if now + early_by >= soft_expires_at:
+            metrics.inc("users_cache_early_refreshes")
+            return CacheEntry(data, needs_refresh=True)
+        return CacheEntry(data)
+
+    def _load_negative(
+        self: Self,
+        value: bytes,
+    ) -> Optional[CacheEntry[V]]:
+        """Negative entries carry their expiry when stored in a bucket."""
+        if value[1:]:
+            (expires_at,) = NEGATIVE_HEADER.unpack_from(value, 1)
+            if expires_at <= time.time():
+                return None
+        return CacheEntry(None, is_negative=True)
+
+    def _split(
+        self: Self,
+        value: bytes,
+    ) -> Tuple[CacheCodecProtocol[SInfoUser], float, float, float, bytes]:
+        """Split the entry into codec, write time, soft expiry, load time
+        and payload. Plain JSON entries have no header, they never expire
+        softly."""
+        if value[:1] == ENTRY_VERSION:
+            codec = self._codec_by_tag(value[1:2])
+            written_at, soft_expires_at, delta = ENTRY_HEADER.unpack_from(
+                value, 2
+            )
+            payload = value[2 + ENTRY_HEADER.size :]
+            return codec, written_at, soft_expires_at, delta, payload
+        if value[:1] == b"{":
+            return JSON_CODEC, math.inf, math.inf, 0.0, value
+        raise ValueError(f"Unknown cache entry version: {value[:1]!r}.")
 
-        return [SInfoUser.model_validate_json(v) for v in values if v]
+    @staticmethod
+    def _codec_by_tag(tag: bytes) -> CacheCodecProtocol[SInfoUser]:
+        codec = CODECS_BY_TAG.get(tag)
+        if codec is None:
+            raise ValueError(f"Unknown codec tag: {tag!r}.")
+        return codec
@@ -0,0 +1,161 @@
+"""
+A module that describes a cache tier skipped while the cache storage fails.
+"""
+
+from typing import Dict, List, Optional, Self, Sequence, TypeVar
+
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.circuit_breaker import CircuitBreaker
+from users_management.gateways.repositories import (
+    CacheEntry,
+    CacheRepositoryProtocol,
+)
+
+
+T = TypeVar("T")
+
+
+class BreakerCacheRepositoryImpl(CacheRepositoryProtocol[T]):
+    """Cache repository guarded by a circuit breaker.
+
+    Failing calls are answered as misses and no-ops, so the requests are
+    served from the database; once the circuit opens the storage is not
+    called at all. Writes that failed or were skipped may leave stale
+    entries behind, their deletion is deferred until the circuit closes.
+
+    Only the calls reaching the storage may go through the breaker,
+    any other success would close the circuit.
+
+    Args:
+        cache (CacheRepositoryProtocol[T]): guarded cache repository.
+        breaker (CircuitBreaker): process-wide breaker of the storage.
+        config (RedisConfig): Redis config.
+    """
+
+    def __init__(
+        self: Self,
+        cache: CacheRepositoryProtocol[T],
+        breaker: CircuitBreaker,
+        config: RedisConfig,
+    ) -> None:
+        self._cache = cache
+        self._breaker = breaker
+        self._config = config
+
+    async def add(
+        self: Self,
+        key: str,
+        data: T,
+        delta: float = 0.0,
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        await self._breaker.call(
+            lambda: self._cache.add(
+                key, data, delta, index_keys, stale_index_keys
+            ),
+            None,
+            invalidation=lambda: self._cache.delete(
+                key, [*index_keys, *stale_index_keys]
+            ),
+        )
+
+    async def update_fields(
+        self: Self,
+        key: str,
+        data: T,
+        fields: Sequence[str],
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        await self._breaker.call(
+            lambda: self._cache.update_fields(
+                key, data, fields, index_keys, stale_index_keys
+            ),
+            None,
+            invalidation=lambda: self._cache.delete(
+                key, [*index_keys, *stale_index_keys]
+            ),
+        )
+
+    async def resolve_index(self: Self, index_key: str) -> Optional[str]:
+        return await self._breaker.call(
+            lambda: self._cache.resolve_index(index_key), None
+        )
+
+    async def add_negative(self: Self, key: str) -> None:
+        if not self._config.NEGATIVE_CACHE_LIFETIME:
+            return
+        await self._breaker.call(lambda: self._cache.add_negative(key), None)
+
+    async def delete(
+        self: Self,
+        key: str,
+        index_keys: Sequence[str] = (),
+    ) -> None:
+        await self._breaker.call(
+            lambda: self._cache.delete(key, index_keys),
+            None,
+            invalidation=lambda: self._cache.delete(key, index_keys),
+        )
+
+    async def get(self: Self, key: str) -> Optional[T]:
+        return await self._breaker.call(lambda: self._cache.get(key), None)
+
+    async def get_entry(self: Self, key: str) -> Optional[CacheEntry[T]]:
+        return await self._breaker.call(
+            lambda: self._cache.get_entry(key), None
+        )
+
+    async def get_json(self: Self, key: str) -> Optional[CacheEntry[bytes]]:
+        return await self._breaker.call(lambda: self._cache.get_json(key), None)
+
+    async def add_list(self: Self, data_map: Dict[str, T]) -> None:
+        if not data_map:
+            return
+        await self._breaker.call(lambda: self._cache.add_list(data_map), None)
+
+    async def delete_list(self: Self, keys: List[str]) -> None:
+        if not keys:
+            return
+        await self._breaker.call(
+            lambda: self._cache.delete_list(keys),
+            None,
+            invalidation=lambda: self._cache.delete_list(keys),
+        )
+
+    async def get_list(self: Self, keys: List[str]) -> List[Optional[T]]:
+        if not keys:
+            return []
+        return await self._breaker.call(
+            lambda: self._cache.get_list(keys), [None] * len(keys)
+        )
+
+    async def get_list_json(
+        self: Self, keys: List[str]
+    ) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self._breaker.call(
+            lambda: self._cache.get_list_json(keys), [None] * len(keys)
+        )
+
+    async def acquire_lease(self: Self, key: str) -> bool:
+        if not self._config.LEASE_ENABLED:
+            return await self._cache.acquire_lease(key)
+        # without the storage every instance loads the value itself
+        return await self._breaker.call(
+            lambda: self._cache.acquire_lease(key), True
+        )
+
+    async def release_lease(self: Self, key: str) -> None:
+        # no lease is held if it was granted while the circuit was open
+        if not self._cache.holds_lease(key):
+            return
+        await self._breaker.call(lambda: self._cache.release_lease(key), None)
+
+    def holds_lease(self: Self, key: str) -> bool:
+        return self._cache.holds_lease(key)
+
+    async def wait_for(self: Self, key: str) -> Optional[CacheEntry[T]]:
+        return await self._breaker.call(lambda: self._cache.wait_for(key), None)
@@ -0,0 +1,283 @@
+"""
+A module that describes users cache storing every field of a user separately.
+"""
+
+from datetime import datetime, timedelta
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Self, Sequence
+
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.metrics import metrics
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.cache_layouts import CacheLayoutProtocol
+from users_management.gateways.codecs import CacheCodecProtocol
+from users_management.gateways.repositories import (
+    CacheEntry,
+    handle_redis_exceptions,
+)
+from users_management.gateways.repositories.impls.users_cache import (
+    UsersCacheRepositoryImpl,
+    V,
+)
+
+
+log = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1)  # updated_at is naive UTC
+
+# Writes the fields not newer in the cache than the given version.
+# A patch is only applied to an existing entry, a full write replaces
+# a negative entry and renews the soft expiry and the lifetime.
+# KEYS[1] - entry key; ARGV: version, full write flag, lifetime,
+# write time, soft expiry, load time, then field and value pairs.
+WRITE_FIELDS_SCRIPT = """
+local key = KEYS[1]
+local full = ARGV[2] == "1"
+if redis.call("HEXISTS", key, "n") == 1 then
+    if not full then return 0 end
+    redis.call("DEL", key)
+end
+if not full and redis.call("EXISTS", key) == 0 then
+    return 0
+end
+local version = tonumber(ARGV[1])
+local written = 0
+for i = 7, #ARGV, 2 do
+    local current = redis.call("HGET", key, "v:" .. ARGV[i])
+    if not current or tonumber(current) <= version then
+        redis.call("HSET", key, ARGV[i], ARGV[i + 1], "v:" .. ARGV[i], ARGV[1])
+        written = written + 1
+    end
+end
+if full then
+    redis.call("HSET", key, "w", ARGV[4], "s", ARGV[5], "d", ARGV[6])
+    redis.call("EXPIRE", key, ARGV[3])
+end
+return written
+"""
+
+
+class UsersFieldsCacheRepositoryImpl(UsersCacheRepositoryImpl):
+    """Keeps every user as a Redis hash with a version per field.
+
+    A PATCH writes only the changed fields, and a write carrying an older
+    version than the cached field (a late cache fill or a reordered
+    update) does not overwrite it. The row updated_at is the version.
+    Entries are not encoded by the codec.
+
+    Args:
+        redis (redis.Redis): Redis instance.
+        config (RedisConfig): Redis config.
+        codec (CacheCodecProtocol[SInfoUser]): codec, unused by the entries.
+        layout (CacheLayoutProtocol): layout of the plain keys.
+        ttl_policy (CacheTTLPolicy): lifetimes of the entries.
+    """
+
+    FIELDS = ("user_id", "nickname", "avatar")
+
+    def __init__(
+        self: Self,
+        redis: redis.Redis,
+        config: RedisConfig,
+        codec: CacheCodecProtocol[SInfoUser],
+        layout: CacheLayoutProtocol,
+        ttl_policy: CacheTTLPolicy,
+    ) -> None:
+        super().__init__(redis, config, codec, layout, ttl_policy)
+        self._write_fields_script = self._redis.register_script(
+            WRITE_FIELDS_SCRIPT
+        )
+
+    @handle_redis_exceptions
+    async def add(
+        self: Self,
+        key: str,
+        data: SInfoUser,
+        delta: float = 0.0,
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        log.info("Adding cache fields by key: %s.", key)
+        pipeline = self._write_pipeline(index_keys, stale_index_keys)
+        lifetime = await self._queue_write(
+            pipeline, key, data, self.FIELDS, delta
+        )
+        for index_key in index_keys:
+            pipeline.set(index_key, key, ex=lifetime)
+        await pipeline.execute()
+
+    @handle_redis_exceptions
+    async def update_fields(
+        self: Self,
+        key: str,
+        data: SInfoUser,
+        fields: Sequence[str],
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        log.info("Updating cache fields %s by key: %s.", fields, key)
+        pipeline = self._write_pipeline(index_keys, stale_index_keys)
+        lifetime = await self._queue_write(pipeline, key, data, fields, None)
+        for index_key in index_keys:
+            pipeline.set(index_key, key, ex=lifetime)
+        await pipeline.execute()
+
+    @handle_redis_exceptions
+    async def add_negative(self: Self, key: str) -> None:
+        if not self._config.NEGATIVE_CACHE_LIFETIME:
+            return
+        log.info("Adding negative cache by key: %s.", key)
+        pipeline = self._redis.pipeline(transaction=True)
+        pipeline.delete(key)
+        pipeline.hset(key, "n", 1)
+        pipeline.expire(key, self._config.NEGATIVE_CACHE_LIFETIME)
+        await pipeline.execute()
+
+    @handle_redis_exceptions
+    async def get_entry(
+        self: Self,
+        key: str,
+    ) -> Optional[CacheEntry[SInfoUser]]:
+        log.info("Searching the cache fields by key: %s.", key)
+        (value,) = await self._hgetall([key])
+        return self._load_fields(value)
+
+    @handle_redis_exceptions
+    async def get_json(self: Self, key: str) -> Optional[CacheEntry[bytes]]:
+        log.info("Searching the cache fields JSON by key: %s.", key)
+        (value,) = await self._hgetall([key])
+        return self._load_fields_json(value)
+
+    @handle_redis_exceptions
+    async def add_list(self, data_map: Dict[str, SInfoUser]) -> None:
+        log.info("Adding cache fields by keys: %s.", list(data_map))
+        pipeline = self._redis.pipeline(transaction=False)
+        for key, user in data_map.items():
+            await self._queue_write(pipeline, key, user, self.FIELDS, 0.0)
+        await pipeline.execute()
+
+    @handle_redis_exceptions
+    async def get_list(self, keys: List[str]) -> List[Optional[SInfoUser]]:
+        log.info("Searching the cache fields by keys: %s.", keys)
+        entries = [self._load_fields(v) for v in await self._hgetall(keys)]
+        return [entry.value if entry else None for entry in entries]
+
+    @handle_redis_exceptions
+    async def get_list_json(self, keys: List[str]) -> List[Optional[bytes]]:
+        log.info("Searching the cache fields JSON by keys: %s.", keys)
+        entries = [self._load_fields_json(v) for v in await self._hgetall(keys)]
+        return [entry.value if entry else None for entry in entries]
+
+    def _write_pipeline(
+        self: Self,
+        index_keys: Sequence[str],
+        stale_index_keys: Sequence[str],
+    ) -> Pipeline:
+        """Pipeline of an entry write with the stale index keys dropped,
+        a transaction if the index is changed."""
+        pipeline = self._redis.pipeline(
+            transaction=bool(index_keys or stale_index_keys)
+        )
+        if stale_index_keys:
+            pipeline.delete(*stale_index_keys)
+        return pipeline
+
+    async def _queue_write(
+        self: Self,
+        pipeline: Pipeline,
+        key: str,
+        data: SInfoUser,
+        fields: Sequence[str],
+        delta: Optional[float],
+    ) -> int:
+        """Queue the fields write, a full write if the delta is given.
+
+        Returns the lifetime of the entry.
+        """
+        values = data.model_dump(include=set(fields))
+        lifetime, soft_lifetime = self._ttl_policy.lifetimes(key)
+        written_at = time.time()
+        args: List[str | int | float] = [
+            self._version(data),
+            int(delta is not None),
+            lifetime,
+            written_at,
+            written_at + soft_lifetime,
+            delta or 0.0,
+        ]
+        for field, value in values.items():
+            args.extend(
+                (field, int(value) if isinstance(value, bool) else value)
+            )
+        await self._write_fields_script(keys=[key], args=args, client=pipeline)
+        return lifetime
+
+    async def _hgetall(self: Self, keys: List[str]) -> List[Dict[bytes, bytes]]:
+        """Read the entries, prolonging them in the sliding mode."""
+        pipeline = self._redis.pipeline(transaction=False)
+        for key in keys:
+            self._ttl_policy.record_access(key)
+            pipeline.hgetall(key)
+        if self._sliding:
+            for key in keys:
+                lifetime = self._ttl_policy.sliding_lifetime(key)
+                pipeline.expire(key, lifetime)
+        return (await pipeline.execute())[: len(keys)]
+
+    def _load_fields(
+        self: Self,
+        value: Dict[bytes, bytes],
+    ) -> Optional[CacheEntry[SInfoUser]]:
+        return self._load_fields_with(value, lambda user: SInfoUser(**user))
+
+    def _load_fields_json(
+        self: Self,
+        value: Dict[bytes, bytes],
+    ) -> Optional[CacheEntry[bytes]]:
+        return self._load_fields_with(
+            value,
+            lambda user: json.dumps(
+                user, ensure_ascii=False, separators=(",", ":")
+            ).encode(),
+        )
+
+    def _load_fields_with(
+        self: Self,
+        value: Dict[bytes, bytes],
+        build: Callable[[Dict[str, Any]], V],
+    ) -> Optional[CacheEntry[V]]:
+        """Build the value from the fields, entries lacking a field
+        are treated as missing."""
+        if not value:
+            return None
+        if b"n" in value:
+            return CacheEntry(None, is_negative=True)
+        try:
+            user = {
+                "user_id": int(value[b"user_id"]),
+                "nickname": value[b"nickname"].decode(),
+                "avatar": value[b"avatar"] == b"1",
+            }
+            written_at = float(value[b"w"])
+            soft_expires_at = float(value[b"s"])
+            delta = float(value[b"d"])
+        except (KeyError, ValueError, UnicodeDecodeError):
+            log.warning("Incomplete cache entry: %r.", sorted(value))
+            metrics.inc("users_cache_decode_errors")
+            return None
+        return self._with_freshness(
+            build(user), written_at, soft_expires_at, delta
+        )
+
+    @staticmethod
+    def _version(data: SInfoUser) -> int:
+        """Row version in microseconds, 0 if unknown."""
+        if not data.updated_at:
+            return 0
+        return (data.updated_at - EPOCH) // timedelta(microseconds=1)
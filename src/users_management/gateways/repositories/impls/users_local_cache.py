@@ -0,0 +1,383 @@
+"""
+A module that describes an in-process cache tier in front of the cache storage.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+import logging
+import time
+from typing import (
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.utils.circuit_breaker import CircuitBreaker
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.repositories import (
+    CacheEntry,
+    CacheRepositoryProtocol,
+    handle_redis_exceptions,
+)
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LocalCacheStore(Generic[T]):
+    """Size-bounded LRU storage with TTL, shared by the whole worker process.
+
+    ``version`` grows on every change of a key: a value read before its
+    key changed may be stale and is not stored, see ``set``. The changes
+    of the last ``max_size`` keys are remembered, the reads older than
+    the forgotten ones are not stored at all.
+
+    Args:
+        max_size (int): maximum number of stored entries.
+        lifetime (int): lifetime of the entry in seconds.
+    """
+
+    # seconds an own write is expected to be reported back by Redis
+    OWN_CHANGE_WINDOW: float = 1.0
+
+    def __init__(self: Self, max_size: int, lifetime: int) -> None:
+        self._max_size = max_size
+        self._lifetime = lifetime
+        self._data: OrderedDict[str, Tuple[float, T]] = OrderedDict()
+        self._changes: OrderedDict[str, int] = OrderedDict()
+        self._forgotten_version = 0
+        # number of own writes in flight and when they are given up
+        self._own_changes: Dict[str, Tuple[int, float]] = {}
+        self.instance_id: str = uuid4().hex
+        self.hits: int = 0
+        self.misses: int = 0
+        self.version: int = 0
+
+    def get(self: Self, key: str) -> Optional[T]:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self: Self, key: str, value: T, version: Optional[int] = None
+    ) -> None:
+        """Store the value read at the version, unless the key changed
+        since. Without the version the value is written by the process,
+        the reads of the key in flight are outdated."""
+        if version is None:
+            self._change(key)
+        elif self.changed_since(key, version):
+            return
+        self._data[key] = (time.monotonic() + self._lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def changed_since(self: Self, key: str, version: int) -> bool:
+        return (
+            self._forgotten_version > version
+            or self._changes.get(key, 0) > version
+        )
+
+    def pop(self: Self, key: str) -> None:
+        self._change(key)
+        self._data.pop(key, None)
+
+    def expect_change(self: Self, key: str) -> None:
+        """Register an own write about to be reported back by Redis."""
+        count, _ = self._own_changes.pop(key, (0, 0.0))
+        self._own_changes[key] = (
+            count + 1,
+            time.monotonic() + self.OWN_CHANGE_WINDOW,
+        )
+        if len(self._own_changes) > self._max_size:
+            del self._own_changes[next(iter(self._own_changes))]
+
+    def forget_change(self: Self, key: str) -> None:
+        """Unregister an own write that failed."""
+        count, deadline = self._own_changes.pop(key, (0, 0.0))
+        if count > 1:
+            self._own_changes[key] = (count - 1, deadline)
+
+    def invalidate(self: Self, key: str) -> None:
+        """Drop the entry changed in the storage, unless it is the report
+        of an own write, which the entry already holds.
+
+        An own write which did not change the storage, e.g. skipped
+        by the circuit breaker, takes a change by another instance
+        for its report during ``OWN_CHANGE_WINDOW``.
+        """
+        count, deadline = self._own_changes.get(key, (0, 0.0))
+        if count:
+            self.forget_change(key)
+            if deadline > time.monotonic():
+                return
+        self.pop(key)
+
+    def clear(self: Self) -> None:
+        self.version += 1
+        self._forgotten_version = self.version
+        self._changes.clear()
+        self._own_changes.clear()
+        self._data.clear()
+
+    def _change(self: Self, key: str) -> None:
+        self.version += 1
+        self._changes[key] = self.version
+        self._changes.move_to_end(key)
+        if len(self._changes) > self._max_size:
+            _, self._forgotten_version = self._changes.popitem(last=False)
+
+    def size(self: Self) -> int:
+        return len(self._data)
+
+    def hit_ratio(self: Self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidationChannel:
+    """Pub/sub channel the local cache invalidations are published to.
+
+    Attributes:
+        redis (redis.Redis): Redis instance used to publish invalidations.
+        name (str): channel name.
+        breaker (Optional[CircuitBreaker]): breaker of the cache storage,
+            the invalidations are deferred while its circuit is open.
+    """
+
+    redis: redis.Redis
+    name: str
+    breaker: Optional[CircuitBreaker] = None
+
+
+class UsersLocalCacheRepositoryImpl(CacheRepositoryProtocol[SInfoUser]):
+    """In-process tier layered over another users cache repository.
+
+    Writes go through to the wrapped repository and are announced on the
+    invalidation channel, so other workers drop their local copies.
+    Without a channel Redis reports the changes to them itself.
+
+    Args:
+        cache (CacheRepositoryProtocol[SInfoUser]): wrapped cache repository.
+        store (LocalCacheStore[SInfoUser]): process-wide local storage.
+        ttl_policy (CacheTTLPolicy): lifetimes policy counting the reads
+            served locally.
+        channel (Optional[InvalidationChannel]): invalidation channel,
+            None if Redis reports the changes itself (client tracking).
+    """
+
+    def __init__(
+        self: Self,
+        cache: CacheRepositoryProtocol[SInfoUser],
+        store: LocalCacheStore[SInfoUser],
+        ttl_policy: CacheTTLPolicy,
+        channel: Optional[InvalidationChannel],
+    ) -> None:
+        self._cache = cache
+        self._store = store
+        self._ttl_policy = ttl_policy
+        self._channel = channel
+
+    async def add(
+        self: Self,
+        key: str,
+        data: SInfoUser,
+        delta: float = 0.0,
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        with self._own_change(key):
+            await self._cache.add(
+                key, data, delta, index_keys, stale_index_keys
+            )
+        self._store.set(key, data)
+        await self._publish_invalidation(key)
+
+    async def update_fields(
+        self: Self,
+        key: str,
+        data: SInfoUser,
+        fields: Sequence[str],
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        with self._own_change(key):
+            await self._cache.update_fields(
+                key, data, fields, index_keys, stale_index_keys
+            )
+        self._store.set(key, data)
+        await self._publish_invalidation(key)
+
+    async def resolve_index(self: Self, index_key: str) -> Optional[str]:
+        return await self._cache.resolve_index(index_key)
+
+    async def get(self: Self, key: str) -> Optional[SInfoUser]:
+        if user := self._store.get(key):
+            log.info("Local cache hit by key: %s.", key)
+            self._ttl_policy.record_access(key)
+            return user
+        version = self._store.version
+        user = await self._cache.get(key)
+        if user:
+            self._store.set(key, user, version)
+        return user
+
+    async def get_entry(
+        self: Self, key: str
+    ) -> Optional[CacheEntry[SInfoUser]]:
+        if user := self._store.get(key):
+            log.info("Local cache hit by key: %s.", key)
+            self._ttl_policy.record_access(key)
+            return CacheEntry(user)
+        version = self._store.version
+        entry = await self._cache.get_entry(key)
+        if entry and entry.value and not entry.needs_refresh:
+            self._store.set(key, entry.value, version)
+        return entry
+
+    async def get_json(self: Self, key: str) -> Optional[CacheEntry[bytes]]:
+        if user := self._store.get(key):
+            log.info("Local cache hit by key: %s.", key)
+            self._ttl_policy.record_access(key)
+            return CacheEntry(user.model_dump_json().encode())
+        return await self._cache.get_json(key)
+
+    async def add_negative(self: Self, key: str) -> None:
+        await self._cache.add_negative(key)
+        self._store.pop(key)
+
+    async def delete(
+        self: Self,
+        key: str,
+        index_keys: Sequence[str] = (),
+    ) -> None:
+        await self._cache.delete(key, index_keys)
+        self._store.pop(key)
+        await self._publish_invalidation(key)
+
+    async def add_list(self: Self, data_map: Dict[str, SInfoUser]) -> None:
+        await self._cache.add_list(data_map)
+
+    async def delete_list(self: Self, keys: List[str]) -> None:
+        await self._cache.delete_list(keys)
+        for key in keys:
+            self._store.pop(key)
+        await self._publish_invalidation(*keys)
+
+    async def get_list(
+        self: Self, keys: List[str]
+    ) -> List[Optional[SInfoUser]]:
+        users = self._get_local(keys)
+        missing_keys = [key for key, user in zip(keys, users) if user is None]
+        if not missing_keys:
+            log.info("Local cache hit by keys: %s.", keys)
+            return users
+        version = self._store.version
+        found = dict(
+            zip(missing_keys, await self._cache.get_list(missing_keys))
+        )
+        for key, user in found.items():
+            if user:
+                self._store.set(key, user, version)
+        return [user or found[key] for key, user in zip(keys, users)]
+
+    async def get_list_json(
+        self: Self, keys: List[str]
+    ) -> List[Optional[bytes]]:
+        users = self._get_local(keys)
+        missing_keys = [key for key, user in zip(keys, users) if user is None]
+        found = (
+            dict(
+                zip(missing_keys, await self._cache.get_list_json(missing_keys))
+            )
+            if missing_keys
+            else {}
+        )
+        return [
+            user.model_dump_json().encode() if user else found[key]
+            for key, user in zip(keys, users)
+        ]
+
+    async def acquire_lease(self: Self, key: str) -> bool:
+        return await self._cache.acquire_lease(key)
+
+    async def release_lease(self: Self, key: str) -> None:
+        await self._cache.release_lease(key)
+
+    def holds_lease(self: Self, key: str) -> bool:
+        return self._cache.holds_lease(key)
+
+    async def wait_for(
+        self: Self,
+        key: str,
+    ) -> Optional[CacheEntry[SInfoUser]]:
+        version = self._store.version
+        entry = await self._cache.wait_for(key)
+        if entry and entry.value:
+            self._store.set(key, entry.value, version)
+        return entry
+
+    def _get_local(self: Self, keys: List[str]) -> List[Optional[SInfoUser]]:
+        users = [self._store.get(key) for key in keys]
+        for key, user in zip(keys, users):
+            if user is not None:
+                self._ttl_policy.record_access(key)
+        return users
+
+    @contextmanager
+    def _own_change(self: Self, key: str) -> Iterator[None]:
+        """Announce the write Redis reports back in the tracking mode,
+        so that the entry written locally is not dropped."""
+        if self._channel is not None:
+            yield
+            return
+        self._store.expect_change(key)
+        try:
+            yield
+        except BaseException:
+            self._store.forget_change(key)
+            raise
+
+    async def _publish_invalidation(self: Self, *keys: str) -> None:
+        if self._channel is None or not keys:
+            return
+        if self._channel.breaker is None:
+            await self._publish(self._channel, *keys)
+            return
+        publish = partial(self._publish, self._channel, *keys)
+        await self._channel.breaker.call(publish, None, invalidation=publish)
+
+    @handle_redis_exceptions
+    async def _publish(
+        self: Self, channel: InvalidationChannel, *keys: str
+    ) -> None:
+        log.info("Publishing local cache invalidation by keys: %s.", keys)
+        pipeline = channel.redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.publish(channel.name, f"{self._store.instance_id}|{key}")
+        await pipeline.execute()
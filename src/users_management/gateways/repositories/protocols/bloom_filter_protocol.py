@@ -0,0 +1,57 @@
+"""
+Module describing the interface of the probabilistic set membership filter.
+"""
+
+from abc import abstractmethod
+from typing import AsyncIterator, List, Optional, Protocol, Self
+
+
+class BloomFilterRepositoryProtocol(Protocol):
+    @abstractmethod
+    async def add(self: Self, item: str) -> None:
+        """Add the item to the filter.
+
+        Args:
+            item (str): item to be added.
+        """
+        ...
+
+    @abstractmethod
+    async def add_list(self: Self, items: List[str]) -> None:
+        """Add several items to the filter in one round trip.
+
+        Args:
+            items (List[str]): items to be added.
+        """
+        ...
+
+    @abstractmethod
+    async def might_contain(self: Self, item: str) -> Optional[bool]:
+        """Check the item membership.
+
+        Args:
+            item (str): item to check.
+
+        Returns:
+            Optional[bool]: False if the item was definitely never added,
+                True if it might have been added,
+                None if the filter is not built yet.
+        """
+        ...
+
+    @abstractmethod
+    async def drop(self: Self) -> None:
+        """Drop the filter, it is not built until the next rebuild."""
+        ...
+
+    @abstractmethod
+    async def rebuild(self: Self, batches: AsyncIterator[List[str]]) -> int:
+        """Build the filter from scratch and replace the current one.
+
+        Args:
+            batches (AsyncIterator[List[str]]): all items in batches.
+
+        Returns:
+            int: number of added items.
+        """
+        ...
@@ -3,27 +3,237 @@ Module describing the interface for interacting with the cache repository.
 """
 
 from abc import abstractmethod
-from typing import List, Optional, Protocol, Self, TypeVar
+from dataclasses import dataclass
+from typing import (
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Self,
+    Sequence,
+    TypeVar,
+)
 
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True, slots=True)
+class CacheEntry(Generic[T]):
+    """Cached value with its freshness state.
+
+    Attributes:
+        value (Optional[T]): cached value, None for negative entries.
+        is_stale (bool): the value is past its soft expiry.
+        needs_refresh (bool): the value should be reloaded in the background.
+        is_negative (bool): the value is known to be missing
+            from the primary storage.
+    """
+
+    value: Optional[T]
+    is_stale: bool = False
+    needs_refresh: bool = False
+    is_negative: bool = False
+
+
 class CacheRepositoryProtocol(Protocol[T]):
     @abstractmethod
-    async def add(self: Self, key: str, data: T) -> None: ...
+    async def add(
+        self: Self,
+        key: str,
+        data: T,
+        delta: float = 0.0,
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        """Add a value, atomically with its secondary index keys.
+
+        Args:
+            key (str): key of the value.
+            data (T): value.
+            delta (float): seconds spent to load the value,
+                used to schedule an early refresh.
+            index_keys (Sequence[str]): secondary keys pointing to the key.
+            stale_index_keys (Sequence[str]): secondary keys to be removed.
+        """
+        ...
+
+    @abstractmethod
+    async def update_fields(
+        self: Self,
+        key: str,
+        data: T,
+        fields: Sequence[str],
+        index_keys: Sequence[str] = (),
+        stale_index_keys: Sequence[str] = (),
+    ) -> None:
+        """Write the changed fields of a cached value.
+
+        Fields older than the already cached ones are not written,
+        layouts storing the value as a whole rewrite it entirely.
+
+        Args:
+            key (str): key of the value.
+            data (T): new state of the value.
+            fields (Sequence[str]): names of the changed fields.
+            index_keys (Sequence[str]): secondary keys pointing to the key.
+            stale_index_keys (Sequence[str]): secondary keys to be removed.
+        """
+        ...
+
+    @abstractmethod
+    async def resolve_index(self: Self, index_key: str) -> Optional[str]:
+        """Get the key a secondary index key points to.
+
+        Args:
+            index_key (str): secondary key.
+
+        Returns:
+            Optional[str]: key of the value or None if the index is missing.
+        """
+        ...
+
+    @abstractmethod
+    async def add_negative(self: Self, key: str) -> None:
+        """Remember for a short time that the value is missing.
+
+        Args:
+            key (str): key of the missing value.
+        """
+        ...
 
     @abstractmethod
-    async def delete(self: Self, key: str) -> None: ...
+    async def delete(
+        self: Self,
+        key: str,
+        index_keys: Sequence[str] = (),
+    ) -> None:
+        """Delete a value with its secondary index keys.
+
+        Args:
+            key (str): key of the value.
+            index_keys (Sequence[str]): secondary keys pointing to the key.
+        """
+        ...
 
     @abstractmethod
     async def get(self: Self, key: str) -> Optional[T]: ...
 
     @abstractmethod
-    async def add_list(self, data_list: List[T]) -> None: ...
+    async def get_entry(self: Self, key: str) -> Optional[CacheEntry[T]]:
+        """Get a value with its freshness state.
+
+        Args:
+            key (str): key of the value.
+
+        Returns:
+            Optional[CacheEntry[T]]: entry or None if the key is missing.
+        """
+        ...
+
+    @abstractmethod
+    async def get_json(self: Self, key: str) -> Optional[CacheEntry[bytes]]:
+        """Get the JSON of a value without building the value.
+
+        Args:
+            key (str): key of the value.
+
+        Returns:
+            Optional[CacheEntry[bytes]]: entry or None if the key is missing.
+        """
+        ...
+
+    @abstractmethod
+    async def add_list(self, data_map: Dict[str, T]) -> None:
+        """Add several values in one round trip.
+
+        Args:
+            data_map (Dict[str, T]): values by their keys.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_list(self: Self, keys: List[str]) -> None:
+        """Delete several values in one round trip.
+
+        Args:
+            keys (List[str]): keys of the values.
+        """
+        ...
 
     @abstractmethod
     async def get_list(
         self,
         keys: List[str],
-    ) -> Optional[List[T]]: ...
+    ) -> List[Optional[T]]:
+        """Get several values in one round trip.
+
+        Args:
+            keys (List[str]): keys to search for.
+
+        Returns:
+            List[Optional[T]]: values in the order of the keys,
+                None for every key missing from the cache.
+        """
+        ...
+
+    @abstractmethod
+    async def get_list_json(
+        self,
+        keys: List[str],
+    ) -> List[Optional[bytes]]:
+        """Get the JSON of several values in one round trip.
+
+        Args:
+            keys (List[str]): keys to search for.
+
+        Returns:
+            List[Optional[bytes]]: JSON of the values in the order of the keys,
+                None for every key missing from the cache.
+        """
+        ...
+
+    @abstractmethod
+    async def acquire_lease(self: Self, key: str) -> bool:
+        """Take the right to fill the key from the primary storage.
+
+        Args:
+            key (str): key to be filled.
+
+        Returns:
+            bool: True if the caller should fill the key,
+                False if another caller is already filling it.
+        """
+        ...
+
+    @abstractmethod
+    async def release_lease(self: Self, key: str) -> None:
+        """Release the lease taken by acquire_lease.
+
+        Args:
+            key (str): filled key.
+        """
+        ...
+
+    @abstractmethod
+    def holds_lease(self: Self, key: str) -> bool:
+        """Whether the lease of the key is taken by this repository
+        and is still to be released in the storage.
+
+        Args:
+            key (str): filled key.
+        """
+        ...
+
+    @abstractmethod
+    async def wait_for(self: Self, key: str) -> Optional[CacheEntry[T]]:
+        """Wait for the value filled by the lease holder.
+
+        Args:
+            key (str): key to wait for.
+
+        Returns:
+            Optional[CacheEntry[T]]: entry or None if the wait timed out.
+        """
+        ...
@@ -0,0 +1,29 @@
+"""
+Module describing the interface of the persisted keys popularity ranking.
+"""
+
+from abc import abstractmethod
+from typing import Dict, List, Protocol, Self
+
+
+class HotKeysRepositoryProtocol(Protocol):
+    @abstractmethod
+    async def add_reads(self: Self, reads: Dict[int, int]) -> None:
+        """Decay the ranking and add the reads counted since the last call.
+
+        Args:
+            reads (Dict[int, int]): read counts by key.
+        """
+        ...
+
+    @abstractmethod
+    async def top(self: Self, limit: int) -> List[int]:
+        """Get the most read keys.
+
+        Args:
+            limit (int): maximum number of keys.
+
+        Returns:
+            List[int]: keys, the most read first.
+        """
+        ...
@@ -4,12 +4,23 @@ that must be defined for the application to work.
 """
 
 from abc import abstractmethod
-from typing import Any, Dict, Protocol, Self
+from enum import StrEnum
+from typing import Any, AsyncIterator, Dict, List, Protocol, Self, Set, Tuple
 
-from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
 from users_management.app.schemas.users import SInfoUser
 
 
+class UserConflict(StrEnum):
+    """Unique constraint a new user conflicts with."""
+
+    USER_ID = "user_id"
+    NICKNAME = "nickname"
+
+
 class UsersRepositoryProtocol(Protocol):
     @abstractmethod
     async def get_user(
@@ -26,6 +37,68 @@ class UsersRepositoryProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def exists_nickname(
+        self: Self,
+        nickname: str,
+    ) -> bool:
+        """Check whether the nickname is taken.
+
+        Args:
+            nickname (str): nickname to check.
+
+        Returns:
+            bool: True if the nickname is taken.
+        """
+        ...
+
+    @abstractmethod
+    async def find_taken(
+        self: Self,
+        users_id: List[int],
+        nicknames: List[str],
+    ) -> Tuple[Set[int], Set[str]]:
+        """Find which of the IDs and nicknames are taken, in one query.
+
+        Args:
+            users_id (List[int]): IDs to check.
+            nicknames (List[str]): nicknames to check.
+
+        Returns:
+            Tuple[Set[int], Set[str]]: taken IDs and taken nicknames.
+        """
+        ...
+
+    def stream_nicknames(
+        self: Self,
+        batch_size: int,
+    ) -> AsyncIterator[List[str]]:
+        """Iterate over all nicknames with a server-side cursor.
+
+        Args:
+            batch_size (int): number of nicknames fetched per round trip.
+
+        Returns:
+            AsyncIterator[List[str]]: batches of nicknames.
+        """
+        ...
+
+    def stream_users(
+        self: Self,
+        users_id: List[int],
+        batch_size: int,
+    ) -> AsyncIterator[List[SInfoUser]]:
+        """Iterate over the users with a server-side cursor.
+
+        Args:
+            users_id (List[int]): IDs of the users.
+            batch_size (int): number of users fetched per round trip.
+
+        Returns:
+            AsyncIterator[List[SInfoUser]]: batches of the found users.
+        """
+        ...
+
     async def get_users_list(
         self: Self,
         users_id: list[int],
@@ -36,7 +109,8 @@ class UsersRepositoryProtocol(Protocol):
             users_id (list[int]): list of user.
 
         Returns:
-            list[SInfoUser]: list of requested user data.
+            list[SInfoUser]: list of requested user data, in the order
+                of the IDs, repeated IDs included.
         """
         ...
 
@@ -44,14 +118,32 @@ class UsersRepositoryProtocol(Protocol):
     async def create_user(
         self: Self,
         data: CreateUserRequest,
-    ) -> SInfoUser:
-        """Add a new user.
+    ) -> SInfoUser | UserConflict:
+        """Add a new user unless the ID or the nickname is taken.
 
         Args:
             data (CreateUserRequest): data to be added.
 
         Returns:
-            SInfoUser: user data.
+            SInfoUser | UserConflict: user data or the conflict
+                preventing the creation.
+        """
+        ...
+
+    @abstractmethod
+    async def create_users(
+        self: Self,
+        data: List[CreateUserRequest],
+    ) -> List[SInfoUser]:
+        """Add several new users in one statement.
+
+        Users conflicting with the existing ones are skipped.
+
+        Args:
+            data (List[CreateUserRequest]): data to be added.
+
+        Returns:
+            List[SInfoUser]: data of the added users.
         """
         ...
 
@@ -72,6 +164,23 @@ class UsersRepositoryProtocol(Protocol):
         """
         ...
 
+    @abstractmethod
+    async def update_users(
+        self: Self,
+        data: List[UpdateUserRequest],
+    ) -> List[SInfoUser]:
+        """Update several users in one statement.
+
+        Args:
+            data (List[UpdateUserRequest]): new data of the users,
+                one change per user.
+
+        Returns:
+            List[SInfoUser]: data of the updated users, the users
+                not found are left out.
+        """
+        ...
+
     @abstractmethod
     async def delete_user(
         self: Self,
@@ -83,3 +192,19 @@ class UsersRepositoryProtocol(Protocol):
             user_id (int): user id.
         """
         ...
+
+    @abstractmethod
+    async def delete_users(
+        self: Self,
+        users_id: List[int],
+    ) -> List[SInfoUser]:
+        """Delete several users in one statement.
+
+        Args:
+            users_id (List[int]): IDs of the users.
+
+        Returns:
+            List[SInfoUser]: data of the deleted users, the users
+                not found are left out.
+        """
+        ...
@@ -5,6 +5,9 @@ from users_management.core.settings import Settings
 from users_management.main import app
 
 
+pytest_plugins = ["fixtures.redis", "fixtures.sql"]
+
+
 @pytest.fixture(scope="session")
 def client():
     with TestClient(app) as client:
@@ -1,13 +1,19 @@
 import pytest
+from redis.exceptions import ConnectionError, TimeoutError
 
 from users_management.gateways.connections.impls.redis import (
     RedisConnectionManagerImpl,
 )
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 async def redis_manager(settings):
-    RedisManager = RedisConnectionManagerImpl(settings)
+    RedisManager = RedisConnectionManagerImpl(settings.redis)
     RedisManager.startup()
+    try:
+        await RedisManager.ping_all()
+    except (ConnectionError, TimeoutError):
+        await RedisManager.shutdown()
+        pytest.skip("Redis is not reachable.")
     yield RedisManager
     await RedisManager.shutdown()
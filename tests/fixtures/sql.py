@@ -1,13 +1,37 @@
 import pytest
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from users_management.app.models import InfoUser
 from users_management.gateways.connections.impls.sql import (
     SQLDatabaseManagerImpl,
 )
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 async def sql_helper(settings):
-    SQLDHhelper = SQLDatabaseManagerImpl(settings)
-    SQLDHhelper.startup()
-    yield SQLDHhelper
-    await SQLDHhelper.shutdown()
+    SQLDBHelper = SQLDatabaseManagerImpl(settings.sql_db)
+    SQLDBHelper.startup()
+    yield SQLDBHelper
+    await SQLDBHelper.shutdown()
+
+
+@pytest.fixture
+async def sql_session_factory(sql_helper):
+    """Sessions of a transaction rolled back after the test, the commits
+    of the units of work only release savepoints."""
+    engine = sql_helper.get_connection().kw["bind"]
+    try:
+        connection = await engine.connect()
+    except (OSError, InterfaceError, OperationalError):
+        pytest.skip("SQL database is not reachable.")
+    transaction = await connection.begin()
+    await connection.run_sync(InfoUser.metadata.create_all)
+    yield async_sessionmaker(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    await transaction.rollback()
+    await connection.close()
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Callable, List, Optional
+from uuid import uuid4
+
+import pytest
+
+from users_management.gateways.connections.impls.redis_tracking import (
+    RedisTrackingListenerImpl,
+)
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+@pytest.fixture
+def prefix():
+    return f"user:{uuid4().hex}:"
+
+
+async def until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(1.0):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def test_changed_keys_are_pushed(redis_manager, prefix):
+    pushes: asyncio.Queue[Optional[List[bytes]]] = asyncio.Queue()
+    tracking = asyncio.create_task(redis_manager.track([prefix], pushes.put))
+    try:
+        assert await asyncio.wait_for(pushes.get(), timeout=1.0) is None
+        redis = redis_manager.get_connection()
+        await redis.set(f"{prefix}1", "changed", ex=60)
+        await redis.set(f"other:{prefix}1", "changed", ex=60)
+        await redis.set(f"{prefix}2", "changed", ex=60)
+        changed = [
+            await asyncio.wait_for(pushes.get(), timeout=1.0) for _ in range(2)
+        ]
+        assert changed == [[f"{prefix}1".encode()], [f"{prefix}2".encode()]]
+    finally:
+        tracking.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tracking
+
+
+async def test_listener_drops_keys_changed_by_other_clients(
+    redis_manager, prefix
+):
+    store = LocalCacheStore[str](max_size=100, lifetime=60)
+    listener = RedisTrackingListenerImpl(redis_manager, store, [prefix])
+    listener.startup()
+    try:
+        # the tracking starts with the invalidation of all keys
+        await until(lambda: store.version > 0)
+        store.set(f"{prefix}1", "cached")
+        store.set(f"{prefix}2", "cached")
+        await redis_manager.get_connection().set(f"{prefix}1", "new", ex=60)
+        await until(lambda: store.get(f"{prefix}1") is None)
+        assert store.get(f"{prefix}2") == "cached"
+    finally:
+        await listener.shutdown()
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from users_management.gateways.connections.impls.redis_tracking import (
+    RedisTrackingListenerImpl,
+)
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+Push = Optional[List[bytes]]
+# drops the connection instead of pushing
+LOST: Push = [b"lost"]
+
+
+class FakeRedisManager:
+    """Pushes the given invalidations, then stays connected."""
+
+    def __init__(self, pushes: Sequence[Push]) -> None:
+        self._pushes = list(pushes)
+        self.pushed = asyncio.Event()
+        self.prefixes: List[Sequence[str]] = []
+
+    async def track(
+        self,
+        prefixes: Sequence[str],
+        on_invalidate: Callable[[Push], Awaitable[None]],
+    ) -> None:
+        self.prefixes.append(prefixes)
+        while self._pushes:
+            push = self._pushes.pop(0)
+            if push is LOST:
+                raise ConnectionError("Connection closed by server.")
+            await on_invalidate(push)
+        self.pushed.set()
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def store():
+    store = LocalCacheStore[str](max_size=100, lifetime=60)
+    store.set("user:1", "first")
+    store.set("user:2", "second")
+    return store
+
+
+async def listen(
+    store: LocalCacheStore[str], *pushes: Push
+) -> FakeRedisManager:
+    manager = FakeRedisManager(pushes)
+    listener = RedisTrackingListenerImpl(manager, store, ["user:"])
+    listener.RETRY_DELAY = 0.0
+    listener.startup()
+    try:
+        await asyncio.wait_for(manager.pushed.wait(), timeout=1.0)
+    finally:
+        await listener.shutdown()
+    return manager
+
+
+async def test_pushed_keys_are_dropped(store):
+    manager = await listen(store, [b"user:1"])
+    assert manager.prefixes == [["user:"]]
+    assert store.get("user:1") is None
+    assert store.get("user:2") == "second"
+
+
+async def test_push_of_all_keys_clears_store(store):
+    await listen(store, None)
+    assert store.size() == 0
+
+
+async def test_push_of_own_write_keeps_entry(store):
+    store.expect_change("user:1")
+    store.set("user:1", "written")
+    await listen(store, [b"user:1"])
+    assert store.get("user:1") == "written"
+
+
+async def test_lost_connection_clears_store_and_tracks_again(store):
+    manager = await listen(store, LOST)
+    assert store.size() == 0
+    assert manager.prefixes == [["user:"], ["user:"]]
@@ -0,0 +1,410 @@
+from datetime import datetime, timedelta
+import random
+import time
+from uuid import uuid4
+
+import pytest
+
+from users_management.app.schemas.requests import (
+    CreateUserRequest,
+    UpdateUserRequest,
+)
+from users_management.app.schemas.users import SInfoUser
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.ttl_policy import CacheTTLPolicy
+from users_management.gateways.cache_layouts.impls.hash import (
+    HashCacheLayoutImpl,
+)
+from users_management.gateways.cache_layouts.impls.string import (
+    StringCacheLayoutImpl,
+)
+from users_management.gateways.codecs.impls.json import JSONUsersCodecImpl
+from users_management.gateways.key_builders import (
+    get_bucketed_key_by_user_id,
+    get_fields_key_by_user_id,
+    get_key_by_user_id,
+    get_lease_key,
+)
+from users_management.gateways.repositories import UserConflict
+from users_management.gateways.repositories.impls.users import (
+    UsersRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.users_cache import (
+    UsersCacheRepositoryImpl,
+)
+from users_management.gateways.repositories.impls.users_fields_cache import (
+    UsersFieldsCacheRepositoryImpl,
+)
+
+
+UPDATED_AT = datetime(2025, 1, 1, 12, 0)
+
+
+def user(nickname: str, updated_at: datetime = UPDATED_AT) -> SInfoUser:
+    return SInfoUser(
+        user_id=1, nickname=nickname, avatar=False, updated_at=updated_at
+    )
+
+
+@pytest.fixture
+def key():
+    return get_fields_key_by_user_id(1, uuid4().hex)
+
+
+@pytest.fixture
+def fields_cache(redis_manager, settings):
+    return UsersFieldsCacheRepositoryImpl(
+        redis=redis_manager.get_connection(),
+        config=settings.redis,
+        codec=JSONUsersCodecImpl(),
+        layout=StringCacheLayoutImpl(),
+        ttl_policy=CacheTTLPolicy(lifetime=60, soft_lifetime=60),
+    )
+
+
+async def nickname(
+    fields_cache: UsersFieldsCacheRepositoryImpl, key: str
+) -> str:
+    entry = await fields_cache.get_entry(key)
+    assert entry and entry.value
+    return entry.value.nickname
+
+
+async def test_older_patch_keeps_newer_field(fields_cache, key):
+    await fields_cache.add(key, user("new"))
+    older = user("old", UPDATED_AT - timedelta(microseconds=1))
+    await fields_cache.update_fields(key, older, ["nickname"])
+    assert await nickname(fields_cache, key) == "new"
+
+
+async def test_older_full_write_keeps_newer_field(fields_cache, key):
+    await fields_cache.add(key, user("new"))
+    await fields_cache.add(key, user("old", UPDATED_AT - timedelta(1)))
+    assert await nickname(fields_cache, key) == "new"
+
+
+async def test_newer_patch_overwrites_field(fields_cache, key):
+    await fields_cache.add(key, user("old"))
+    newer = user("new", UPDATED_AT + timedelta(microseconds=1))
+    await fields_cache.update_fields(key, newer, ["nickname"])
+    assert await nickname(fields_cache, key) == "new"
+
+
+async def test_patch_of_missing_entry_is_not_written(fields_cache, key):
+    await fields_cache.update_fields(key, user("new"), ["nickname"])
+    assert await fields_cache.get_entry(key) is None
+
+
+async def test_patch_of_negative_entry_is_not_written(fields_cache, key):
+    await fields_cache.add_negative(key)
+    await fields_cache.update_fields(key, user("new"), ["nickname"])
+    entry = await fields_cache.get_entry(key)
+    assert entry and entry.is_negative
+
+
+async def test_full_write_replaces_negative_entry(fields_cache, key):
+    await fields_cache.add_negative(key)
+    await fields_cache.add(key, user("new"))
+    entry = await fields_cache.get_entry(key)
+    assert entry and not entry.is_negative
+    assert await nickname(fields_cache, key) == "new"
+
+
+def users_cache(
+    redis_manager, config: RedisConfig, soft_lifetime: int = 60
+) -> UsersCacheRepositoryImpl:
+    return UsersCacheRepositoryImpl(
+        redis=redis_manager.get_connection(),
+        config=config,
+        codec=JSONUsersCodecImpl(),
+        layout=StringCacheLayoutImpl(),
+        ttl_policy=CacheTTLPolicy(lifetime=60, soft_lifetime=soft_lifetime),
+    )
+
+
+@pytest.fixture
+def user_key():
+    return get_key_by_user_id(1, uuid4().hex)
+
+
+@pytest.fixture
+def string_cache(redis_manager, settings):
+    return users_cache(redis_manager, settings.redis)
+
+
+@pytest.fixture
+def lease_caches(redis_manager, settings):
+    """Caches of two instances filling the same key."""
+    config = settings.redis.model_copy(update={"LEASE_ENABLED": True})
+    return [users_cache(redis_manager, config) for _ in range(2)]
+
+
+async def test_lease_is_granted_once(lease_caches, user_key):
+    first, second = lease_caches
+    assert await first.acquire_lease(user_key)
+    assert not await second.acquire_lease(user_key)
+    await first.release_lease(user_key)
+    assert await second.acquire_lease(user_key)
+    await second.release_lease(user_key)
+
+
+async def test_release_keeps_lease_granted_to_other(
+    lease_caches, user_key, redis_manager
+):
+    first, second = lease_caches
+    redis = redis_manager.get_connection()
+    assert await first.acquire_lease(user_key)
+    # the lease of the first instance expires while it loads the user
+    await redis.delete(get_lease_key(user_key))
+    assert await second.acquire_lease(user_key)
+    await first.release_lease(user_key)
+    assert await redis.exists(get_lease_key(user_key))
+    await second.release_lease(user_key)
+    assert not await redis.exists(get_lease_key(user_key))
+
+
+async def test_release_without_lease_is_skipped(lease_caches, user_key):
+    first, second = lease_caches
+    assert await first.acquire_lease(user_key)
+    await second.release_lease(user_key)
+    assert first.holds_lease(user_key)
+    assert not await second.acquire_lease(user_key)
+    await first.release_lease(user_key)
+
+
+async def test_waiter_gets_entry_filled_by_lease_holder(lease_caches, user_key):
+    first, second = lease_caches
+    assert await first.acquire_lease(user_key)
+    await first.add(user_key, user("filled"))
+    await first.release_lease(user_key)
+    entry = await second.wait_for(user_key)
+    assert entry and entry.value
+    assert entry.value.nickname == "filled"
+
+
+async def test_fresh_entry_is_not_refreshed(string_cache, user_key):
+    await string_cache.add(user_key, user("cached"))
+    entry = await string_cache.get_entry(user_key)
+    assert entry and not entry.is_stale and not entry.needs_refresh
+
+
+async def test_entry_past_soft_expiry_is_served_stale(
+    redis_manager, settings, user_key
+):
+    cache = users_cache(redis_manager, settings.redis, soft_lifetime=0)
+    await cache.add(user_key, user("cached"))
+    entry = await cache.get_entry(user_key)
+    assert entry and entry.value
+    assert entry.is_stale and entry.needs_refresh
+    assert entry.value.nickname == "cached"
+
+
+@pytest.mark.parametrize(
+    ("delta", "needs_refresh"),
+    [
+        # refreshed 6.9 s early, the soft expiry is 60 s away
+        (10.0, False),
+        # refreshed 69 s early
+        (100.0, True),
+    ],
+)
+async def test_entry_of_slow_load_is_refreshed_early(
+    string_cache, user_key, monkeypatch, delta, needs_refresh
+):
+    # -ln(1 - 0.5) = ln 2
+    monkeypatch.setattr(random, "random", lambda: 0.5)
+    await string_cache.add(user_key, user("cached"), delta=delta)
+    entry = await string_cache.get_entry(user_key)
+    assert entry and not entry.is_stale
+    assert entry.needs_refresh is needs_refresh
+
+
+async def test_negative_entry_is_decoded(string_cache, user_key):
+    await string_cache.add_negative(user_key)
+    entry = await string_cache.get_entry(user_key)
+    assert entry and entry.is_negative and entry.value is None
+    entry_json = await string_cache.get_json(user_key)
+    assert entry_json and entry_json.is_negative
+    # a list lookup treats the negative entries as misses
+    assert await string_cache.get_list([user_key]) == [None]
+
+
+async def test_negative_entry_without_expiry_is_decoded(
+    string_cache, user_key, redis_manager
+):
+    await redis_manager.get_connection().set(user_key, b"N", ex=60)
+    entry = await string_cache.get_entry(user_key)
+    assert entry and entry.is_negative
+
+
+async def test_negative_entry_is_replaced_by_user(string_cache, user_key):
+    await string_cache.add_negative(user_key)
+    await string_cache.add(user_key, user("created"))
+    entry = await string_cache.get_entry(user_key)
+    assert entry and entry.value
+    assert entry.value.nickname == "created"
+
+
+async def test_negative_entries_can_be_disabled(
+    redis_manager, settings, user_key
+):
+    config = settings.redis.model_copy(update={"NEGATIVE_CACHE_LIFETIME": 0})
+    cache = users_cache(redis_manager, config)
+    await cache.add_negative(user_key)
+    assert await cache.get_entry(user_key) is None
+
+
+async def test_expired_negative_entry_of_bucket_is_missing(
+    redis_manager, settings, monkeypatch
+):
+    cache = UsersCacheRepositoryImpl(
+        redis=redis_manager.get_connection(),
+        config=settings.redis,
+        codec=JSONUsersCodecImpl(),
+        layout=HashCacheLayoutImpl(lifetime=3600),
+        ttl_policy=CacheTTLPolicy(lifetime=60, soft_lifetime=60),
+    )
+    key = get_bucketed_key_by_user_id(1, uuid4().hex, 100)
+    await cache.add_negative(key)
+    entry = await cache.get_entry(key)
+    assert entry and entry.is_negative
+    # the bucket outlives the negative entries it holds
+    expired_at = time.time() + settings.redis.NEGATIVE_CACHE_LIFETIME
+    monkeypatch.setattr(time, "time", lambda: expired_at)
+    assert await cache.get_entry(key) is None
+
+
+@pytest.fixture
+def sliding_cache(redis_manager, settings):
+    config = settings.redis.model_copy(
+        update={"SLIDING_TTL_ENABLED": True, "CACHE_MAX_LIFETIME": 600}
+    )
+    return users_cache(redis_manager, config)
+
+
+async def test_read_prolongs_entry(sliding_cache, user_key, redis_manager):
+    redis = redis_manager.get_connection()
+    await sliding_cache.add(user_key, user("cached"))
+    remaining = 5
+    await redis.expire(user_key, remaining)
+    assert await sliding_cache.get_entry(user_key)
+    assert await redis.ttl(user_key) > remaining
+
+
+async def test_entry_is_served_until_max_lifetime(
+    sliding_cache, user_key, monkeypatch
+):
+    written_at = time.time()
+    await sliding_cache.add(user_key, user("cached"))
+    monkeypatch.setattr(time, "time", lambda: written_at + 590)
+    entry = await sliding_cache.get_entry(user_key)
+    assert entry and entry.is_stale
+    monkeypatch.setattr(time, "time", lambda: written_at + 601)
+    assert await sliding_cache.get_entry(user_key) is None
+
+
+async def test_max_lifetime_is_lifetime_without_sliding(
+    string_cache, user_key, monkeypatch
+):
+    written_at = time.time()
+    await string_cache.add(user_key, user("cached"))
+    monkeypatch.setattr(time, "time", lambda: written_at + 61)
+    assert await string_cache.get_entry(user_key) is None
+
+
+def request(user_id: int, nickname: str) -> CreateUserRequest:
+    return CreateUserRequest(user_id=user_id, nickname=nickname)
+
+
+@pytest.fixture
+async def users_repository(sql_session_factory):
+    async with sql_session_factory() as session:
+        repository = UsersRepositoryImpl(session)
+        await repository.create_users(
+            [request(1, "first"), request(2, "second")]
+        )
+        yield repository
+
+
+async def test_taken_ids_and_nicknames_are_found(users_repository):
+    taken = await users_repository.find_taken([1, 3], ["second", "third"])
+    assert taken == ({1}, {"second"})
+
+
+# VALUES and COPY paths
+@pytest.mark.parametrize("copy_threshold", [1000, 1])
+async def test_bulk_create_skips_taken_users(users_repository, copy_threshold):
+    users_repository.COPY_THRESHOLD = copy_threshold
+    created = await users_repository.create_users(
+        [request(3, "third"), request(1, "taken id"), request(4, "second")]
+    )
+    assert [(user.user_id, user.nickname) for user in created] == [(3, "third")]
+    assert created[0].updated_at
+    user = await users_repository.get_user(user_id=3)
+    assert user and user.nickname == "third"
+    assert await users_repository.get_user(user_id=4) is None
+
+
+async def test_user_is_created(users_repository):
+    user = await users_repository.create_user(request(3, "third"))
+    assert isinstance(user, SInfoUser)
+    assert (user.user_id, user.nickname, user.avatar) == (3, "third", False)
+    assert await users_repository.get_user(user_id=3) == user
+
+
+@pytest.mark.parametrize(
+    ("data", "conflict"),
+    [
+        (request(1, "third"), UserConflict.USER_ID),
+        (request(3, "second"), UserConflict.NICKNAME),
+        (request(1, "second"), UserConflict.NICKNAME),
+    ],
+)
+async def test_user_conflict_is_reported(users_repository, data, conflict):
+    assert await users_repository.create_user(data) is conflict
+    assert await users_repository.get_user(user_id=3) is None
+
+
+async def test_bulk_update_returns_updated_users(users_repository):
+    before = await users_repository.get_user(user_id=1)
+    updated = await users_repository.update_users(
+        [
+            UpdateUserRequest(user_id=1, avatar=True),
+            UpdateUserRequest(user_id=3, avatar=True),
+        ]
+    )
+    assert [(user.user_id, user.avatar) for user in updated] == [(1, True)]
+    user = await users_repository.get_user(user_id=1)
+    assert user and user.avatar
+    assert before and user.updated_at and before.updated_at
+    assert user.updated_at > before.updated_at
+    second = await users_repository.get_user(user_id=2)
+    assert second and not second.avatar
+
+
+async def test_bulk_delete_returns_deleted_users(users_repository):
+    deleted = await users_repository.delete_users([2, 3])
+    assert [(user.user_id, user.nickname) for user in deleted] == [
+        (2, "second")
+    ]
+    assert await users_repository.get_user(user_id=2) is None
+    assert await users_repository.get_user(user_id=1)
+
+
+# a chunk per ID
+@pytest.mark.parametrize("chunk_size", [5000, 1])
+async def test_users_list_keeps_order_and_duplicates(
+    users_repository, chunk_size
+):
+    users_repository.CHUNK_SIZE = chunk_size
+    users = await users_repository.get_users_list([2, 1, 2])
+    assert users
+    assert [user.user_id for user in users] == [2, 1, 2]
+
+
+@pytest.mark.parametrize("chunk_size", [5000, 1])
+async def test_users_list_with_missing_user_is_not_found(
+    users_repository, chunk_size
+):
+    users_repository.CHUNK_SIZE = chunk_size
+    assert await users_repository.get_users_list([1, 3, 1]) is None
@@ -0,0 +1,100 @@
+import pytest
+
+from users_management.gateways.repositories.impls.users_local_cache import (
+    LocalCacheStore,
+)
+
+
+@pytest.fixture
+def store():
+    return LocalCacheStore[str](max_size=2, lifetime=60)
+
+
+def test_read_is_stored(store):
+    version = store.version
+    store.set("user:1", "read", version)
+    assert store.get("user:1") == "read"
+
+
+def test_read_started_before_change_is_not_stored(store):
+    version = store.version
+    store.pop("user:1")
+    store.set("user:1", "stale", version)
+    assert store.get("user:1") is None
+
+
+def test_read_started_before_own_write_is_not_stored(store):
+    version = store.version
+    store.set("user:1", "written")
+    store.set("user:1", "stale", version)
+    assert store.get("user:1") == "written"
+
+
+def test_change_of_other_key_keeps_read(store):
+    version = store.version
+    store.pop("user:2")
+    store.set("user:1", "read", version)
+    assert store.get("user:1") == "read"
+
+
+def test_forgotten_changes_drop_older_reads(store):
+    version = store.version
+    for key in ("user:2", "user:3", "user:4"):
+        store.pop(key)
+    store.set("user:1", "stale", version)
+    assert store.get("user:1") is None
+    store.set("user:1", "read", store.version)
+    assert store.get("user:1") == "read"
+
+
+def test_clear_drops_reads_in_flight(store):
+    version = store.version
+    store.clear()
+    store.set("user:1", "stale", version)
+    assert store.get("user:1") is None
+
+
+def test_least_recently_used_entry_is_evicted(store):
+    store.set("user:1", "first")
+    store.set("user:2", "second")
+    store.get("user:1")
+    store.set("user:3", "third")
+    assert store.get("user:2") is None
+    assert store.get("user:1") == "first"
+
+
+def test_expired_entry_is_not_returned():
+    store = LocalCacheStore[str](max_size=2, lifetime=0)
+    store.set("user:1", "expired")
+    assert store.get("user:1") is None
+
+
+def test_own_write_is_ignored_within_window(store):
+    store.expect_change("user:1")
+    store.set("user:1", "written")
+    store.invalidate("user:1")
+    assert store.get("user:1") == "written"
+
+
+def test_own_write_is_reported_once(store):
+    store.expect_change("user:1")
+    store.set("user:1", "written")
+    store.invalidate("user:1")
+    store.invalidate("user:1")
+    assert store.get("user:1") is None
+
+
+def test_own_write_is_not_ignored_after_window(store):
+    store.OWN_CHANGE_WINDOW = 0.0
+    store.expect_change("user:1")
+    store.set("user:1", "written")
+    store.invalidate("user:1")
+    assert store.get("user:1") is None
+
+
+def test_failed_own_write_is_not_ignored(store):
+    store.expect_change("user:1")
+    store.set("user:1", "written")
+    store.forget_change("user:1")
+    store.invalidate("user:1")
+    assert store.get("user:1") is None
@@ -0,0 +1,199 @@
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from users_management.app.exceptions import UserNotFoundException
+from users_management.app.schemas.requests import CreateUserRequest
+from users_management.app.schemas.users import SInfoUser
+from users_management.app.services.impls.users import (
+    UsersCacheDependencies,
+    UsersServiceImpl,
+)
+from users_management.core.utils.hot_keys import HotKeysCounter
+from users_management.core.utils.single_flight import SingleFlight
+from users_management.gateways.key_builders import UsersCacheKeys
+
+
+def user(user_id: int) -> SInfoUser:
+    return SInfoUser(user_id=user_id, nickname=f"user{user_id}", avatar=False)
+
+
+class FakeUsersRepository:
+    def __init__(self, users: Dict[int, SInfoUser]) -> None:
+        self.users = users
+        self.requested: List[List[int]] = []
+        # taken by concurrent requests after the check
+        self.raced: Set[str] = set()
+
+    async def get_users_list(
+        self, users_id: List[int]
+    ) -> Optional[List[SInfoUser]]:
+        self.requested.append(users_id)
+        if not all(user_id in self.users for user_id in users_id):
+            return None
+        return [self.users[user_id] for user_id in users_id]
+
+    async def find_taken(
+        self, users_id: List[int], nicknames: List[str]
+    ) -> Tuple[Set[int], Set[str]]:
+        taken_nicknames = {user.nickname for user in self.users.values()}
+        return (
+            set(users_id) & set(self.users),
+            set(nicknames) & taken_nicknames,
+        )
+
+    async def create_users(
+        self, data: List[CreateUserRequest]
+    ) -> List[SInfoUser]:
+        created = [
+            SInfoUser(
+                user_id=user.user_id, nickname=user.nickname, avatar=False
+            )
+            for user in data
+            if user.nickname not in self.raced
+        ]
+        self.users.update({user.user_id: user for user in created})
+        return created
+
+
+class FakeRepositoryManager:
+    def __init__(self, users: Dict[int, SInfoUser]) -> None:
+        self.users_repository = FakeUsersRepository(users)
+
+    async def __aenter__(self) -> "FakeRepositoryManager":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+class FakeUsersCache:
+    def __init__(self, users: Dict[str, SInfoUser]) -> None:
+        self.users = users
+
+    async def get_list(self, keys: List[str]) -> List[Optional[SInfoUser]]:
+        return [self.users.get(key) for key in keys]
+
+    async def get_list_json(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [
+            self.users[key].model_dump_json().encode()
+            if key in self.users
+            else None
+            for key in keys
+        ]
+
+    async def add_list(self, data_map: Dict[str, SInfoUser]) -> None:
+        self.users.update(data_map)
+
+    async def delete_list(self, keys: List[str]) -> None:
+        for key in keys:
+            self.users.pop(key, None)
+
+
+class FakeNicknamesFilter:
+    def __init__(self) -> None:
+        self.items: List[str] = []
+
+    async def add_list(self, items: List[str]) -> None:
+        self.items.extend(items)
+
+
+def key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+@pytest.fixture
+def cache():
+    return FakeUsersCache({key(user_id): user(user_id) for user_id in (2, 4)})
+
+
+@pytest.fixture
+def repository_manager():
+    return FakeRepositoryManager(
+        {user_id: user(user_id) for user_id in (1, 2, 3, 4)}
+    )
+
+
+@pytest.fixture
+def nicknames_filter():
+    return FakeNicknamesFilter()
+
+
+@pytest.fixture
+def service(repository_manager, cache, nicknames_filter):
+    return UsersServiceImpl(
+        repository_manager,
+        UsersCacheDependencies(
+            users_cache=cache,
+            keys=UsersCacheKeys(
+                by_user_id=key,
+                by_nickname=lambda nickname: f"nickname:{nickname}",
+                by_free_nickname=lambda nickname: f"free:{nickname}",
+            ),
+            single_flight=SingleFlight("users"),
+            nicknames_filter=nicknames_filter,
+            hot_users=HotKeysCounter(100),
+        ),
+    )
+
+
+USERS_ID = [4, 1, 2, 3, 1]
+
+
+async def test_partial_hit_keeps_requested_order(service):
+    users = await service.get_users_list(USERS_ID)
+    assert [user.user_id for user in users] == USERS_ID
+
+
+async def test_partial_hit_json_keeps_requested_order(service):
+    users = json.loads(await service.get_users_list_json(USERS_ID))
+    assert [user["user_id"] for user in users] == USERS_ID
+
+
+async def test_only_missing_users_are_loaded_once(
+    service, repository_manager, cache
+):
+    await service.get_users_list(USERS_ID)
+    assert repository_manager.users_repository.requested == [[1, 3]]
+    assert set(cache.users) == {key(user_id) for user_id in (1, 2, 3, 4)}
+
+
+async def test_full_hit_does_not_load_users(service, repository_manager):
+    users = await service.get_users_list([2, 4, 2])
+    assert [user.user_id for user in users] == [2, 4, 2]
+    assert repository_manager.users_repository.requested == []
+
+
+async def test_missing_user_is_not_found(service):
+    with pytest.raises(UserNotFoundException):
+        await service.get_users_list([2, 5])
+
+
+def request(user_id: int, nickname: str) -> CreateUserRequest:
+    return CreateUserRequest(user_id=user_id, nickname=nickname)
+
+
+async def test_bulk_create_statuses(
+    service, repository_manager, nicknames_filter
+):
+    repository_manager.users_repository.raced = {"raced"}
+    results = await service.create_users(
+        [
+            request(5, "new"),
+            request(5, "same id"),
+            request(6, "new"),
+            request(1, "taken id"),
+            request(7, "user2"),
+            request(8, "raced"),
+        ]
+    )
+    assert [result.status for result in results] == [
+        "created",
+        "duplicate",
+        "duplicate",
+        "user_exists",
+        "nickname_exists",
+        "conflict",
+    ]
+    assert nicknames_filter.items == ["new"]
@@ -0,0 +1,203 @@
+import asyncio
+
+import pytest
+
+from users_management.core.utils.circuit_breaker import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+POLICY = BreakerPolicy(failure_threshold=3, reset_timeout=10.0, max_deferred=2)
+
+
+class DependencyError(Exception):
+    pass
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Calls:
+    """Operations recording their calls."""
+
+    def __init__(self) -> None:
+        self.done: list[str] = []
+
+    def ok(self, name: str = "ok"):
+        async def operation() -> str:
+            self.done.append(name)
+            return name
+
+        return operation
+
+    def failing(self, error: BaseException = DependencyError()):
+        async def operation() -> str:
+            raise error
+
+        return operation
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def calls():
+    return Calls()
+
+
+def breaker(clock: Clock, on_overflow=None) -> CircuitBreaker:
+    return CircuitBreaker(
+        name="test_circuit",
+        errors=(DependencyError,),
+        policy=POLICY,
+        on_overflow=on_overflow,
+        clock=clock,
+    )
+
+
+async def open_circuit(circuit: CircuitBreaker, calls: Calls) -> None:
+    for _ in range(POLICY.failure_threshold):
+        await circuit.call(calls.failing(), "fallback")
+
+
+async def test_failures_below_threshold_keep_circuit_closed(clock, calls):
+    circuit = breaker(clock)
+    for _ in range(POLICY.failure_threshold - 1):
+        assert await circuit.call(calls.failing(), "fallback") == "fallback"
+    assert circuit.state is CircuitState.CLOSED
+
+
+async def test_success_resets_failures(clock, calls):
+    circuit = breaker(clock)
+    for _ in range(POLICY.failure_threshold - 1):
+        await circuit.call(calls.failing(), "fallback")
+    await circuit.call(calls.ok(), "fallback")
+    await circuit.call(calls.failing(), "fallback")
+    assert circuit.state is CircuitState.CLOSED
+
+
+async def test_threshold_opens_circuit_and_calls_are_skipped(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    assert circuit.state is CircuitState.OPEN
+    assert await circuit.call(calls.ok(), "fallback") == "fallback"
+    assert calls.done == []
+
+
+async def test_half_open_lets_single_probe_through(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    clock.now = POLICY.reset_timeout
+    assert circuit.state is CircuitState.HALF_OPEN
+    assert circuit.allow()
+    assert not circuit.allow()
+
+
+async def test_probe_success_closes_circuit(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    clock.now = POLICY.reset_timeout
+    assert await circuit.call(calls.ok(), "fallback") == "ok"
+    assert circuit.state is CircuitState.CLOSED
+
+
+async def test_probe_failure_reopens_circuit(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    clock.now = POLICY.reset_timeout
+    await circuit.call(calls.failing(), "fallback")
+    assert circuit.state is CircuitState.OPEN
+    clock.now += POLICY.reset_timeout
+    assert circuit.state is CircuitState.HALF_OPEN
+
+
+async def test_cancelled_probe_lets_next_probe_through(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    clock.now = POLICY.reset_timeout
+    with pytest.raises(asyncio.CancelledError):
+        await circuit.call(calls.failing(asyncio.CancelledError()), None)
+    assert circuit.state is CircuitState.HALF_OPEN
+    assert await circuit.call(calls.ok(), "fallback") == "ok"
+
+
+async def test_unexpected_probe_error_reopens_circuit(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    clock.now = POLICY.reset_timeout
+    with pytest.raises(ValueError):
+        await circuit.call(calls.failing(ValueError()), None)
+    assert circuit.state is CircuitState.OPEN
+
+
+async def test_call_started_before_opening_does_not_close_circuit(clock, calls):
+    circuit = breaker(clock)
+    release = asyncio.Event()
+
+    async def slow() -> str:
+        await release.wait()
+        return "slow"
+
+    slow_call = asyncio.create_task(circuit.call(slow, "fallback"))
+    await asyncio.sleep(0)
+    await open_circuit(circuit, calls)
+    release.set()
+    assert await slow_call == "slow"
+    assert circuit.state is CircuitState.OPEN
+
+
+async def test_skipped_invalidations_are_replayed_on_close(clock, calls):
+    circuit = breaker(clock)
+    await open_circuit(circuit, calls)
+    await circuit.call(calls.ok(), None, invalidation=calls.ok("first"))
+    await circuit.call(calls.ok(), None, invalidation=calls.ok("second"))
+    assert calls.done == []
+    clock.now = POLICY.reset_timeout
+    await circuit.call(calls.ok("probe"), None)
+    assert calls.done == ["probe", "first", "second"]
+
+
+async def test_failed_call_defers_its_invalidation(clock, calls):
+    circuit = breaker(clock)
+    await circuit.call(calls.failing(), None, invalidation=calls.ok("drop"))
+    await open_circuit(circuit, calls)
+    clock.now = POLICY.reset_timeout
+    await circuit.call(calls.ok("probe"), None)
+    assert calls.done == ["probe", "drop"]
+
+
+async def test_overflow_calls_on_overflow_instead_of_replay(clock, calls):
+    circuit = breaker(clock, on_overflow=calls.ok("overflow"))
+    await open_circuit(circuit, calls)
+    for name in ("first", "second", "third"):
+        await circuit.call(calls.ok(), None, invalidation=calls.ok(name))
+    clock.now = POLICY.reset_timeout
+    await circuit.call(calls.ok("probe"), None)
+    assert calls.done == ["probe", "overflow"]
+
+
+async def test_failed_replay_keeps_deferred_operations(clock, calls):
+    circuit = breaker(clock)
+    replays = iter([calls.failing(), calls.ok("drop")])
+
+    async def invalidation() -> str:
+        return await next(replays)()
+
+    await open_circuit(circuit, calls)
+    await circuit.call(calls.ok(), None, invalidation=invalidation)
+    clock.now = POLICY.reset_timeout
+    await circuit.call(calls.ok("probe"), None)
+    assert calls.done == ["probe"]
+    await open_circuit(circuit, calls)
+    clock.now += POLICY.reset_timeout
+    await circuit.call(calls.ok("probe"), None)
+    assert calls.done == ["probe", "probe", "drop"]
@@ -0,0 +1,77 @@
+from collections import Counter
+
+import pytest
+
+from users_management.core.settings import RedisConfig
+from users_management.core.utils.hash_ring import HashRing
+from users_management.gateways.connections.impls.redis import (
+    RedisConnectionManagerImpl,
+)
+
+
+NODES = ["10.0.0.1:6379", "10.0.0.2:6379", "10.0.0.3:6379"]
+KEYS = [f"user:v1:{user_id}:info" for user_id in range(10_000)]
+
+
+def owners(ring: HashRing, nodes: list[str]) -> dict[str, str]:
+    return {key: nodes[ring.get_node(key)] for key in KEYS}
+
+
+def test_keys_are_mapped_the_same_by_every_ring():
+    assert owners(HashRing(NODES), NODES) == owners(HashRing(NODES), NODES)
+
+
+def test_str_and_bytes_keys_are_mapped_the_same():
+    ring = HashRing(NODES)
+    assert all(
+        ring.get_node(key) == ring.get_node(key.encode()) for key in KEYS
+    )
+
+
+def test_keys_sharing_hash_tag_live_on_one_node():
+    ring = HashRing(NODES)
+    nodes = {ring.get_node(f"{{nicknames:bloom}}:{i}") for i in range(100)}
+    assert nodes == {ring.get_node("nicknames:bloom")}
+
+
+def test_keys_are_spread_between_nodes():
+    shares = Counter(owners(HashRing(NODES), NODES).values())
+    assert set(shares) == set(NODES)
+    assert all(
+        count > len(KEYS) / len(NODES) * 0.8 for count in shares.values()
+    )
+
+
+def test_added_node_takes_keys_from_others_only():
+    nodes = [*NODES, "10.0.0.4:6379"]
+    before = owners(HashRing(NODES), NODES)
+    after = owners(HashRing(nodes), nodes)
+    moved = [key for key in KEYS if before[key] != after[key]]
+    assert {after[key] for key in moved} == {"10.0.0.4:6379"}
+    assert len(moved) == pytest.approx(len(KEYS) / len(nodes), rel=0.2)
+
+
+def test_removed_node_gives_away_its_keys_only():
+    nodes = NODES[:-1]
+    before = owners(HashRing(NODES), NODES)
+    after = owners(HashRing(nodes), nodes)
+    moved = {key for key in KEYS if before[key] != after[key]}
+    assert moved == {key for key in KEYS if before[key] == NODES[-1]}
+
+
+async def test_shards_are_identified_by_endpoint():
+    shards = []
+    for password, db in (("old", 0), ("new", 1)):
+        manager = RedisConnectionManagerImpl(
+            RedisConfig(
+                SHARD_URLS=[
+                    f"redis://:{password}@10.0.0.1:6379/{db}",
+                    f"redis://:{password}@10.0.0.2:6379/{db}",
+                ]
+            )
+        )
+        manager.startup()
+        redis = manager.get_connection()
+        shards.append([redis.get_shard(key) for key in KEYS])
+        await manager.shutdown()
+    assert shards[0] == shards[1]
@@ -0,0 +1,16 @@
+from users_management.gateways.key_builders import (
+    get_bucketed_key_by_user_id,
+    get_key_by_nickname,
+    split_bucketed_key,
+)
+
+
+def test_bucketed_key_is_split_into_bucket_and_field():
+    key = get_bucketed_key_by_user_id(1234, "v1", 100)
+    assert split_bucketed_key(key) == ("users:v1:12:bucket", "1234")
+
+
+def test_nickname_keys_are_not_split():
+    for nickname in ("a#b", "users:1:bucket#2", "#"):
+        key = get_key_by_nickname(nickname, "v1")
+        assert split_bucketed_key(key) == (key, None)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from users_management.core.utils.single_flight import SingleFlight
+
+
+class Call:
+    """Shared call finishing when released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await self.release.wait()
+        return self.calls
+
+
+@pytest.fixture
+def flight():
+    return SingleFlight[int]("test_flight")
+
+
+async def test_concurrent_calls_are_coalesced(flight):
+    call = Call()
+    waiters = [asyncio.create_task(flight.do("user:1", call)) for _ in range(3)]
+    await asyncio.sleep(0)
+    call.release.set()
+    assert await asyncio.gather(*waiters) == [1, 1, 1]
+    assert call.calls == 1
+
+
+async def test_calls_with_other_keys_are_not_coalesced(flight):
+    call = Call()
+    call.release.set()
+    results = await asyncio.gather(
+        flight.do("user:1", call), flight.do("user:2", call)
+    )
+    assert sorted(results) == [1, 2]
+
+
+async def test_finished_call_is_not_shared(flight):
+    call = Call()
+    call.release.set()
+    assert [await flight.do("user:1", call) for _ in range(2)] == [1, 2]
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call(flight):
+    call = Call()
+    first = asyncio.create_task(flight.do("user:1", call))
+    second = asyncio.create_task(flight.do("user:1", call))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    call.release.set()
+    assert await second == 1
+    assert call.calls == 1
+
+
+async def test_failure_is_shared_and_forgotten(flight):
+    async def failing() -> int:
+        await asyncio.sleep(0)
+        raise ValueError("user:1")
+
+    waiters = [flight.do("user:1", failing) for _ in range(2)]
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    call = Call()
+    call.release.set()
+    assert await flight.do("user:1", call) == 1
@@ -0,0 +1,67 @@
+import pytest
+
+from users_management.core.utils.ttl_policy import (
+    AccessCounter,
+    AdaptiveTTL,
+    CacheTTLPolicy,
+)
+
+
+def test_reads_are_counted():
+    counter = AccessCounter(width=1024)
+    for _ in range(3):
+        counter.add("user:1")
+    assert [counter.estimate("user:1"), counter.estimate("user:2")] == [3, 0]
+
+
+def test_counters_are_halved_every_aging_period():
+    counter = AccessCounter(width=16)
+    # the counters are halved on the 128th read
+    for _ in range(129):
+        counter.add("user:1")
+    assert counter.estimate("user:1") == 64 + 1
+
+
+def test_halving_does_not_move_counts_between_counters():
+    counter = AccessCounter(width=16)
+    counter.add("user:1")
+    for _ in range(127):
+        counter.add("user:2")
+    assert counter.estimate("user:2") == 127 // 2
+
+
+def test_lifetimes_are_spread_within_jitter():
+    policy = CacheTTLPolicy(lifetime=100, soft_lifetime=50, jitter=0.1)
+    lifetimes = [policy.lifetimes("user:1") for _ in range(1000)]
+    hard = [lifetime for lifetime, _ in lifetimes]
+    soft = [soft_lifetime for _, soft_lifetime in lifetimes]
+    assert policy.lifetime * 0.9 <= min(hard) < max(hard)
+    assert max(hard) <= policy.lifetime * 1.1 <= policy.max_lifetime
+    assert policy.soft_lifetime * 0.9 <= min(soft) < max(soft)
+    assert max(soft) <= policy.soft_lifetime * 1.1
+
+
+def test_soft_lifetime_does_not_exceed_lifetime():
+    policy = CacheTTLPolicy(lifetime=10, soft_lifetime=60, jitter=0.5)
+    assert all(
+        soft_lifetime <= lifetime
+        for lifetime, soft_lifetime in (
+            policy.lifetimes("user:1") for _ in range(1000)
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("reads", "lifetime"),
+    [(0, 50), (16, 100), (1000, 200)],
+)
+def test_lifetime_is_scaled_by_reads(reads, lifetime):
+    policy = CacheTTLPolicy(
+        lifetime=100,
+        soft_lifetime=30,
+        adaptive=AdaptiveTTL(min_factor=0.5, max_factor=2, hot_reads=16),
+    )
+    for _ in range(reads):
+        policy.record_access("user:1")
+    assert policy.lifetimes("user:1") == (lifetime, 30)
+    assert policy.sliding_lifetime("user:1") == lifetime